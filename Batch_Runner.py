@@ -0,0 +1,252 @@
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+from Same_Family_Shock_Solver import (Intersection_of_Shock_Waves_Same_Family,
+                                      Intersection_of_Shock_Waves_Same_Family_Batch, BATCH_RESULT_FIELDS,
+                                      CASE_NO_SOLUTION)
+
+# Accepted input column names for the three solver parameters
+INPUT_ALIASES = {
+    "Mach_inlet": ("Mach_inlet", "Inlet Mach", "Mach", "M1"),
+    "Theta": ("Theta", "First Ramp Angle", "Theta1"),
+    "Theta_plus": ("Theta_plus", "Ramp Increase Angle", "Theta2")
+}
+
+OUTPUT_FIELDS = ("Case Index", "Case") + BATCH_RESULT_FIELDS
+
+# Positions of the output fields in the tuple returned by Intersection_of_Shock_Waves_Same_Family
+SCALAR_TUPLE_FIELDS = {
+    "Inlet Mach": 0, "First Ramp Angle": 1, "Ramp Increase Angle": 2,
+    "Beta1": 3, "Mach 2": 4, "T2/T1": 5, "P2/P1": 6, "rho2/rho1": 7, "Pt2/Pt1": 8,
+    "Beta2": 9, "Mach 3": 10, "T3/T1": 11, "P3/P1": 12, "rho3/rho1": 13, "Pt3/Pt1": 14,
+    "Beta3": 15, "Mach 4": 16, "T4/T1": 17, "P4/P1": 18, "rho4/rho1": 19, "Pt4/Pt1": 20,
+    "Beta4": 21, "Mach 5": 22, "T5/T1": 23, "P5/P1": 24, "rho5/rho1": 25, "Pt5/Pt1": 26,
+    "Case": 27, "Theta": 28, "Slip Line Angle": 29, "Iteration Count": 30
+}
+
+
+# === Input ===
+def read_cases(path):
+    """Read (Mach_inlet, Theta, Theta_plus) arrays from a CSV file with a header or a JSONL file"""
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        with open(path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+    else:
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    if not rows:
+        raise ValueError(f"No cases found in '{path}'.")
+
+    columns = []
+    for name, aliases in INPUT_ALIASES.items():
+        key = next((alias for alias in aliases if alias in rows[0]), None)
+        if key is None:
+            raise ValueError(f"Column for {name} not found in '{path}' (accepted names: {', '.join(aliases)}).")
+        columns.append(np.array([float(row[key]) for row in rows]))
+    return tuple(columns)
+
+
+def _input_signature(path):
+    stat = os.stat(path)
+    return {'input': os.path.abspath(path), 'input_size': stat.st_size, 'input_mtime': stat.st_mtime}
+
+
+# === Solving ===
+def solve_chunk(start, Mach_inlet, Theta, Theta_plus, solver='batch', ITER_NUM=1000):
+    """Solve one chunk and return its rows as a dict of arrays (OUTPUT_FIELDS)"""
+    n = len(Mach_inlet)
+    if solver == 'batch':
+        results = Intersection_of_Shock_Waves_Same_Family_Batch(Mach_inlet, Theta, Theta_plus)
+        rows = {field: np.asarray(results[field]) for field in BATCH_RESULT_FIELDS}
+        rows["Case"] = np.asarray(results["Case"])
+    else:
+        rows = {field: np.full(n, np.nan) for field in BATCH_RESULT_FIELDS}
+        rows["Case"] = np.full(n, CASE_NO_SOLUTION)
+        rows["Inlet Mach"], rows["First Ramp Angle"], rows["Ramp Increase Angle"] = \
+            np.array(Mach_inlet, dtype=float), np.array(Theta, dtype=float), np.array(Theta_plus, dtype=float)
+        for i in range(n):
+            try:
+                result = Intersection_of_Shock_Waves_Same_Family(Mach_inlet[i], Theta[i], Theta_plus[i],
+                                                                 ITER_NUM=ITER_NUM, save_results=False,
+                                                                 verbose=False)
+            except (ValueError, UnboundLocalError):
+                continue
+            for field, position in SCALAR_TUPLE_FIELDS.items():
+                rows[field][i] = result[position]
+    rows["Case Index"] = np.arange(start, start + n)
+    return rows
+
+
+# === Output ===
+def format_rows(rows, output_format):
+    """
+    Text of solved rows (CSV without header, or JSONL). Floats are written with 12 significant digits;
+    missing values are "nan" in CSV and null in JSONL.
+    """
+    columns = [np.asarray(rows[field]) for field in OUTPUT_FIELDS]
+    table = np.column_stack([c.astype(float) for c in columns]).tolist()
+    integer = {"Case Index", "Case"}
+    if output_format == 'jsonl':
+        template = "{" + ", ".join(f'"{field}": ' + ("%d" if field in integer else "%.12g")
+                                   for field in OUTPUT_FIELDS) + "}"
+        text = "\n".join(template % tuple(row) for row in table)
+        text = text.replace(": nan", ": null").replace(": inf", ": null").replace(": -inf", ": null")
+    else:
+        template = ",".join("%d" if field in integer else "%.12g" for field in OUTPUT_FIELDS)
+        text = "\n".join(template % tuple(row) for row in table)
+    return text + "\n" if table else ""
+
+
+def _solve_and_format(start, Mach_inlet, Theta, Theta_plus, solver, ITER_NUM, output_format):
+    """Worker: solve a chunk and format it, so the main process only writes text"""
+    return len(Mach_inlet), format_rows(solve_chunk(start, Mach_inlet, Theta, Theta_plus, solver, ITER_NUM),
+                                        output_format)
+
+
+class Checkpoint:
+    """
+    Progress file of a batch run: completed chunk starts and the output size after the last
+    completed chunk. The output is truncated to that size on resume, so rows of a chunk that was
+    being written during an interruption are not duplicated.
+    """
+
+    def __init__(self, path, settings):
+        self.path = path
+        self.settings = settings
+        self.done = set()
+        self.output_bytes = 0
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state['settings'] != settings:
+                raise ValueError(f"Checkpoint '{path}' belongs to a different run (input or options changed); "
+                                 "delete it to start over.")
+            self.done = set(state['done'])
+            self.output_bytes = state['output_bytes']
+
+    def save(self, output_bytes):
+        """Record the progress atomically"""
+        self.output_bytes = output_bytes
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({'settings': self.settings, 'done': sorted(self.done), 'output_bytes': output_bytes}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+
+
+def _report_progress(done_cases, total_cases, resumed_cases, start_time):
+    elapsed = time.perf_counter() - start_time
+    rate = (done_cases - resumed_cases) / elapsed if elapsed > 0 else 0.0
+    eta = (total_cases - done_cases) / rate if rate > 0 else float('inf')
+    eta_text = time.strftime("%H:%M:%S", time.gmtime(eta)) if math.isfinite(eta) else "--:--:--"
+    print(f"🔄 {done_cases}/{total_cases} cases ({100 * done_cases / total_cases:.1f}%), "
+          f"{rate:.0f} cases/s, ETA {eta_text}", file=sys.stderr, flush=True)
+
+
+def run_batch(input_path, output_path, workers=1, chunk_size=10000, solver='batch', ITER_NUM=1000,
+              checkpoint_path=None):
+    """
+    Solve every case of input_path and append the rows to output_path (CSV or JSONL by extension).
+    Progress is checkpointed after each chunk; running the same command again resumes the run.
+    """
+    Mach_inlet, Theta, Theta_plus = read_cases(input_path)
+    total = len(Mach_inlet)
+    output_format = 'jsonl' if output_path.lower().endswith((".jsonl", ".ndjson")) else 'csv'
+    checkpoint_path = checkpoint_path or output_path + ".checkpoint.json"
+    settings = dict(_input_signature(input_path), output=os.path.abspath(output_path), chunk_size=chunk_size,
+                    solver=solver, ITER_NUM=ITER_NUM)
+    checkpoint = Checkpoint(checkpoint_path, settings)
+
+    starts = [start for start in range(0, total, chunk_size) if start not in checkpoint.done]
+    resumed = sum(min(chunk_size, total - start) for start in checkpoint.done)
+    if checkpoint.done:
+        print(f"🔄 Resuming: {len(checkpoint.done)} chunks ({resumed} cases) already done.", file=sys.stderr)
+
+    # Drop rows written after the last checkpoint
+    with open(output_path, "a", encoding="utf-8", newline=""):
+        pass
+    if os.path.getsize(output_path) < checkpoint.output_bytes:
+        raise ValueError(f"Output '{output_path}' is shorter than its checkpoint records "
+                         f"({os.path.getsize(output_path)} < {checkpoint.output_bytes} bytes); it was replaced or "
+                         f"truncated. Restore it or delete '{checkpoint_path}' to start over.")
+    with open(output_path, "r+", encoding="utf-8", newline="") as f:
+        f.truncate(checkpoint.output_bytes)
+
+    start_time = time.perf_counter()
+    done_cases = resumed
+    with open(output_path, "a", encoding="utf-8", newline="") as f:
+        if checkpoint.output_bytes == 0 and output_format == 'csv':
+            csv.writer(f).writerow(OUTPUT_FIELDS)
+
+        def commit(start, result):
+            nonlocal done_cases
+            n, text = result
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+            checkpoint.done.add(start)
+            checkpoint.save(f.tell())
+            done_cases += n
+            _report_progress(done_cases, total, resumed, start_time)
+
+        def chunk(start):
+            stop = min(start + chunk_size, total)
+            return (start, Mach_inlet[start:stop], Theta[start:stop], Theta_plus[start:stop], solver, ITER_NUM,
+                    output_format)
+
+        if workers <= 1:
+            for start in starts:
+                commit(start, _solve_and_format(*chunk(start)))
+        else:
+            # Keep a bounded number of chunks in flight so memory does not grow with the case count
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = iter(starts)
+                running = {}
+                for start in pending:
+                    running[executor.submit(_solve_and_format, *chunk(start))] = start
+                    if len(running) >= 2 * workers:
+                        break
+                while running:
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        commit(running.pop(future), future.result())
+                        start = next(pending, None)
+                        if start is not None:
+                            running[executor.submit(_solve_and_format, *chunk(start))] = start
+
+    elapsed = time.perf_counter() - start_time
+    print(f"✅ {total} cases written to '{output_path}' ({done_cases - resumed} solved in {elapsed:.1f} s).",
+          file=sys.stderr)
+    return done_cases
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch runner for the same-family shock intersection solver.")
+    parser.add_argument("input", help="case list (.csv with a header or .jsonl) with Mach_inlet, Theta, Theta_plus")
+    parser.add_argument("output", help="result file (.csv or .jsonl), appended incrementally")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("-c", "--chunk-size", type=int, default=10000, help="cases per chunk/checkpoint")
+    parser.add_argument("--solver", choices=("batch", "scalar"), default="batch",
+                        help="vectorized batch solver or the original fixed-step solver")
+    parser.add_argument("--iter-num", type=int, default=1000, help="ITER_NUM of the scalar solver")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file (default: <output>.checkpoint.json)")
+    args = parser.parse_args(argv)
+    try:
+        run_batch(args.input, args.output, workers=args.workers, chunk_size=args.chunk_size, solver=args.solver,
+                  ITER_NUM=args.iter_num, checkpoint_path=args.checkpoint)
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+# Usage: python Batch_Runner.py cases.csv results.csv --workers 4
+if __name__ == "__main__":
+    sys.exit(main())
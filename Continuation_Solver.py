@@ -0,0 +1,116 @@
+import numpy as np
+from Oblique_Shock_Solver import ObliqueShockAnalyzer
+from Expansion_Wave_Solver import PrandtlMeyerExpansion
+from Same_Family_Shock_Solver import (Intersection_of_Shock_Waves_Same_Family_Batch, BATCH_RESULT_FIELDS,
+                                      CASE_NO_SOLUTION)
+
+
+def continuation_sweep(Mach_inlet, Theta, Theta_plus, max_theta_step=0.05, switch_resolution=1e-4,
+                       tolerance=1e-10, verbose=False):
+    """
+    Warm-started continuation along an ordered parameter path.
+
+    The path is given by broadcasting Mach_inlet, Theta and Theta_plus to a common length; points
+    between neighbours are linear interpolations (path parameter s in [0, n-1]). Each solve is seeded
+    with a prediction extrapolated from the previous solutions. When the wave type changes (expansion
+    <-> reflected shock, or solution <-> no solution) or the slip-line offset jumps by more than
+    max_theta_step degrees, the step is halved until it is shorter than switch_resolution.
+
+    Returns a dict of arrays (BATCH_RESULT_FIELDS, "Case" and "Path Parameter") for every accepted
+    point, the detected regime switches and the number of solver evaluations.
+    """
+    path = np.column_stack(np.broadcast_arrays(np.atleast_1d(np.asarray(Mach_inlet, dtype=float)),
+                                               np.atleast_1d(np.asarray(Theta, dtype=float)),
+                                               np.atleast_1d(np.asarray(Theta_plus, dtype=float))))
+    analyzer_obs = ObliqueShockAnalyzer()
+    analyzer_pm = PrandtlMeyerExpansion()
+    evaluations = 0
+
+    def point_at(s):
+        i = min(int(np.floor(s)), len(path) - 2) if len(path) > 1 else 0
+        frac = s - i
+        return path[i] if frac == 0 else (1 - frac) * path[i] + frac * path[i + 1]
+
+    def solve(s, guess):
+        nonlocal evaluations
+        evaluations += 1
+        M, T1, T2 = point_at(s)
+        result = Intersection_of_Shock_Waves_Same_Family_Batch(M, T1, T2, tolerance=tolerance,
+                                                               analyzer_obs=analyzer_obs,
+                                                               analyzer_pm=analyzer_pm, Theta_guess=guess)
+        return {key: value.item() for key, value in result.items()}
+
+    def predict(s):
+        # Linear extrapolation from the last two accepted points of the same wave type
+        if not accepted or accepted[-1]["Case"] == CASE_NO_SOLUTION:
+            return None
+        last = accepted[-1]
+        if len(accepted) > 1 and accepted[-2]["Case"] == last["Case"] and \
+                accepted[-2]["Path Parameter"] != last["Path Parameter"]:
+            prev = accepted[-2]
+            slope = (last["Theta"] - prev["Theta"]) / (last["Path Parameter"] - prev["Path Parameter"])
+            return last["Theta"] + slope * (s - last["Path Parameter"])
+        return last["Theta"]
+
+    accepted = []
+    switches = []
+
+    first = solve(0.0, None)
+    first["Path Parameter"] = 0.0
+    accepted.append(first)
+
+    for target in range(1, len(path)):
+        pending = [float(target)]
+        while pending:
+            s = pending[-1]
+            last = accepted[-1]
+            current = solve(s, predict(s))
+            current["Path Parameter"] = s
+            step = s - last["Path Parameter"]
+
+            switched = current["Case"] != last["Case"]
+            jumped = abs(current["Theta"] - last["Theta"]) > max_theta_step
+            if (switched or jumped) and step > switch_resolution:
+                pending.append(last["Path Parameter"] + step / 2)
+                continue
+
+            if switched:
+                switch = {
+                    "Path Parameter": last["Path Parameter"] + step / 2,
+                    "From Case": last["Case"],
+                    "To Case": current["Case"]
+                }
+                M, T1, T2 = point_at(switch["Path Parameter"])
+                switch.update({"Inlet Mach": float(M), "First Ramp Angle": float(T1),
+                               "Ramp Increase Angle": float(T2)})
+                switches.append(switch)
+                if verbose:
+                    print(f"🔄 Regime switch {last['Case']} -> {current['Case']} at M={M:.4f}, "
+                          f"Theta1={T1:.4f}, Theta2={T2:.4f}")
+
+            accepted.append(current)
+            pending.pop()
+
+    keys = ("Case", "Path Parameter") + BATCH_RESULT_FIELDS
+    results = {key: np.array([point[key] for point in accepted]) for key in keys}
+    results["Case"] = results["Case"].astype(int)
+    return {
+        'results': results,
+        'switches': switches,
+        'evaluations': evaluations
+    }
+
+
+# Usage example
+if __name__ == "__main__":
+    # Sweep the inlet Mach number at fixed ramp angles
+    Mach_values = np.linspace(1.5, 5.0, 36)
+    sweep = continuation_sweep(Mach_values, 10.0, 8.0, verbose=True)
+
+    res = sweep['results']
+    print(f"Path points: {len(Mach_values)}, accepted points: {len(res['Case'])}, "
+          f"solver evaluations: {sweep['evaluations']}")
+    for switch in sweep['switches']:
+        print(f"Switch {switch['From Case']} -> {switch['To Case']} at Mach = {switch['Inlet Mach']:.4f}")
+    for mach, case, slip in zip(res['Inlet Mach'][::5], res['Case'][::5], res['Theta'][::5]):
+        print(f"Mach = {mach:.3f}, Case = {case}, Theta = {slip:.5f}°")
@@ -0,0 +1,137 @@
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from Same_Family_Shock_Solver import Intersection_of_Shock_Waves_Same_Family_Batch, CASE_NO_SOLUTION
+from Graphics import PressureThetaPlotter
+
+REPORT_INDEX_FIELDS = ("Case Index", "Inlet Mach", "First Ramp Angle", "Ramp Increase Angle", "Case",
+                       "Theta5", "P4/P1", "Full View", "Zoomed View", "Page")
+
+
+def _case_records(Mach_inlet, Theta, Theta_plus):
+    """
+    Solve the sweep once with the batch solver and return one record per case, sorted by
+    (Mach, Theta1) so that consecutive cases share region 1 and region 2 polars
+    """
+    Mach_inlet, Theta, Theta_plus = (a.ravel() for a in np.broadcast_arrays(np.asarray(Mach_inlet, dtype=float),
+                                                                           np.asarray(Theta, dtype=float),
+                                                                           np.asarray(Theta_plus, dtype=float)))
+    results = Intersection_of_Shock_Waves_Same_Family_Batch(Mach_inlet, Theta, Theta_plus)
+    records = []
+    for i in np.lexsort((Theta_plus, Theta, Mach_inlet)):
+        record = {"Case Index": int(i), "Inlet Mach": Mach_inlet[i], "First Ramp Angle": Theta[i],
+                  "Ramp Increase Angle": Theta_plus[i], "Case": int(results["Case"][i])}
+        if record["Case"] != CASE_NO_SOLUTION:
+            # Arguments of PressureThetaPlotter.compute (same convention as plot_pressure_theta_analysis)
+            record["inputs"] = (Mach_inlet[i], float(results["Mach 2"][i]), float(results["Mach 3"][i]), Theta[i],
+                                Theta[i] + Theta_plus[i], float(results["P2/P1"][i]),
+                                float(results["P3/P1"][i] / results["P2/P1"][i]), record["Case"])
+        records.append(record)
+    return records
+
+
+def _title(record):
+    wave = "Expansion Wave" if record["Case"] == 1 else "Shock Wave"
+    return (f"Case {record['Case Index']}: M = {record['Inlet Mach']:.3f}, "
+            f"Theta1 = {record['First Ramp Angle']:.2f}°, Theta2 = {record['Ramp Increase Angle']:.2f}° ({wave})")
+
+
+def _render_png_chunk(records, output_dir, figsize, dpi):
+    """Worker: render the cases of one chunk to per-case PNG files with one reusable figure"""
+    plotter = PressureThetaPlotter(figsize=figsize, dpi=dpi)
+    entries = []
+    for record in records:
+        entry = {field: record.get(field) for field in REPORT_INDEX_FIELDS}
+        if "inputs" in record:
+            curves, point = plotter.compute(*record["inputs"])
+            plotter.update(curves, point, record["inputs"][:3], title=_title(record))
+            entry["Full View"] = os.path.join(output_dir, f"case_{record['Case Index']:06d}.png")
+            entry["Zoomed View"] = os.path.join(output_dir, f"case_{record['Case Index']:06d}_zoomed.png")
+            plotter.render(entry["Full View"], entry["Zoomed View"])
+            entry["Theta5"], entry["P4/P1"] = point
+        entries.append(entry)
+    plotter.close()
+    return entries
+
+
+def _compute_chunk(records):
+    """Worker: polar curves and intersections of one chunk (drawn into the PDF by the main process)"""
+    plotter = PressureThetaPlotter()
+    computed = [plotter.compute(*record["inputs"]) if "inputs" in record else None for record in records]
+    plotter.close()
+    return computed
+
+
+def _write_index(path, entries):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_INDEX_FIELDS)
+        writer.writeheader()
+        for entry in sorted(entries, key=lambda e: e["Case Index"]):
+            writer.writerow({key: "" if value is None else value for key, value in entry.items()})
+
+
+def generate_pt_report(Mach_inlet, Theta, Theta_plus, output_dir="pt_report", pdf_path=None, workers=1,
+                       chunk_size=25, figsize=(10, 6), dpi=100, verbose=True):
+    """
+    Pressure–deflection diagrams for every case of a sweep.
+
+    Without pdf_path, each solvable case is rendered to <output_dir>/case_<index>.png and
+    case_<index>_zoomed.png by a pool of worker processes, and <output_dir>/index.csv lists the
+    files. With pdf_path, the workers compute the polars and intersections and the main process
+    writes one page per case (full and zoomed view) to a single PDF, indexed in <pdf>_index.csv.
+    Cases are sorted by (Mach, Theta1) and split into contiguous chunks, so polars shared between
+    cases are computed once per worker.
+    """
+    start_time = time.perf_counter()
+    records = _case_records(Mach_inlet, Theta, Theta_plus)
+    chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+
+    def run(func, *args):
+        if workers <= 1:
+            return [func(chunk, *args) for chunk in chunks]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, chunks, *([arg] * len(chunks) for arg in args)))
+
+    if pdf_path is None:
+        os.makedirs(output_dir, exist_ok=True)
+        entries = [entry for chunk_entries in run(_render_png_chunk, output_dir, figsize, dpi)
+                   for entry in chunk_entries]
+        index_path = os.path.join(output_dir, "index.csv")
+    else:
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        computed = [item for chunk_items in run(_compute_chunk) for item in chunk_items]
+        plotter = PressureThetaPlotter(figsize=figsize, dpi=dpi)
+        entries = []
+        page = 0
+        with PdfPages(pdf_path) as pdf:
+            for record, item in zip(records, computed):
+                entry = {field: record.get(field) for field in REPORT_INDEX_FIELDS}
+                if item is not None:
+                    curves, point = item
+                    plotter.update(curves, point, record["inputs"][:3], title=_title(record))
+                    pdf.savefig(plotter.figure)
+                    page += 1
+                    entry["Page"] = page
+                    entry["Theta5"], entry["P4/P1"] = point
+                entries.append(entry)
+        plotter.close()
+        index_path = os.path.splitext(pdf_path)[0] + "_index.csv"
+
+    _write_index(index_path, entries)
+    if verbose:
+        drawn = sum(1 for record in records if "inputs" in record)
+        print(f"✅ {drawn} diagrams ({len(records) - drawn} cases without solution) in "
+              f"{time.perf_counter() - start_time:.1f} s, index saved to '{index_path}'.")
+    return entries
+
+
+# Usage example
+if __name__ == "__main__":
+    # 3 inlet Mach numbers x 4 first ramps x 5 ramp increases, rendered by 4 processes
+    M_grid, T1_grid, T2_grid = np.meshgrid([2.5, 3.0, 3.5], [5.0, 8.0, 11.0, 14.0], np.linspace(2.0, 12.0, 5),
+                                           indexing='ij')
+    generate_pt_report(M_grid, T1_grid, T2_grid, output_dir="pt_report", workers=4)
+    generate_pt_report(M_grid, T1_grid, T2_grid, pdf_path="pt_report.pdf", workers=4)
@@ -0,0 +1,202 @@
+import time
+from collections import OrderedDict
+import numpy as np
+from Oblique_Shock_Solver import ObliqueShockAnalyzer
+from Expansion_Wave_Solver import PrandtlMeyerExpansion
+from Same_Family_Shock_Solver import (_prepare_same_family, _solve_prepared_same_family, BATCH_RESULT_FIELDS,
+                                      CASE_NO_SOLUTION)
+
+# Stored fields of a region 2/3 state (complete_analysis_array outputs besides the inputs)
+REGION_STATE_FIELDS = ("beta_angle", "output_mach", "pressure_ratio", "temperature_ratio", "density_ratio",
+                       "total_pressure_ratio")
+
+# Stored fields of a pressure-match state (the complete batch result)
+MATCH_STATE_FIELDS = BATCH_RESULT_FIELDS + ("Case",)
+
+# Nodes of the graph and the inputs each one depends on
+NODE_INPUTS = {
+    "region2": ("gamma", "Mach_inlet", "Theta"),
+    "region3": ("gamma", "Mach_inlet", "Theta", "Theta_plus"),
+    "match": ("gamma", "Mach_inlet", "Theta", "Theta_plus")
+}
+
+
+class StateCache:
+    """LRU cache of one graph node: input key tuple -> row of state values"""
+
+    def __init__(self, fields, max_entries):
+        self.fields = fields
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.computed = 0
+
+    def lookup(self, keys):
+        """
+        Rows of the unique keys (an (n, k) array); returns (table, missing mask).
+        Missing rows are NaN until filled with store().
+        """
+        table = np.full((len(keys), len(self.fields)), np.nan)
+        missing = np.ones(len(keys), dtype=bool)
+        for i, key in enumerate(map(tuple, keys.tolist())):
+            row = self.entries.get(key)
+            if row is not None:
+                self.entries.move_to_end(key)
+                table[i] = row
+                missing[i] = False
+        found = int(np.count_nonzero(~missing))
+        self.hits += found
+        self.misses += len(keys) - found
+        return table, missing
+
+    def store(self, keys, table):
+        for key, row in zip(map(tuple, keys.tolist()), table):
+            self.entries[key] = row
+        self.computed += len(keys)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+class SameFamilyEvaluationGraph:
+    """
+    Incremental same-family evaluation with one cache per region state.
+
+    Region 2 depends only on (gamma, Mach, Theta1), region 3 adds Theta_plus and the pressure
+    match (regions 4/5) is solved from the region 2/3 states. Each node is cached on exactly
+    the inputs it depends on (NODE_INPUTS) and is only evaluated for the cases its downstream
+    node is missing, so sweeping Theta_plus at fixed inlet conditions re-uses the first shock
+    and only the changed cases are solved; gamma is a batch dimension and part of every key, so
+    states of another gamma are never re-used. Repeated inputs in one call are solved once.
+    Results are the same dict as Intersection_of_Shock_Waves_Same_Family_Batch.
+    """
+
+    def __init__(self, max_entries=200000, tolerance=1e-10, max_iterations=100):
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.nodes = {
+            "region2": StateCache(REGION_STATE_FIELDS, max_entries),
+            "region3": StateCache(REGION_STATE_FIELDS, max_entries),
+            "match": StateCache(MATCH_STATE_FIELDS, max_entries)
+        }
+        self.analyzer_obs = ObliqueShockAnalyzer()
+        self.analyzer_pm = PrandtlMeyerExpansion()
+
+    def invalidate(self, node=None):
+        """Drop the cached states of one node and every node that depends on it (all nodes by default)"""
+        order = list(NODE_INPUTS)
+        for name in order[order.index(node):] if node is not None else order:
+            self.nodes[name].clear()
+
+    def stats(self):
+        """Hits, misses and computed states per node"""
+        return {name: {'hits': cache.hits, 'misses': cache.misses, 'computed': cache.computed,
+                       'entries': len(cache.entries)} for name, cache in self.nodes.items()}
+
+    # === Nodes ===
+    def _node(self, name, inputs, compute):
+        """
+        Values of a node for the flattened cases: unique keys are looked up, the missing ones are
+        computed with compute(cases) -> table, where cases holds one case index per missing key,
+        and rows are expanded back to the cases.
+        """
+        keys = np.column_stack([inputs[column] for column in NODE_INPUTS[name]])
+        unique, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        cache = self.nodes[name]
+        table, missing = cache.lookup(unique)
+        if missing.any():
+            table[missing] = compute(first[missing])
+            cache.store(unique[missing], table[missing])
+        return table[inverse.ravel()]
+
+    @staticmethod
+    def _state(table, Mach, theta):
+        state = {field: table[:, f] for f, field in enumerate(REGION_STATE_FIELDS)}
+        state.update({'input_mach': Mach, 'theta_angle': theta})
+        return state
+
+    def evaluate(self, Mach_inlet, Theta, Theta_plus, gamma=1.4):
+        """Same-family results for arrays of (Mach_inlet, Theta, Theta_plus, gamma), broadcast together"""
+        analyzer_obs, analyzer_pm = self.analyzer_obs, self.analyzer_pm
+        Mach_inlet, Theta, Theta_plus, gamma = np.broadcast_arrays(np.asarray(Mach_inlet, dtype=float),
+                                                                   np.asarray(Theta, dtype=float),
+                                                                   np.asarray(Theta_plus, dtype=float),
+                                                                   np.asarray(gamma, dtype=float))
+        shape = Mach_inlet.shape
+        inputs = {"gamma": gamma.ravel(), "Mach_inlet": Mach_inlet.ravel(), "Theta": Theta.ravel(),
+                  "Theta_plus": Theta_plus.ravel()}
+
+        def region_table(results):
+            return np.column_stack([results[field] for field in REGION_STATE_FIELDS])
+
+        def subset(columns, cases):
+            return {column: values[cases] for column, values in columns.items()}
+
+        # === Region 2: first shock ===
+        def region2(columns):
+            def compute(cases):
+                return region_table(analyzer_obs.complete_analysis_array(columns["Mach_inlet"][cases],
+                                                                         columns["Theta"][cases],
+                                                                         columns["gamma"][cases]))
+            return self._node("region2", columns, compute)
+
+        # === Region 3: second shock (from the region 2 Mach number) ===
+        def region3(columns):
+            def compute(cases):
+                M_2 = region2(subset(columns, cases))[:, REGION_STATE_FIELDS.index("output_mach")]
+                states = analyzer_obs.complete_analysis_array(np.where(np.isnan(M_2), 2.0, M_2),
+                                                              columns["Theta_plus"][cases], columns["gamma"][cases])
+                return np.where(np.isnan(M_2)[:, None], np.nan, region_table(states))
+            return self._node("region3", columns, compute)
+
+        # === Pressure match: regions 4/5 ===
+        def match(columns):
+            def compute(cases):
+                required = subset(columns, cases)
+                M1, T1, T2 = required["Mach_inlet"], required["Theta"], required["Theta_plus"]
+                region2_table = region2(required)
+                M_2 = region2_table[:, REGION_STATE_FIELDS.index("output_mach")]
+                state = _prepare_same_family(M1, T1, T2, analyzer_obs, analyzer_pm,
+                                             region2=self._state(region2_table, M1, T1),
+                                             region3=self._state(region3(required), M_2, T2),
+                                             gamma=required["gamma"])
+                results = _solve_prepared_same_family(state, self.tolerance, self.max_iterations, analyzer_obs,
+                                                      analyzer_pm)
+                return np.column_stack([np.asarray(results[field], dtype=float) for field in MATCH_STATE_FIELDS])
+            return self._node("match", columns, compute)
+
+        # Upstream nodes are only evaluated for the cases whose match is not cached
+        match_table = match(inputs)
+
+        results = {field: match_table[:, f].reshape(shape) for f, field in enumerate(MATCH_STATE_FIELDS)}
+        results["Case"] = np.where(np.isnan(results["Case"]), CASE_NO_SOLUTION, results["Case"]).astype(int)
+        return results
+
+
+# Usage example
+if __name__ == "__main__":
+    graph = SameFamilyEvaluationGraph()
+    theta_plus_sweep = np.linspace(1.0, 20.0, 2000)
+
+    # Theta_plus sweep at fixed inlet conditions: the first shock is solved once
+    start = time.perf_counter()
+    sweep = graph.evaluate(3.0, 10.0, theta_plus_sweep)
+    print(f"Sweep of {theta_plus_sweep.size} cases: {time.perf_counter() - start:.3f} s, "
+          f"Pt4/Pt1 range {np.nanmin(sweep['Pt4/Pt1']):.4f}-{np.nanmax(sweep['Pt4/Pt1']):.4f}")
+
+    # Extending the sweep only solves the new cases
+    start = time.perf_counter()
+    graph.evaluate(3.0, 10.0, np.concatenate((theta_plus_sweep, np.linspace(20.01, 25.0, 500))))
+    print(f"Extended sweep: {time.perf_counter() - start:.3f} s")
+
+    # A gamma sweep in one call; states of another gamma are never re-used
+    gammas = np.array([1.3, 1.4, 1.67])
+    result = graph.evaluate(3.0, 10.0, 8.0, gamma=gammas)
+    for i, gamma in enumerate(gammas):
+        print(f"gamma = {gamma}: Mach 2 = {result['Mach 2'][i]:.5f}, P5/P1 = {result['P5/P1'][i]:.5f}")
+
+    for name, counters in graph.stats().items():
+        print(f"{name}: {counters['computed']} computed, {counters['hits']} hits, {counters['misses']} misses")
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.optimize import fsolve
 
 
 class PrandtlMeyerExpansion:
@@ -13,6 +12,10 @@ class PrandtlMeyerExpansion:
         """
         self.gamma = gamma
 
+    def _gamma(self, gamma):
+        """gamma of a call: the instance value, or an array broadcast with the other inputs"""
+        return self.gamma if gamma is None else np.asarray(gamma, dtype=float)
+
     def prandtl_meyer_angle(self, M):
         """
         Compute the Prandtl-Meyer expansion angle for a given Mach number
@@ -33,6 +36,8 @@ class PrandtlMeyerExpansion:
         """
         Compute downstream Mach number after expansion wave
         """
+        from scipy.optimize import fsolve
+
         nu1 = self.prandtl_meyer_angle(M1)
         nu_target = nu1 + theta_deg  # target expansion angle
 
@@ -90,6 +95,89 @@ class PrandtlMeyerExpansion:
             'nu2': self.prandtl_meyer_angle(M2)
         }
 
+    # === Vectorized (array) methods ===
+    # Every array method takes an optional gamma (scalar or array broadcast with the other inputs);
+    # without it the instance gamma is used.
+    def max_prandtl_meyer_angle(self, gamma=None):
+        """
+        Maximum Prandtl-Meyer angle (M -> infinity) in degrees
+        """
+        g = self._gamma(gamma)
+        return np.degrees(np.pi / 2 * (np.sqrt((g + 1) / (g - 1)) - 1))
+
+    def prandtl_meyer_angle_array(self, M, gamma=None):
+        """
+        Prandtl-Meyer angle for an array of Mach numbers (NaN where M < 1)
+        """
+        M = np.asarray(M, dtype=float)
+        g = self._gamma(gamma)
+        with np.errstate(invalid='ignore'):
+            m_term = np.sqrt(M ** 2 - 1)
+            nu_rad = np.sqrt((g + 1) / (g - 1)) * np.arctan(np.sqrt((g - 1) / (g + 1)) * m_term) - np.arctan(m_term)
+        return np.degrees(nu_rad)
+
+    def mach_from_prandtl_meyer_array(self, nu_deg, iterations=8, gamma=None):
+        """
+        Inverse Prandtl-Meyer function for an array of angles (Hall's initial guess + Newton steps).
+        Angles outside [0, nu_max) are returned as NaN.
+        """
+        nu_deg = np.asarray(nu_deg, dtype=float)
+        g = self._gamma(gamma)
+        nu_max = self.max_prandtl_meyer_angle(gamma)
+        valid = (nu_deg >= 0) & (nu_deg < nu_max)
+        nu_t = np.where(valid, nu_deg, 0.0)
+
+        # Hall (1975) rational approximation, used as the Newton starting point
+        y = (nu_t / nu_max) ** (2 / 3)
+        M = (1 + 1.3604 * y + 0.0962 * y ** 2 - 0.5127 * y ** 3) / (1 - 0.6722 * y - 0.3278 * y ** 2)
+        M = np.maximum(M, 1.0 + 1e-12)
+
+        nu_t_rad = np.radians(nu_t)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for _ in range(iterations):
+                residual = np.radians(self.prandtl_meyer_angle_array(M, gamma)) - nu_t_rad
+                dnu_dM = np.sqrt(M ** 2 - 1) / (M * (1 + (g - 1) / 2 * M ** 2))
+                step = np.where(dnu_dM > 0, residual / dnu_dM, 0.0)
+                M = np.maximum(M - step, 1.0 + 1e-12)
+
+        M = np.where(nu_t == 0, 1.0, M)
+        return np.where(valid, M, np.nan)
+
+    def mach_from_expansion_array(self, M1, theta_deg, gamma=None):
+        """
+        Vectorized downstream Mach number after an expansion wave
+        """
+        return self.mach_from_prandtl_meyer_array(self.prandtl_meyer_angle_array(M1, gamma) + theta_deg,
+                                                  gamma=gamma)
+
+    def expansion_relations_array(self, M1, M2, gamma=None):
+        """
+        Pressure, temperature and density ratios across an expansion from M1 to M2 (arrays)
+        """
+        g = self._gamma(gamma)
+        T_ratio = (1 + (g - 1) / 2 * M1 ** 2) / (1 + (g - 1) / 2 * M2 ** 2)
+        p_ratio = T_ratio ** (g / (g - 1))
+        return {
+            'pressure_ratio': p_ratio,
+            'temperature_ratio': T_ratio,
+            'density_ratio': p_ratio / T_ratio
+        }
+
+    def calculate_all_ratios_array(self, M1, theta_deg, gamma=None):
+        """
+        Vectorized counterpart of calculate_all_ratios; infeasible entries are NaN.
+        """
+        M1, theta_deg = np.broadcast_arrays(np.asarray(M1, dtype=float), np.asarray(theta_deg, dtype=float))
+        nu1 = self.prandtl_meyer_angle_array(M1, gamma)
+        nu2 = nu1 + theta_deg
+        M2 = self.mach_from_prandtl_meyer_array(nu2, gamma=gamma)
+
+        results = {'M2': M2}
+        results.update(self.expansion_relations_array(M1, M2, gamma))
+        results['nu1'] = nu1
+        results['nu2'] = np.where(np.isnan(M2), np.nan, nu2)
+        return results
+
 
 # Usage example:
 if __name__ == "__main__":
@@ -0,0 +1,182 @@
+import argparse
+import sys
+import time
+import numpy as np
+from Expansion_Wave_Solver import PrandtlMeyerExpansion
+from Same_Family_Shock_Solver import Intersection_of_Shock_Waves_Same_Family_Batch
+from Flow_Regions import REGION_FAN, region_states, result_gamma, wave_geometry, assign_regions
+
+# Sampled fields of a rasterized flow field (the region label and the flow state)
+FIELD_NAMES = ("Region", "Mach", "P/P1", "T/T1", "rho/rho1")
+
+# Array / VTK names of the fields ('/' is not allowed in either)
+FIELD_FILE_NAMES = {"Region": "region", "Mach": "mach", "P/P1": "p_p1", "T/T1": "t_t1", "rho/rho1": "rho_rho1"}
+
+
+def _fan_table(geometry, states, gamma, samples=2048):
+    """
+    Mach-line angle -> flow state of the centered expansion fan at the intersection point.
+
+    The fan turns the region 3 flow (direction Theta + Theta_plus) to the slip-line direction; along
+    each Mach line of the fan the flow direction is delta = Theta_t +/- (nu(M) - nu(M3)) and the line
+    runs at delta - mu(M). The state follows isentropically from region 3.
+    """
+    analyzer_pm = PrandtlMeyerExpansion(gamma)
+    theta_total = geometry['ramp_angles'][1]
+    M3, M4 = states[3]["Mach"], states[4]["Mach"]
+    M = np.linspace(M3, M4, samples)
+    turning = np.sign(geometry['slip_line'] - theta_total) * (analyzer_pm.prandtl_meyer_angle_array(M) -
+                                                              analyzer_pm.prandtl_meyer_angle_array(M3))
+    angle = theta_total + turning - np.degrees(np.arcsin(1 / M))
+    order = np.argsort(angle)
+
+    stagnation = (1 + (gamma - 1) / 2 * M3 ** 2) / (1 + (gamma - 1) / 2 * M ** 2)
+    table = {"Mach": M,
+             "P/P1": states[3]["P/P1"] * stagnation ** (gamma / (gamma - 1)),
+             "T/T1": states[3]["T/T1"] * stagnation,
+             "rho/rho1": states[3]["rho/rho1"] * stagnation ** (1 / (gamma - 1))}
+    return angle[order], {field: values[order] for field, values in table.items()}
+
+
+def default_extent(geometry, ramp_length=1.0):
+    """(x_range, y_range) framing the ramps and the waves downstream of the intersection point"""
+    x0, y0 = geometry['corner']
+    x_i, y_i = geometry['intersection']
+    x_end = max(x_i, geometry['second_corner'][0]) + ramp_length
+    return (x0 - 0.25 * ramp_length, x_end), (y0 - 0.1 * ramp_length, y_i + 0.5 * ramp_length)
+
+
+def rasterize_flow_field(result, x_range=None, y_range=None, resolution=(1000, 2000), ramp_length=1.0,
+                         corner=(0.0, 0.0), gamma=None, block_points=1000000, dtype=np.float32):
+    """
+    Sample the inviscid same-family solution (one batch result case) on a uniform (ny, nx) grid.
+
+    Points are labelled with the half-plane tests of Flow_Regions (REGION_SOLID below the wall,
+    1-5, REGION_FAN inside the expansion fan of Case 1) and the region 1-5 states are filled by
+    label lookup. Inside the fan, Mach and the ratios are interpolated from the Prandtl-Meyer
+    solution by the angle of the point about the intersection point. gamma is taken from the
+    result (result_gamma); a gamma given explicitly must match it, or ValueError is raised.
+    Solid points are NaN. The grid is processed block_points at a time, so temporaries stay
+    bounded for grids of many millions of points.
+
+    Returns a dict with the "x" and "y" axes, the "Region" labels (int8) and the Mach, P/P1, T/T1
+    and rho/rho1 arrays of shape (ny, nx).
+    """
+    geometry = wave_geometry(result, ramp_length=ramp_length, corner=corner)
+    solved_gamma = result_gamma(result)
+    if gamma is not None and not np.isclose(gamma, solved_gamma, rtol=1e-6):
+        raise ValueError(f"gamma = {gamma} does not match the gamma of the result ({solved_gamma:.6g}).")
+    states = region_states(result)
+    default_x, default_y = default_extent(geometry, ramp_length)
+    ny, nx = resolution
+    x = np.linspace(*(x_range or default_x), nx)
+    y = np.linspace(*(y_range or default_y), ny)
+
+    # Region label -> state lookup (NaN for solid and fan)
+    lookup = {field: np.full(REGION_FAN + 1, np.nan) for field in FIELD_NAMES[1:]}
+    for region, state in states.items():
+        for field in lookup:
+            lookup[field][region] = state[field]
+    fan = _fan_table(geometry, states, solved_gamma) if geometry['expansion'] else None
+    x_i, y_i = geometry['intersection']
+
+    field = {"x": x, "y": y, "Region": np.empty((ny, nx), dtype=np.int8)}
+    field.update({name: np.empty((ny, nx), dtype=dtype) for name in FIELD_NAMES[1:]})
+    rows = max(1, block_points // nx)
+    for start in range(0, ny, rows):
+        stop = min(start + rows, ny)
+        X, Y = np.meshgrid(x, y[start:stop])
+        region = assign_regions(X, Y, geometry)
+        field["Region"][start:stop] = region
+        for name, values in lookup.items():
+            field[name][start:stop] = values[region]
+
+        if fan is not None:
+            inside = region == REGION_FAN
+            if inside.any():
+                angle = np.degrees(np.arctan2(Y[inside] - y_i, X[inside] - x_i))
+                for name, values in fan[1].items():
+                    field[name][start:stop][inside] = np.interp(angle, fan[0], values)
+    return field
+
+
+# === Output ===
+def save_npz(field, filename="flow_field.npz"):
+    """Write the axes and fields to a compressed .npz file (FIELD_FILE_NAMES keys)"""
+    np.savez_compressed(filename, x=field["x"], y=field["y"],
+                        **{FIELD_FILE_NAMES[name]: field[name] for name in FIELD_NAMES})
+
+
+def save_npy(field, filename="flow_field.npy"):
+    """Write the fields stacked in FIELD_NAMES order, shape (5, ny, nx), to a .npy file"""
+    np.save(filename, np.stack([field[name].astype(np.float32) for name in FIELD_NAMES]))
+
+
+def save_vtk(field, filename="flow_field.vtk", binary=True):
+    """Write the fields as a legacy VTK STRUCTURED_POINTS file (ParaView/VisIt), binary or ASCII"""
+    x, y = field["x"], field["y"]
+    dx = x[1] - x[0] if len(x) > 1 else 1.0
+    dy = y[1] - y[0] if len(y) > 1 else 1.0
+    header = (f"# vtk DataFile Version 3.0\nSame-family shock intersection flow field\n"
+              f"{'BINARY' if binary else 'ASCII'}\nDATASET STRUCTURED_POINTS\n"
+              f"DIMENSIONS {len(x)} {len(y)} 1\nORIGIN {float(x[0])!r} {float(y[0])!r} 0\n"
+              f"SPACING {float(dx)!r} {float(dy)!r} 1\n"
+              f"POINT_DATA {len(x) * len(y)}\n")
+    with open(filename, "wb") as f:
+        f.write(header.encode("ascii"))
+        for name in FIELD_NAMES:
+            kind, dtype = ("int", ">i4") if name == "Region" else ("float", ">f4")
+            f.write(f"SCALARS {FIELD_FILE_NAMES[name]} {kind} 1\nLOOKUP_TABLE default\n".encode("ascii"))
+            # VTK legacy binary data is big-endian; x varies fastest, as in the row-major (ny, nx) array
+            values = field[name].astype(dtype).ravel()
+            if binary:
+                f.write(values.tobytes())
+                f.write(b"\n")
+            else:
+                np.savetxt(f, values, fmt="%d" if kind == "int" else "%.7g")
+
+
+def write_flow_field(field, filename):
+    """Write a rasterized field; the format follows the extension (.npz, .npy or .vtk)"""
+    if filename.endswith(".npz"):
+        save_npz(field, filename)
+    elif filename.endswith(".npy"):
+        save_npy(field, filename)
+    elif filename.endswith(".vtk"):
+        save_vtk(field, filename)
+    else:
+        raise ValueError(f"Unsupported output format '{filename}' (use .npz, .npy or .vtk).")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rasterize the same-family shock intersection flow field.")
+    parser.add_argument("output", help="output file (.npz, .npy or .vtk)")
+    parser.add_argument("--mach", type=float, required=True, help="inlet Mach number")
+    parser.add_argument("--theta", type=float, required=True, help="first ramp angle (degrees)")
+    parser.add_argument("--theta-plus", type=float, required=True, help="ramp increase angle (degrees)")
+    parser.add_argument("--nx", type=int, default=2000, help="grid points along x")
+    parser.add_argument("--ny", type=int, default=1000, help="grid points along y")
+    parser.add_argument("--x-range", type=float, nargs=2, default=None, help="x extent (default: framed ramps)")
+    parser.add_argument("--y-range", type=float, nargs=2, default=None, help="y extent (default: framed ramps)")
+    parser.add_argument("--ramp-length", type=float, default=1.0, help="length of the first ramp")
+    parser.add_argument("--corner", type=float, nargs=2, default=(0.0, 0.0), help="first ramp corner (x y)")
+    parser.add_argument("--gamma", type=float, default=1.4)
+    args = parser.parse_args(argv)
+
+    result = Intersection_of_Shock_Waves_Same_Family_Batch(args.mach, args.theta, args.theta_plus,
+                                                           gamma=args.gamma)
+    start = time.perf_counter()
+    try:
+        field = rasterize_flow_field(result, args.x_range, args.y_range, (args.ny, args.nx), args.ramp_length,
+                                     args.corner)
+        write_flow_field(field, args.output)
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    print(f"✅ {args.nx * args.ny} points written to '{args.output}' in {time.perf_counter() - start:.2f} s.")
+    return 0
+
+
+# Usage: python Flow_Field_Rasterizer.py flow_field.vtk --mach 3 --theta 10 --theta-plus 8 --nx 2000 --ny 1000
+if __name__ == "__main__":
+    sys.exit(main())
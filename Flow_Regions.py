@@ -0,0 +1,133 @@
+import numpy as np
+from Same_Family_Shock_Solver import CASE_NO_SOLUTION, CASE_EXPANSION
+
+# Region labels of a point (1-5 are the flow regions of the solver)
+REGION_SOLID = 0
+REGION_FAN = 6
+REGION_NAMES = {
+    REGION_SOLID: "Solid",
+    1: "Region 1 (freestream)",
+    2: "Region 2 (behind shock 1)",
+    3: "Region 3 (behind shock 2)",
+    4: "Region 4 (behind the transmitted wave)",
+    5: "Region 5 (behind the merged shock)",
+    REGION_FAN: "Expansion fan"
+}
+
+
+def _case_value(result, field):
+    value = np.asarray(result[field], dtype=float)
+    if value.size != 1:
+        raise ValueError("The result must hold a single case (index the batch result first).")
+    return float(value.ravel()[0])
+
+
+def region_states(result):
+    """Mach, P/P1, T/T1 and rho/rho1 of regions 1-5 of one same-family result (batch result dict)"""
+    states = {1: {"Mach": _case_value(result, "Inlet Mach"), "P/P1": 1.0, "T/T1": 1.0, "rho/rho1": 1.0}}
+    for region in range(2, 6):
+        states[region] = {"Mach": _case_value(result, f"Mach {region}"),
+                          "P/P1": _case_value(result, f"P{region}/P1"),
+                          "T/T1": _case_value(result, f"T{region}/T1"),
+                          "rho/rho1": _case_value(result, f"rho{region}/rho1")}
+    return states
+
+
+def result_gamma(result):
+    """
+    Ratio of specific heats of one same-family result (batch result dict), recovered from the
+    Rankine-Hugoniot relation rho/rho1 = (k * P/P1 + 1) / (k + P/P1), k = (gamma + 1) / (gamma - 1),
+    across the merged shock (region 1 -> 5)
+    """
+    if int(_case_value(result, "Case")) == CASE_NO_SOLUTION:
+        raise ValueError("The case has no intersection solution.")
+    p, rho = _case_value(result, "P5/P1"), _case_value(result, "rho5/rho1")
+    k = (1 - rho * p) / (rho - p)
+    return (k + 1) / (k - 1)
+
+
+def wave_geometry(result, ramp_length=1.0, corner=(0.0, 0.0)):
+    """
+    Wall and wave lines of one same-family result (batch result dict) in physical coordinates.
+
+    The freestream flows along +x. The first ramp starts at corner and turns the wall by Theta;
+    the second corner is ramp_length further along the first ramp. Shock 1 leaves the first
+    corner at Beta1, shock 2 the second corner at Theta + Beta2, and both meet at the
+    intersection point. From there the merged shock runs at Beta3, the slip line at the slip-line
+    angle and the transmitted wave downward relative to the region 3 flow: a reflected shock at
+    (Theta + Theta_plus) - Beta4 or an expansion fan between the Mach lines of regions 3 and 4.
+    Angles are in degrees from +x.
+    """
+    if int(_case_value(result, "Case")) == CASE_NO_SOLUTION:
+        raise ValueError("The case has no intersection solution.")
+    theta_1 = _case_value(result, "First Ramp Angle")
+    theta_total = theta_1 + _case_value(result, "Ramp Increase Angle")
+    x0, y0 = map(float, corner)
+    second_corner = (x0 + ramp_length * np.cos(np.radians(theta_1)), y0 + ramp_length * np.sin(np.radians(theta_1)))
+    shock1 = _case_value(result, "Beta1")
+    shock2 = theta_1 + _case_value(result, "Beta2")
+
+    # Intersection of shock 1 (from the first corner) and shock 2 (from the second corner)
+    d1 = np.array([np.cos(np.radians(shock1)), np.sin(np.radians(shock1))])
+    d2 = np.array([np.cos(np.radians(shock2)), np.sin(np.radians(shock2))])
+    t = np.linalg.solve(np.column_stack((d1, -d2)), np.subtract(second_corner, (x0, y0)))[0]
+    intersection = (x0 + t * d1[0], y0 + t * d1[1])
+
+    slip = _case_value(result, "Slip Line Angle")
+    if int(_case_value(result, "Case")) == CASE_EXPANSION:
+        leading = theta_total - np.degrees(np.arcsin(1 / _case_value(result, "Mach 3")))
+        trailing = slip - np.degrees(np.arcsin(1 / _case_value(result, "Mach 4")))
+    else:
+        leading = trailing = theta_total - _case_value(result, "Beta4")
+
+    return {
+        'corner': (x0, y0), 'second_corner': second_corner, 'intersection': intersection,
+        'ramp_angles': (theta_1, theta_total), 'shock1': shock1, 'shock2': shock2,
+        'merged_shock': _case_value(result, "Beta3"), 'slip_line': slip,
+        'transmitted_leading': leading, 'transmitted_trailing': trailing,
+        'expansion': int(_case_value(result, "Case")) == CASE_EXPANSION
+    }
+
+
+def _left_of(x, y, point, angle):
+    """Signed distance of points to the line through point at angle (positive on its left/upper side)"""
+    a = np.radians(angle)
+    return np.cos(a) * (y - point[1]) - np.sin(a) * (x - point[0])
+
+
+def assign_regions(x, y, geometry):
+    """
+    Region label (1-5, REGION_FAN or REGION_SOLID) of arrays of points, from half-plane tests
+    against the wave lines of wave_geometry.
+    """
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    intersection = geometry['intersection']
+    theta_1, theta_total = geometry['ramp_angles']
+    corner, second_corner = geometry['corner'], geometry['second_corner']
+
+    upstream = np.where(_left_of(x, y, corner, geometry['shock1']) > 0, 1,
+                        np.where(_left_of(x, y, second_corner, geometry['shock2']) > 0, 2, 3))
+    downstream = np.where(_left_of(x, y, intersection, geometry['merged_shock']) > 0, 1,
+                          np.where(_left_of(x, y, intersection, geometry['slip_line']) > 0, 5,
+                                   np.where(_left_of(x, y, intersection, geometry['transmitted_trailing']) > 0, 4,
+                                            np.where(_left_of(x, y, intersection,
+                                                              geometry['transmitted_leading']) > 0, REGION_FAN, 3))))
+    region = np.where(x < intersection[0], upstream, downstream)
+
+    # Below the wall (flat plate, first ramp, second ramp)
+    solid = np.where(x < corner[0], y < corner[1],
+                     np.where(x < second_corner[0], _left_of(x, y, corner, theta_1) < 0,
+                              _left_of(x, y, second_corner, theta_total) < 0))
+    return np.where(solid, REGION_SOLID, region).astype(np.int8)
+
+
+def wave_distance(x, y, geometry):
+    """Distance of points to the nearest wave line (shocks 1/2 upstream of the intersection, the rest downstream)"""
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    intersection = geometry['intersection']
+    upstream = np.minimum(np.abs(_left_of(x, y, geometry['corner'], geometry['shock1'])),
+                          np.abs(_left_of(x, y, geometry['second_corner'], geometry['shock2'])))
+    downstream = np.abs(_left_of(x, y, intersection, geometry['merged_shock']))
+    for line in ('slip_line', 'transmitted_leading', 'transmitted_trailing'):
+        downstream = np.minimum(downstream, np.abs(_left_of(x, y, intersection, geometry[line])))
+    return np.where(x < intersection[0], upstream, downstream)
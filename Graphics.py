@@ -1,16 +1,18 @@
+from collections import OrderedDict
 from Oblique_Shock_Solver import ObliqueShockAnalyzer
 from Expansion_Wave_Solver import PrandtlMeyerExpansion
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.optimize import fsolve
 
 
 def plot_pressure_theta_analysis(M1, M2, M3, Theta1, Theta2, P2_over_P1, P3_over_P2,
                                  Case, analyzer_obs, analyzer_pm, show_plot=True, figsize=(10, 6)):
     """
     Draws the Pressure–Deflection Angle (P–θ) diagram and finds intersection points
+    (matplotlib and SciPy are imported on first use, so importing this module stays cheap)
     """
+    import matplotlib.pyplot as plt
+    from scipy.interpolate import interp1d
+    from scipy.optimize import fsolve
 
     # Color list
     color_list = ["r", "g", "b", "purple", "black", "yellow", "cyan"]
@@ -149,3 +151,171 @@ def plot_pressure_theta_analysis(M1, M2, M3, Theta1, Theta2, P2_over_P1, P3_over
         plt.close()
 
     return x_intersect, y_intersect
+
+
+class PressureThetaPlotter:
+    """
+    Reusable P–θ diagram for repeated (headless or GUI) use.
+
+    The plotter owns a single matplotlib Figure that is not registered with pyplot, so no global
+    figure state accumulates. Each polar is one line artist (weak and strong branches, mirrored, joined
+    with NaN breaks) whose data is replaced with set_data on every call. The full and the zoomed view
+    are two axes of the same figure: the figure is drawn once per call and the two halves of the
+    rendered image are written to separate PNG files.
+    Unshifted polars are kept in a small LRU cache keyed on the Mach number, so cases that share an
+    inlet Mach (region 1 polar) or inlet Mach and first ramp (region 2 polar) reuse the arrays.
+    """
+
+    def __init__(self, analyzer_obs=None, analyzer_pm=None, figsize=(10, 6), dpi=100, zoom=(0.5, 0.3),
+                 samples=400, cache_size=64):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.analyzer_obs = ObliqueShockAnalyzer() if analyzer_obs is None else analyzer_obs
+        self.analyzer_pm = PrandtlMeyerExpansion() if analyzer_pm is None else analyzer_pm
+        self.zoom = zoom
+        self.samples = samples
+        self.cache_size = cache_size
+        self.polar_cache = OrderedDict()
+        self.figure = Figure(figsize=(figsize[0], 2 * figsize[1]), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+
+        # Full view in the upper half, zoomed view in the lower half (default subplot margins per half)
+        self.axes_full = self.figure.add_axes((0.125, 0.5 + 0.055, 0.775, 0.385))
+        self.axes_zoom = self.figure.add_axes((0.125, 0.055, 0.775, 0.385))
+        self.lines = {}
+        for axes in (self.axes_full, self.axes_zoom):
+            axes.set_xlabel("Theta (°)")
+            axes.set_ylabel("Pressure Ratio")
+            axes.set_title("Pressure Ratio vs Deflection Angle")
+            axes.grid(True)
+            self.lines[axes] = [axes.plot([], [], color)[0] for color in ("r", "g", "b")]
+            self.lines[axes].append(axes.plot([], [], 'ro', label="Intersection Point")[0])
+
+    # === Polars ===
+    def _base_polar(self, kind, M):
+        """Unshifted right branch of a polar ('shock': closed weak/strong curve, 'expansion'), cached"""
+        key = (kind, float(M))
+        if key in self.polar_cache:
+            self.polar_cache.move_to_end(key)
+            return self.polar_cache[key]
+
+        if kind == 'shock':
+            theta_max = float(self.analyzer_obs.max_theta_array(M)[0])
+            t = np.linspace(0.01, theta_max, self.samples)
+            weak = self.analyzer_obs.pressure_ratio_array(M, t)
+            beta_strong = self.analyzer_obs.solve_beta_angle_array(M, t, strong=True)
+            strong = self.analyzer_obs.shock_relations_array(M, beta_strong, t)['pressure_ratio']
+            weak[-1] = strong[-1]  # Connects at max theta
+            polar = np.concatenate((t, t[::-1])), np.concatenate((weak, strong[::-1]))
+        else:
+            t = np.linspace(0, 90, self.samples)
+            polar = t, self.analyzer_pm.calculate_all_ratios_array(M, t)['pressure_ratio']
+
+        self.polar_cache[key] = polar
+        while len(self.polar_cache) > self.cache_size:
+            self.polar_cache.popitem(last=False)
+        return polar
+
+    def _mirrored(self, kind, M, Theta, P_ratio):
+        x, y = self._base_polar(kind, M)
+        y = y * P_ratio
+        return np.concatenate((Theta + x, [np.nan], Theta - x)), np.concatenate((y, [np.nan], y))
+
+    def shock_polar(self, M, Theta=0, P_ratio=1):
+        """Closed weak/strong shock polar, mirrored about Theta, as one NaN-separated curve"""
+        return self._mirrored('shock', M, Theta, P_ratio)
+
+    def expansion_polar(self, M, Theta=0, P_ratio=1):
+        """Prandtl–Meyer expansion curve, mirrored about Theta"""
+        return self._mirrored('expansion', M, Theta, P_ratio)
+
+    def intersection(self, M1, M3, Theta2, P3_over_P1, Case, bisections=60):
+        """
+        Deflection and pressure where the region 1 weak polar meets the region 3 polar
+        (shock: left branch of the region 3 weak polar, expansion: right branch of the expansion curve)
+        """
+        theta_max1 = float(self.analyzer_obs.max_theta_array(M1)[0])
+
+        def difference(x):
+            p1 = self.analyzer_obs.pressure_ratio_array(M1, x)
+            if Case == 0:
+                p3 = self.analyzer_obs.pressure_ratio_array(M3, Theta2 - x)
+            else:
+                p3 = self.analyzer_pm.calculate_all_ratios_array(M3, x - Theta2)['pressure_ratio']
+            return p1 - P3_over_P1 * p3
+
+        x = np.linspace(0.0, theta_max1, self.samples)
+        # Past Theta2 the region 3 shock polar is undefined (NaN), so Theta2 must be a node for a root just below it
+        if 0.0 < Theta2 < theta_max1:
+            x = np.union1d(x, [Theta2])
+        d = difference(x)
+        change = np.nonzero(np.isfinite(d[:-1]) & np.isfinite(d[1:]) & (np.sign(d[:-1]) != np.sign(d[1:])))[0]
+        if change.size == 0:
+            return None, None
+        lo, hi = x[change[0]], x[change[0] + 1]
+        d_lo = d[change[0]]
+        for _ in range(bisections):
+            mid = 0.5 * (lo + hi)
+            d_mid = difference(mid)
+            if np.sign(d_mid) == np.sign(d_lo):
+                lo, d_lo = mid, d_mid
+            else:
+                hi = mid
+        x_intersect = 0.5 * (lo + hi)
+        return x_intersect, float(self.analyzer_obs.pressure_ratio_array(M1, x_intersect))
+
+    # === Rendering ===
+    def compute(self, M1, M2, M3, Theta1, Theta2, P2_over_P1, P3_over_P2, Case):
+        """Polar curves [(x, y)] * 3 and the intersection point of one case, without drawing"""
+        if Case not in (0, 1):
+            raise ValueError("Case parameter must be either 0 (shock) or 1 (expansion)!")
+        curves = [self.shock_polar(M1),
+                  self.shock_polar(M2, Theta1, P2_over_P1),
+                  (self.shock_polar if Case == 0 else self.expansion_polar)(M3, Theta2, P2_over_P1 * P3_over_P2)]
+        return curves, self.intersection(M1, M3, Theta2, P2_over_P1 * P3_over_P2, Case)
+
+    def update(self, curves, point, mach_numbers, title="Pressure Ratio vs Deflection Angle"):
+        """Replace the line data of both views (the zoomed view is centred on the intersection)"""
+        x_intersect, y_intersect = point
+        for axes, lines in self.lines.items():
+            for line, (x, y), M in zip(lines, curves, mach_numbers):
+                line.set_data(x, y)
+                line.set_label(f"MACH {M:.2f}")
+            marker = lines[3]
+            marker.set_data([] if x_intersect is None else [x_intersect], [] if y_intersect is None else [y_intersect])
+            axes.relim()
+            axes.autoscale_view()
+            axes.legend(loc="best")
+        self.axes_full.set_title(title)
+
+        if x_intersect is not None:
+            self.axes_zoom.set_xlim(x_intersect - self.zoom[0], x_intersect + self.zoom[0])
+            self.axes_zoom.set_ylim(y_intersect - self.zoom[1], y_intersect + self.zoom[1])
+        else:
+            # No intersection: fit the curves instead of keeping the previous case's window
+            self.axes_zoom.autoscale(enable=True)
+
+    def plot(self, M1, M2, M3, Theta1, Theta2, P2_over_P1, P3_over_P2, Case, full_path="graph.png",
+             zoomed_path="graph_zoomed.png"):
+        """
+        Same inputs as plot_pressure_theta_analysis; updates the artists, renders once and writes
+        the full and zoomed views. Returns (x_intersect, y_intersect) or (None, None).
+        """
+        curves, point = self.compute(M1, M2, M3, Theta1, Theta2, P2_over_P1, P3_over_P2, Case)
+        self.update(curves, point, (M1, M2, M3))
+        self.render(full_path, zoomed_path)
+        return point
+
+    def render(self, full_path="graph.png", zoomed_path="graph_zoomed.png"):
+        """Draw the figure once and write its upper (full) and lower (zoomed) halves"""
+        from matplotlib.image import imsave
+
+        self.canvas.draw()
+        image = np.asarray(self.canvas.buffer_rgba())
+        half = image.shape[0] // 2
+        imsave(full_path, image[:half])
+        imsave(zoomed_path, image[half:])
+
+    def close(self):
+        self.figure.clear()
@@ -0,0 +1,186 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+import numpy as np
+from Oblique_Shock_Solver import ObliqueShockAnalyzer
+from Expansion_Wave_Solver import PrandtlMeyerExpansion
+from Same_Family_Shock_Solver import (Intersection_of_Shock_Waves_Same_Family_Batch, BATCH_RESULT_FIELDS,
+                                      CASE_NO_SOLUTION)
+
+
+def _objective_weights(objective):
+    """{field: weight} of a field name or a weight dict"""
+    weights = {objective: 1.0} if isinstance(objective, str) else dict(objective)
+    unknown = [field for field in weights if field not in BATCH_RESULT_FIELDS]
+    if unknown:
+        raise ValueError(f"Objective fields must be batch result fields, not {unknown}.")
+    return weights
+
+
+def _optimize_chunk(Mach_inlet, objective, constraints, total_turning, theta_bounds, theta_plus_bounds,
+                    detachment_margin, grid_points, initial_grid_points, tolerance, max_levels,
+                    analyzer_obs=None, analyzer_pm=None):
+    """Grid-zoom search for an array of inlet Mach numbers (one batch solve per level)"""
+    analyzer_obs = ObliqueShockAnalyzer() if analyzer_obs is None else analyzer_obs
+    analyzer_pm = PrandtlMeyerExpansion() if analyzer_pm is None else analyzer_pm
+    weights = _objective_weights(objective)
+    M1 = np.asarray(Mach_inlet, dtype=float).ravel()
+    n = len(M1)
+    dims = 1 if total_turning is not None else 2
+
+    # === No-detachment limits ===
+    theta_max1 = analyzer_obs.max_theta_array(M1)[0] - detachment_margin
+    theta_lo = np.full(n, float(theta_bounds[0]))
+    theta_hi = theta_max1 if theta_bounds[1] is None else np.minimum(theta_max1, theta_bounds[1])
+    if total_turning is not None:
+        total = np.broadcast_to(np.asarray(total_turning, dtype=float), M1.shape)
+        theta_lo = np.maximum(theta_lo, total - (np.inf if theta_plus_bounds[1] is None else theta_plus_bounds[1]))
+        theta_hi = np.minimum(theta_hi, total - theta_plus_bounds[0])
+
+    def angles(idx, u, v):
+        """Ramp angles of unit coordinates; Theta_plus is scaled to the region 3 detachment limit"""
+        Theta = theta_lo[idx] + u * (theta_hi[idx] - theta_lo[idx])
+        M2 = analyzer_obs.complete_analysis_array(M1[idx], Theta)['output_mach']
+        limit = analyzer_obs.max_theta_array(M2)[0] - detachment_margin
+        if dims == 1:
+            return Theta, total[idx] - Theta, limit
+        upper = limit if theta_plus_bounds[1] is None else np.minimum(limit, theta_plus_bounds[1])
+        return Theta, theta_plus_bounds[0] + v * (upper - theta_plus_bounds[0]), limit
+
+    def evaluate(idx, u, v):
+        Theta, Theta_plus, limit = angles(idx, u, v)
+        results = Intersection_of_Shock_Waves_Same_Family_Batch(M1[idx], Theta, Theta_plus,
+                                                                analyzer_obs=analyzer_obs, analyzer_pm=analyzer_pm)
+        value = sum(weight * results[field] for field, weight in weights.items())
+        feasible = (results["Case"] != CASE_NO_SOLUTION) & (Theta_plus <= limit) & \
+            (results["Slip Line Angle"] <= theta_max1[idx])
+        for field, (low, high) in (constraints or {}).items():
+            if low is not None:
+                feasible &= results[field] >= low
+            if high is not None:
+                feasible &= results[field] <= high
+        return np.where(feasible & np.isfinite(value), value, -np.inf), results
+
+    center = np.full((n, dims), 0.5)
+    half_width = np.full(n, 0.5)
+    best_value = np.full(n, -np.inf)
+    best = {field: np.full(n, np.nan) for field in BATCH_RESULT_FIELDS}
+    best["Case"] = np.full(n, CASE_NO_SOLUTION)
+    evaluations = np.zeros(n, dtype=int)
+    levels = np.zeros(n, dtype=int)
+    span = np.maximum(theta_hi - theta_lo, 0.0)
+    active = np.nonzero(theta_hi >= theta_lo)[0]
+
+    # === Grid zoom: evaluate a grid around the current best point, then halve the window ===
+    for level in range(max_levels):
+        if active.size == 0:
+            break
+        points = initial_grid_points if level == 0 else grid_points
+        offsets = np.linspace(-1.0, 1.0, points)
+        grid = np.stack(np.meshgrid(*([offsets] * dims), indexing='ij'), axis=-1).reshape(-1, dims)
+        k = len(grid)
+        unit = np.clip(center[active, None, :] + half_width[active, None, None] * grid[None], 0.0, 1.0)
+        idx = np.repeat(active, k)
+        value, results = evaluate(idx, unit[..., 0].ravel(), unit[..., -1].ravel())
+        evaluations[active] += k
+        levels[active] += 1
+
+        value = value.reshape(-1, k)
+        pick = np.argmax(value, axis=1)
+        rows = np.arange(active.size)
+        improved = value[rows, pick] > best_value[active]
+        flat = rows * k + pick
+        improved_idx = active[improved]
+        best_value[improved_idx] = value[rows, pick][improved]
+        center[improved_idx] = unit[rows, pick][improved]
+        for field in best:
+            best[field][improved_idx] = np.asarray(results[field])[flat][improved]
+
+        # Window of the next level: two grid spacings around the best point
+        half_width[active] *= 4.0 / (points - 1)
+        converged = half_width[active] * np.maximum(span[active], 1.0) < tolerance
+        active = active[~converged & np.isfinite(best_value[active])]
+
+    output = {"Objective": np.where(np.isfinite(best_value), best_value, np.nan)}
+    output.update(best)
+    output.update({"Feasible": np.isfinite(best_value), "Evaluations": evaluations, "Levels": levels})
+    return output
+
+
+def optimize_pressure_recovery(Mach_inlet, objective="Pt4/Pt1", constraints=None, total_turning=None,
+                               theta_bounds=(0.0, None), theta_plus_bounds=(0.0, None), detachment_margin=0.5,
+                               grid_points=9, initial_grid_points=33, tolerance=1e-6, max_levels=60, workers=1,
+                               chunk_size=64, verbose=False):
+    """
+    Two-ramp intake geometry (Theta, Theta_plus) that maximizes total pressure recovery for each
+    inlet Mach number.
+
+    objective is a batch result field ("Pt4/Pt1", "Pt5/Pt1", ...) or a {field: weight} dict whose
+    weighted sum is maximized. Recovery alone is highest with no compression at all, so a design
+    requirement is normally given: total_turning (Theta + Theta_plus, scalar or per Mach) and/or
+    constraints {field: (min, max)} on any result field, e.g. {"P5/P1": (4.0, None)}.
+
+    Both shocks and the merged shock are kept detachment_margin degrees below max theta: Theta is
+    searched up to max theta of the inlet Mach and Theta_plus is scaled to max theta of Mach 2, so
+    every sampled geometry has attached first and second shocks. Each level evaluates a grid around
+    the current best point for all Mach numbers in one batch solver call and shrinks the window to
+    two grid spacings around the best point, i.e. by 4 / (points - 1): 1/8 after the first level
+    (initial_grid_points=33) and 1/2 after later ones (grid_points=9) with the defaults. This is
+    robust to the kink where the transmitted wave switches between expansion and shock.
+    With workers > 1, chunks of Mach numbers are optimized in separate processes.
+
+    Returns a dict of arrays (shape of Mach_inlet) with "Objective", the batch results at the
+    optimum (the design is "First Ramp Angle" and "Ramp Increase Angle"), "Feasible",
+    "Evaluations" and "Levels".
+    """
+    _objective_weights(objective)
+    Mach_inlet = np.asarray(Mach_inlet, dtype=float)
+    shape = Mach_inlet.shape
+    M1 = Mach_inlet.ravel()
+    if total_turning is not None:
+        total_turning = np.broadcast_to(np.asarray(total_turning, dtype=float), shape).ravel()
+    settings = (objective, constraints, None, theta_bounds, theta_plus_bounds, detachment_margin, grid_points,
+                initial_grid_points, tolerance, max_levels)
+
+    starts = list(range(0, len(M1), chunk_size))
+
+    def chunk_args(start):
+        args = list(settings)
+        if total_turning is not None:
+            args[2] = total_turning[start:start + chunk_size]
+        return (M1[start:start + chunk_size], *args)
+
+    # Serial runs use a null context in place of the process pool, so both paths report progress alike
+    parts = []
+    with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as executor:
+        futures = [executor.submit(_optimize_chunk, *chunk_args(start)) for start in starts] if executor else None
+        for i, start in enumerate(starts):
+            parts.append(futures[i].result() if futures else _optimize_chunk(*chunk_args(start)))
+            if verbose:
+                print(f"🔄 {min(start + chunk_size, len(M1))}/{len(M1)} Mach numbers optimized...")
+
+    output = {key: np.concatenate([part[key] for part in parts]).reshape(shape) for key in parts[0]} if parts \
+        else {}
+    if verbose and parts:
+        print(f"✅ {int(np.count_nonzero(output['Feasible']))}/{M1.size} feasible designs, "
+              f"{int(output['Evaluations'].sum())} solver evaluations.")
+    return output
+
+
+# Usage example
+if __name__ == "__main__":
+    mach_numbers = np.array([2.5, 3.0, 3.5, 4.0])
+
+    # Best split of a fixed 20° total turning
+    designs = optimize_pressure_recovery(mach_numbers, "Pt4/Pt1", total_turning=20.0)
+    for i, mach in enumerate(mach_numbers):
+        print(f"Mach {mach}: Theta = {designs['First Ramp Angle'][i]:.4f}°, "
+              f"Theta_plus = {designs['Ramp Increase Angle'][i]:.4f}°, Pt4/Pt1 = {designs['Pt4/Pt1'][i]:.6f}, "
+              f"Pt5/Pt1 = {designs['Pt5/Pt1'][i]:.6f}")
+
+    # Weighted recovery of both streams for a static compression P5/P1 >= 4, Machs in parallel
+    designs = optimize_pressure_recovery(mach_numbers, {"Pt4/Pt1": 0.5, "Pt5/Pt1": 0.5},
+                                         constraints={"P5/P1": (4.0, None)}, workers=2, chunk_size=2, verbose=True)
+    for i, mach in enumerate(mach_numbers):
+        print(f"Mach {mach}: Theta = {designs['First Ramp Angle'][i]:.4f}°, "
+              f"Theta_plus = {designs['Ramp Increase Angle'][i]:.4f}°, recovery = {designs['Objective'][i]:.6f}, "
+              f"P5/P1 = {designs['P5/P1'][i]:.4f}, evaluations = {designs['Evaluations'][i]}")
@@ -0,0 +1,154 @@
+import numpy as np
+from Oblique_Shock_Solver import ObliqueShockAnalyzer
+from Expansion_Wave_Solver import PrandtlMeyerExpansion
+from Same_Family_Shock_Solver import Intersection_of_Shock_Waves_Same_Family_Batch, BATCH_RESULT_FIELDS
+
+# Ramp angles that can be solved for
+DESIGN_UNKNOWNS = ("Theta", "Theta_plus")
+
+
+def solve_inverse_design(Mach_inlet, target_field, target_value, Theta=None, Theta_plus=None,
+                         unknown="Theta_plus", scan_points=9, tolerance=1e-9, max_iterations=30,
+                         analyzer_obs=None, analyzer_pm=None):
+    """
+    Find the ramp angle (Theta_plus or Theta) for which a same-family output reaches a target value,
+    e.g. "P5/P1", "Pt4/Pt1" (total pressure recovery) or "Slip Line Angle".
+
+    The other ramp angle is fixed; inputs broadcast, so many design queries are solved together.
+    The feasible range of the unknown (up to detachment) is scanned with scan_points cases per query
+    to bracket the first crossing of the target. A safeguarded Newton iteration follows: each step
+    solves x and x + h in one batch call (finite-difference derivative), warm-starting the inner
+    pressure match from the previous slip-line solution, and falls back to bisection when the Newton
+    step leaves the bracket.
+
+    Returns a dict with the solved angle ("Solution"), the forward results at the solution
+    (BATCH_RESULT_FIELDS and "Case"), "Residual", "Iterations", "Forward Solves" and "Converged".
+    Queries without a crossing in the feasible range are NaN with Converged = False.
+    """
+    if unknown not in DESIGN_UNKNOWNS:
+        raise ValueError(f"unknown must be one of {DESIGN_UNKNOWNS}.")
+    if target_field not in BATCH_RESULT_FIELDS:
+        raise ValueError(f"target_field must be one of the batch result fields, not '{target_field}'.")
+    fixed = Theta_plus if unknown == "Theta" else Theta
+    if fixed is None:
+        raise ValueError(f"The other ramp angle must be given when solving for {unknown}.")
+
+    analyzer_obs = ObliqueShockAnalyzer() if analyzer_obs is None else analyzer_obs
+    analyzer_pm = PrandtlMeyerExpansion() if analyzer_pm is None else analyzer_pm
+    shape = np.broadcast_shapes(np.shape(Mach_inlet), np.shape(fixed), np.shape(target_value))
+    M1, fixed, target = (a.ravel().copy() for a in np.broadcast_arrays(np.asarray(Mach_inlet, dtype=float),
+                                                                       np.asarray(fixed, dtype=float),
+                                                                       np.asarray(target_value, dtype=float)))
+    n = len(M1)
+    forward_solves = np.zeros(n, dtype=int)
+
+    def forward(idx, x, guess=None):
+        """Batch solve for queries idx at unknown values x"""
+        forward_solves[:] += np.bincount(idx, minlength=n)
+        args = (M1[idx], x, fixed[idx]) if unknown == "Theta" else (M1[idx], fixed[idx], x)
+        return Intersection_of_Shock_Waves_Same_Family_Batch(*args, analyzer_obs=analyzer_obs,
+                                                             analyzer_pm=analyzer_pm, Theta_guess=guess)
+
+    # === Feasible range of the unknown (up to detachment of the shock it turns) ===
+    if unknown == "Theta":
+        upper = analyzer_obs.max_theta_array(M1)[0]
+    else:
+        M2 = analyzer_obs.complete_analysis_array(M1, fixed)['output_mach']
+        upper = analyzer_obs.max_theta_array(M2)[0]
+    upper = np.where(np.isfinite(upper), upper * (1 - 1e-6), np.nan)
+
+    # === Bracketing scan (one batch call) ===
+    fractions = np.linspace(0.0, 1.0, scan_points)
+    x_scan = 1e-3 + fractions[None, :] * (upper[:, None] - 1e-3)
+    idx_scan = np.repeat(np.arange(n), scan_points)
+    scan = forward(idx_scan, x_scan.ravel())
+    g_scan = (np.asarray(scan[target_field]).reshape(n, scan_points) - target[:, None])
+    theta_scan = np.asarray(scan["Theta"]).reshape(n, scan_points)
+
+    crossing = np.isfinite(g_scan[:, :-1]) & np.isfinite(g_scan[:, 1:]) & \
+        (np.sign(g_scan[:, :-1]) != np.sign(g_scan[:, 1:]))
+    has_bracket = crossing.any(axis=1)
+    first = np.argmax(crossing, axis=1)
+    rows = np.arange(n)
+    a = np.where(has_bracket, x_scan[rows, first], np.nan)
+    b = np.where(has_bracket, x_scan[rows, np.minimum(first + 1, scan_points - 1)], np.nan)
+    g_a = np.where(has_bracket, g_scan[rows, first], np.nan)
+    g_b = np.where(has_bracket, g_scan[rows, np.minimum(first + 1, scan_points - 1)], np.nan)
+
+    # Start from the regula falsi point, warm-started with the interpolated slip-line solution
+    weight = np.where(has_bracket, g_a / np.where(g_a != g_b, g_a - g_b, 1.0), 0.5)
+    x = a + weight * (b - a)
+    guess = theta_scan[rows, first] + weight * (theta_scan[rows, np.minimum(first + 1, scan_points - 1)] -
+                                                theta_scan[rows, first])
+
+    results = {field: np.full(n, np.nan) for field in BATCH_RESULT_FIELDS}
+    results["Case"] = np.full(n, -1)
+    residual = np.full(n, np.nan)
+    iterations = np.zeros(n, dtype=int)
+    converged = np.zeros(n, dtype=bool)
+    active = np.nonzero(has_bracket)[0]
+    scale = np.maximum(np.abs(target), 1.0)
+
+    # === Safeguarded Newton iteration ===
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        h = 1e-6 * np.maximum(np.abs(x[active]), 1.0)
+        idx = np.concatenate((active, active))
+        step_guess = np.concatenate((guess[active], guess[active]))
+        solved = forward(idx, np.concatenate((x[active], x[active] + h)), step_guess)
+        value = np.asarray(solved[target_field])
+        f_x, f_h = value[:active.size], value[active.size:]
+        g = f_x - target[active]
+        iterations[active] += 1
+
+        for field in results:
+            results[field][active] = np.asarray(solved[field])[:active.size]
+        residual[active] = g
+        guess[active] = np.where(np.isfinite(solved["Theta"][:active.size]), solved["Theta"][:active.size],
+                                 guess[active])
+
+        # Shrink the bracket with the new point
+        same_as_a = np.sign(g) == np.sign(g_a[active])
+        a[active] = np.where(same_as_a, x[active], a[active])
+        g_a[active] = np.where(same_as_a, g, g_a[active])
+        b[active] = np.where(same_as_a, b[active], x[active])
+        g_b[active] = np.where(same_as_a, g_b[active], g)
+
+        done = (np.abs(g) <= tolerance * scale[active]) | (np.abs(b[active] - a[active]) <= 1e-12)
+        converged[active] = done
+
+        derivative = (f_h - f_x) / h
+        newton = x[active] - g / np.where(derivative != 0, derivative, np.nan)
+        lo = np.minimum(a[active], b[active])
+        hi = np.maximum(a[active], b[active])
+        inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        x[active] = np.where(inside, newton, 0.5 * (a[active] + b[active]))
+        active = active[~done & np.isfinite(g)]
+
+    # x was advanced after the converged evaluation; report the evaluated point
+    solution = np.where(converged, results["First Ramp Angle" if unknown == "Theta" else "Ramp Increase Angle"],
+                        np.nan)
+
+    output = {"Solution": solution.reshape(shape)}
+    output.update({field: value.reshape(shape) for field, value in results.items()})
+    output.update({"Residual": residual.reshape(shape), "Iterations": iterations.reshape(shape),
+                   "Forward Solves": forward_solves.reshape(shape), "Converged": converged.reshape(shape)})
+    return output
+
+
+# Usage example
+if __name__ == "__main__":
+    # Second ramp angle for a static pressure rise P5/P1 = 4 behind a 10° first ramp at Mach 3
+    design = solve_inverse_design(3.0, "P5/P1", 4.0, Theta=10.0, unknown="Theta_plus")
+    print(f"Theta_plus = {float(design['Solution']):.6f}°, P5/P1 = {float(design['P5/P1']):.8f}, "
+          f"iterations = {int(design['Iterations'])}, forward solves = {int(design['Forward Solves'])}")
+
+    # Total pressure recovery targets for several inlet Mach numbers at once
+    designs = solve_inverse_design([2.5, 3.0, 3.5], "Pt4/Pt1", 0.95, Theta=8.0, unknown="Theta_plus")
+    for mach, angle, pt4, ok in zip([2.5, 3.0, 3.5], designs['Solution'], designs['Pt4/Pt1'], designs['Converged']):
+        print(f"Mach {mach}: Theta_plus = {angle:.4f}°, Pt4/Pt1 = {pt4:.6f}, converged = {ok}")
+
+    # First ramp angle for a slip-line angle of 15° with a fixed 6° ramp increase
+    design = solve_inverse_design(3.0, "Slip Line Angle", 15.0, Theta_plus=6.0, unknown="Theta")
+    print(f"Theta = {float(design['Solution']):.6f}°, slip line = {float(design['Slip Line Angle']):.8f}°")
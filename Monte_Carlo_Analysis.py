@@ -0,0 +1,171 @@
+import numpy as np
+from Same_Family_Shock_Solver import (Intersection_of_Shock_Waves_Same_Family_Batch, BATCH_RESULT_FIELDS,
+                                      CASE_NO_SOLUTION, CASE_SHOCK, CASE_EXPANSION)
+
+
+class StreamingStatistics:
+    """
+    Running statistics of one output field with bounded memory.
+    Mean/variance are merged chunk by chunk (Chan et al.); quantiles come from a fixed-size
+    histogram whose range doubles whenever new values fall outside it.
+    """
+
+    def __init__(self, bins=4096):
+        """
+        Initialize the accumulator (bins must be even, since range doubling merges bin pairs)
+        """
+        if bins < 2 or bins % 2:
+            raise ValueError(f"bins must be an even number of at least 2, not {bins}.")
+        self.bins = bins
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.lower = None
+        self.width = None
+
+    def _expand(self, low, high):
+        """Double the histogram range (merging neighbouring bins) until it covers [low, high]"""
+        while low < self.lower or high >= self.lower + self.width * self.bins:
+            merged = self.counts.reshape(-1, 2).sum(axis=1)
+            self.counts = np.zeros(self.bins, dtype=np.int64)
+            if low < self.lower:
+                # Grow downwards: the old range becomes the upper half
+                self.counts[self.bins // 2:] = merged
+                self.lower -= self.width * self.bins
+            else:
+                self.counts[:self.bins // 2] = merged
+            self.width *= 2
+
+    def update(self, values):
+        """Add an array of values (NaN entries are ignored)"""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        n = values.size
+        if n == 0:
+            return
+
+        # Merge mean and sum of squared deviations
+        chunk_mean = values.mean()
+        chunk_m2 = ((values - chunk_mean) ** 2).sum()
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta ** 2 * self.count * n / total
+        self.count = total
+
+        low, high = values.min(), values.max()
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+
+        if self.lower is None:
+            span = high - low
+            pad = 0.05 * span if span > 0 else max(abs(low) * 1e-6, 1e-12)
+            self.lower = low - pad
+            self.width = (span + 2 * pad) / self.bins
+        self._expand(low, high)
+
+        idx = np.minimum(((values - self.lower) / self.width).astype(np.int64), self.bins - 1)
+        self.counts += np.bincount(idx, minlength=self.bins)
+
+    def quantile(self, q):
+        """Approximate quantile(s) from the histogram (resolution: one bin width)"""
+        q = np.asarray(q, dtype=float)
+        if self.count == 0:
+            return np.full(q.shape, np.nan)
+        cumulative = np.concatenate(([0], np.cumsum(self.counts))) / self.count
+        edges = self.lower + self.width * np.arange(self.bins + 1)
+        return np.clip(np.interp(q, cumulative, edges), self.min, self.max)
+
+    def summary(self, quantiles=(0.05, 0.5, 0.95)):
+        """Dictionary of the current statistics"""
+        std = np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+        result = {
+            'count': self.count,
+            'mean': self.mean if self.count else np.nan,
+            'std': std,
+            'min': self.min if self.count else np.nan,
+            'max': self.max if self.count else np.nan
+        }
+        for q, value in zip(quantiles, self.quantile(quantiles)):
+            result[f'q{q:g}'] = value
+        return result
+
+
+def _sample_parameter(spec, rng, size):
+    """
+    Draw samples of one input: a number is fixed, a (mean, std) tuple is normal,
+    a callable is called as spec(rng, size).
+    """
+    if callable(spec):
+        return np.asarray(spec(rng, size), dtype=float)
+    if isinstance(spec, (tuple, list)):
+        mean, std = spec
+        return rng.normal(mean, std, size)
+    return np.full(size, float(spec))
+
+
+def iter_monte_carlo_same_family(Mach_inlet, Theta, Theta_plus, n_samples=100000, chunk_size=50000,
+                                 seed=None, fields=None, bins=4096):
+    """
+    Monte Carlo propagation of input uncertainty through the same-family intersection.
+
+    Samples are drawn and solved chunk by chunk with Intersection_of_Shock_Waves_Same_Family_Batch,
+    so memory depends on chunk_size only. After every chunk yields
+    (samples_done, case_counts, statistics) where statistics maps field -> StreamingStatistics.
+    """
+    rng = np.random.default_rng(seed)
+    fields = BATCH_RESULT_FIELDS if fields is None else tuple(fields)
+    statistics = {field: StreamingStatistics(bins) for field in fields}
+    case_counts = {CASE_EXPANSION: 0, CASE_SHOCK: 0, CASE_NO_SOLUTION: 0}
+
+    samples_done = 0
+    while samples_done < n_samples:
+        size = min(chunk_size, n_samples - samples_done)
+        results = Intersection_of_Shock_Waves_Same_Family_Batch(_sample_parameter(Mach_inlet, rng, size),
+                                                                _sample_parameter(Theta, rng, size),
+                                                                _sample_parameter(Theta_plus, rng, size))
+        for case in case_counts:
+            case_counts[case] += int(np.count_nonzero(results["Case"] == case))
+        for field in fields:
+            statistics[field].update(results[field])
+
+        samples_done += size
+        yield samples_done, case_counts, statistics
+
+
+def monte_carlo_same_family(Mach_inlet, Theta, Theta_plus, n_samples=100000, chunk_size=50000, seed=None,
+                            fields=None, quantiles=(0.05, 0.5, 0.95), bins=4096, verbose=False):
+    """
+    Run the Monte Carlo propagation to the end and return summary statistics per field.
+    Statistics only include samples with a solution; failed samples are counted separately.
+    """
+    samples_done, case_counts, statistics = 0, {}, {}
+    for samples_done, case_counts, statistics in iter_monte_carlo_same_family(
+            Mach_inlet, Theta, Theta_plus, n_samples, chunk_size, seed, fields, bins):
+        if verbose:
+            print(f"🔄 {samples_done}/{n_samples} samples processed...")
+
+    return {
+        'n_samples': samples_done,
+        'n_expansion': case_counts.get(CASE_EXPANSION, 0),
+        'n_shock': case_counts.get(CASE_SHOCK, 0),
+        'n_no_solution': case_counts.get(CASE_NO_SOLUTION, 0),
+        'fields': {field: stat.summary(quantiles) for field, stat in statistics.items()}
+    }
+
+
+# Usage example
+if __name__ == "__main__":
+    # Inlet Mach 3 +- 0.05, ramp angles 10° +- 0.2° and 17° +- 0.2° (normal distributions)
+    summary = monte_carlo_same_family((3.0, 0.05), (10.0, 0.2), (17.0, 0.2), n_samples=1000000, seed=0,
+                                      verbose=True)
+
+    print(f"Samples: {summary['n_samples']} (expansion: {summary['n_expansion']}, shock: {summary['n_shock']}, "
+          f"no solution: {summary['n_no_solution']})")
+    for field in ["Mach 4", "Mach 5", "P4/P1", "T4/T1", "T5/T1", "Pt4/Pt1", "Pt5/Pt1", "Slip Line Angle"]:
+        stats = summary['fields'][field]
+        print(f"{field}: mean={stats['mean']:.4f}, std={stats['std']:.4f}, "
+              f"q5={stats['q0.05']:.4f}, q50={stats['q0.5']:.4f}, q95={stats['q0.95']:.4f}")
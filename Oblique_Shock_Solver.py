@@ -1,9 +1,4 @@
 import numpy as np
-from scipy.optimize import fsolve
-
-
-import numpy as np
-from scipy.optimize import fsolve
 
 
 class ObliqueShockAnalyzer:
@@ -14,13 +9,18 @@ class ObliqueShockAnalyzer:
         """
         self.gamma = gamma
 
-    def theta_from_beta(self, M1, beta):
+    def _gamma(self, gamma):
+        """gamma of a call: the instance value, or an array broadcast with the other inputs"""
+        return self.gamma if gamma is None else np.asarray(gamma, dtype=float)
+
+    def theta_from_beta(self, M1, beta, gamma=None):
         """
         Compute the theta angle based on Mach number and beta angle.
         """
+        g = self._gamma(gamma)
         beta_rad = np.radians(beta)
         term1 = 2 * (1 / np.tan(beta_rad))
-        term2 = (M1 ** 2 * (np.sin(beta_rad)) ** 2 - 1) / (M1 ** 2 * (self.gamma + np.cos(2 * beta_rad)) + 2)
+        term2 = (M1 ** 2 * (np.sin(beta_rad)) ** 2 - 1) / (M1 ** 2 * (g + np.cos(2 * beta_rad)) + 2)
         theta_rad = np.arctan(term1 * term2)
         return np.degrees(theta_rad)
 
@@ -60,6 +60,8 @@ class ObliqueShockAnalyzer:
         if theta > theta_max:
             raise ValueError(f"Input theta angle ({theta:.3f}°) exceeds max theta ({theta_max:.3f}°); detached shock occurs!")
 
+        from scipy.optimize import fsolve
+
         beta_guess_weak = theta + 5
         beta_weak = fsolve(self._theta_beta_m_relation, beta_guess_weak, args=(M1, theta))[0]
 
@@ -161,6 +163,8 @@ class ObliqueShockAnalyzer:
         """
         Compute the strong solution for beta angle.
         """
+        from scipy.optimize import fsolve
+
         beta_guess_strong = 89.9
         beta_strong = fsolve(self._theta_beta_m_relation, beta_guess_strong, args=(M1, theta))[0]
 
@@ -176,6 +180,133 @@ class ObliqueShockAnalyzer:
         p2_over_p1_strong = 1 + (2 * self.gamma / (self.gamma + 1)) * (M1n ** 2 - 1)
         return p2_over_p1_strong
 
+    # === Vectorized (array) methods ===
+    # Every array method takes an optional gamma (scalar or array broadcast with the other inputs);
+    # without it the instance gamma is used.
+    def max_theta_array(self, M1, gamma=None):
+        """
+        Closed-form maximum theta angle (and beta at max theta) for an array of Mach numbers.
+        Entries with M1 <= 1 are returned as NaN.
+        """
+        M1 = np.asarray(M1, dtype=float)
+        g = self._gamma(gamma)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            M1_sq = M1 ** 2
+            sin_sq = ((g + 1) / 4 * M1_sq - 1 +
+                      np.sqrt((g + 1) * ((g + 1) / 16 * M1_sq ** 2 + (g - 1) / 2 * M1_sq + 1))) / (g * M1_sq)
+            beta = np.where(M1 > 1, np.degrees(np.arcsin(np.sqrt(np.clip(sin_sq, 0.0, 1.0)))), np.nan)
+            theta = self.theta_from_beta(M1, beta, gamma)
+        return theta, beta
+
+    def _theta_beta_slope(self, M1, beta_deg, gamma=None):
+        """
+        Derivative d(theta)/d(beta) of the Theta-Beta-Mach relation (dimensionless).
+        """
+        beta = np.radians(beta_deg)
+        M1_sq = M1 ** 2
+        num = M1_sq * np.sin(beta) ** 2 - 1
+        den = M1_sq * (self._gamma(gamma) + np.cos(2 * beta)) + 2
+        tan_theta = 2 / np.tan(beta) * num / den
+        dnum = M1_sq * np.sin(2 * beta)
+        dden = -2 * M1_sq * np.sin(2 * beta)
+        dtan_theta = 2 * (-num / (np.sin(beta) ** 2 * den) + (dnum * den - num * dden) / (np.tan(beta) * den ** 2))
+        return dtan_theta / (1 + tan_theta ** 2)
+
+    def solve_beta_angle_array(self, M1, theta, strong=False, newton_steps=3, gamma=None):
+        """
+        Beta angle for arrays of Mach number and theta angle.
+        Closed-form cubic root, polished with Newton steps on the Theta-Beta-Mach relation
+        (the closed form loses accuracy for very small theta at high Mach numbers).
+        Entries with M1 <= 1, negative theta or theta above max theta are returned as NaN.
+        """
+        M1, theta = np.broadcast_arrays(np.asarray(M1, dtype=float), np.asarray(theta, dtype=float))
+        g = self._gamma(gamma)
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            M1_sq = M1 ** 2
+            tan_theta = np.tan(np.radians(theta))
+            a = 1 + (g - 1) / 2 * M1_sq
+            lam_sq = (M1_sq - 1) ** 2 - 3 * a * (1 + (g + 1) / 2 * M1_sq) * tan_theta ** 2
+            lam = np.sqrt(lam_sq)
+            chi = ((M1_sq - 1) ** 3 - 9 * a * (a + (g + 1) / 4 * M1_sq ** 2) * tan_theta ** 2) / lam ** 3
+            delta = 0 if strong else 1
+            tan_beta = (M1_sq - 1 + 2 * lam * np.cos((4 * np.pi * delta + np.arccos(np.clip(chi, -1.0, 1.0))) / 3)) / \
+                       (3 * a * tan_theta)
+            beta = np.degrees(np.arctan(tan_beta))
+            beta = np.where(tan_beta < 0, beta + 180.0, beta)
+
+            # Weak/strong branches are separated by beta at max theta
+            mach_angle = np.degrees(np.arcsin(1 / M1))
+            _, beta_star = self.max_theta_array(M1, gamma)
+            lower, upper = (beta_star, 90.0) if strong else (mach_angle, beta_star)
+
+            if not strong:
+                # Small-deflection (linear theory) guess, kept where it fits the relation better
+                beta_lin = mach_angle + (g + 1) * M1_sq / (4 * (M1_sq - 1)) * theta
+                residual = np.abs(self.theta_from_beta(M1, beta, gamma) - theta)
+                residual_lin = np.abs(self.theta_from_beta(M1, beta_lin, gamma) - theta)
+                beta = np.where(~(residual <= residual_lin), beta_lin, beta)
+            beta = np.clip(beta, lower, upper)
+
+            for _ in range(newton_steps):
+                slope = np.degrees(self._theta_beta_slope(M1, beta, gamma)) / np.degrees(1.0)
+                step = (self.theta_from_beta(M1, beta, gamma) - theta) / slope
+                beta = np.where(np.abs(slope) > 1e-8, np.clip(beta - step, lower, upper), beta)
+
+            # Zero deflection: Mach wave (weak) or normal shock (strong)
+            zero_beta = 90.0 if strong else mach_angle
+            beta = np.where(theta == 0, zero_beta, beta)
+
+        valid = (M1 > 1) & (theta >= 0) & (lam_sq >= 0) & ~(np.abs(chi) > 1 + 1e-9)
+        return np.where(valid, beta, np.nan)
+
+    def pressure_ratio_array(self, M1, theta_deg, gamma=None):
+        """
+        Vectorized pressure ratio after an oblique shock (NaN where no attached shock exists).
+        """
+        g = self._gamma(gamma)
+        beta = np.radians(self.solve_beta_angle_array(M1, theta_deg, gamma=gamma))
+        M1n = M1 * np.sin(beta)
+        return 1 + (2 * g / (g + 1)) * (M1n ** 2 - 1)
+
+    def shock_relations_array(self, M1, beta_deg, theta_deg, gamma=None):
+        """
+        Flow property ratios across an oblique shock for arrays of Mach, beta and theta angles.
+        """
+        g = self._gamma(gamma)
+        beta = np.radians(beta_deg)
+        theta = np.radians(theta_deg)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            Mn1_sq = (M1 * np.sin(beta)) ** 2
+            p_ratio = 1 + (2 * g / (g + 1)) * (Mn1_sq - 1)
+            rho_ratio = ((g + 1) * Mn1_sq) / ((g - 1) * Mn1_sq + 2)
+            T_ratio = p_ratio / rho_ratio
+            Mn2 = np.sqrt((1 + (g - 1) / 2 * Mn1_sq) / (g * Mn1_sq - (g - 1) / 2))
+            M2 = Mn2 / np.sin(beta - theta)
+            pt_ratio = rho_ratio ** (g / (g - 1)) * ((g + 1) / (2 * g * Mn1_sq - (g - 1))) ** (1 / (g - 1))
+
+        return {
+            'output_mach': M2,
+            'pressure_ratio': p_ratio,
+            'temperature_ratio': T_ratio,
+            'density_ratio': rho_ratio,
+            'total_pressure_ratio': pt_ratio
+        }
+
+    def complete_analysis_array(self, M1, theta_deg, gamma=None):
+        """
+        Vectorized counterpart of complete_analysis; infeasible entries are NaN instead of an error.
+        """
+        M1, theta_deg = np.broadcast_arrays(np.asarray(M1, dtype=float), np.asarray(theta_deg, dtype=float))
+        beta = self.solve_beta_angle_array(M1, theta_deg, gamma=gamma)
+
+        results = {
+            'input_mach': M1,
+            'theta_angle': theta_deg,
+            'beta_angle': beta
+        }
+        results.update(self.shock_relations_array(M1, beta, theta_deg, gamma))
+        return results
+
 
 # Usage example
 if __name__ == "__main__":
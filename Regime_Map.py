@@ -0,0 +1,165 @@
+import numpy as np
+from Same_Family_Shock_Solver import classify_same_family, REGIME_NAMES
+
+# Parameters of the same-family solver that can be used as map axes
+AXES = ("Mach_inlet", "Theta", "Theta_plus")
+
+
+def trace_regime_boundaries(x_axis, x_range, y_axis, y_range, fixed_value, initial_grid=16, resolution=0.01,
+                            edge_bisections=4, verbose=False):
+    """
+    Trace flow-regime boundaries (expansion / reflected shock / detachment) in a 2D slice of
+    (Mach_inlet, Theta, Theta_plus) space with adaptive quadtree refinement.
+
+    x_axis and y_axis are two of AXES, the third one is held at fixed_value. Starting from an
+    initial_grid x initial_grid cell grid, only cells whose corners have different regimes are split,
+    until the cell size is at most resolution (axis units, scalar or (dx, dy)). Every refinement
+    level is labelled in one classify_same_family call, so no pressure match is solved. Boundary
+    crossings on the finest cell edges are then located with edge_bisections bisection steps and
+    chained into polylines.
+
+    Features smaller than the initial grid spacing may be missed.
+    Returns {'boundaries': [...], 'evaluations': int, 'cell_size': (dx, dy)}.
+    """
+    if x_axis not in AXES or y_axis not in AXES or x_axis == y_axis:
+        raise ValueError(f"x_axis and y_axis must be two different names from {AXES}.")
+    fixed_axis = [axis for axis in AXES if axis not in (x_axis, y_axis)][0]
+
+    x0, x1 = map(float, x_range)
+    y0, y1 = map(float, y_range)
+    dx_req, dy_req = np.broadcast_to(np.asarray(resolution, dtype=float), (2,))
+    levels = int(max(0, np.ceil(np.log2(max((x1 - x0) / (initial_grid * dx_req),
+                                                (y1 - y0) / (initial_grid * dy_req))))))
+    scale = 2 ** levels
+    n_fine = initial_grid * scale
+    dx = (x1 - x0) / n_fine
+    dy = (y1 - y0) / n_fine
+
+    labels = {}
+    evaluations = 0
+
+    def classify(x, y):
+        nonlocal evaluations
+        evaluations += len(x)
+        params = {x_axis: x, y_axis: y, fixed_axis: fixed_value}
+        return classify_same_family(params["Mach_inlet"], params["Theta"], params["Theta_plus"])
+
+    def evaluate_lattice(points):
+        missing = [p for p in points if p not in labels]
+        if missing:
+            ij = np.array(missing)
+            for p, label in zip(missing, classify(x0 + ij[:, 0] * dx, y0 + ij[:, 1] * dy)):
+                labels[p] = int(label)
+
+    def corners(cell):
+        i, j, size = cell
+        return [(i, j), (i + size, j), (i, j + size), (i + size, j + size)]
+
+    # === Quadtree refinement ===
+    cells = [(i * scale, j * scale, scale) for i in range(initial_grid) for j in range(initial_grid)]
+    final_cells = []
+    size = scale
+    for level in range(levels + 1):
+        evaluate_lattice({p for cell in cells for p in corners(cell)})
+        mixed = [cell for cell in cells if len({labels[p] for p in corners(cell)}) > 1]
+        if verbose:
+            print(f"🔄 Level {level}: {len(cells)} cells, {len(mixed)} on a boundary, {evaluations} evaluations")
+        if level == levels:
+            final_cells = mixed
+            break
+        if not mixed:
+            # No cell straddles a boundary: nothing left to refine
+            break
+        size //= 2
+        cells = [(i + a * size, j + b * size, size) for i, j, _ in mixed for a in (0, 1) for b in (0, 1)]
+
+    # === Boundary crossings on the finest cell edges ===
+    edges = {}
+    for i, j, _ in final_cells:
+        for key in ((i, j, 0), (i, j + 1, 0), (i, j, 1), (i + 1, j, 1)):
+            ei, ej, vertical = key
+            start, end = (ei, ej), (ei, ej + 1) if vertical else (ei + 1, ej)
+            if labels[start] != labels[end]:
+                edges[key] = (labels[start], labels[end])
+
+    keys = list(edges)
+    t_lo = np.zeros(len(keys))
+    t_hi = np.ones(len(keys))
+    if keys:
+        base = np.array([(k[0], k[1]) for k in keys], dtype=float)
+        direction = np.array([(0, 1) if k[2] else (1, 0) for k in keys], dtype=float)
+        start_labels = np.array([edges[k][0] for k in keys])
+        for _ in range(edge_bisections):
+            t_mid = 0.5 * (t_lo + t_hi)
+            mid = base + direction * t_mid[:, None]
+            same = classify(x0 + mid[:, 0] * dx, y0 + mid[:, 1] * dy) == start_labels
+            t_lo = np.where(same, t_mid, t_lo)
+            t_hi = np.where(same, t_hi, t_mid)
+        t = 0.5 * (t_lo + t_hi)
+        positions = base + direction * t[:, None]
+        crossing = {k: (x0 + p[0] * dx, y0 + p[1] * dy) for k, p in zip(keys, positions)}
+    else:
+        crossing = {}
+
+    # === Segments per regime pair, chained into polylines ===
+    segments = {}
+    for i, j, _ in final_cells:
+        cell_edges = [(i, j, 0), (i + 1, j, 1), (i, j + 1, 0), (i, j, 1)]  # counter-clockwise
+        by_pair = {}
+        for key in cell_edges:
+            if key in edges:
+                by_pair.setdefault(tuple(sorted(edges[key])), []).append(key)
+        for pair, pair_edges in by_pair.items():
+            for a, b in zip(pair_edges[0::2], pair_edges[1::2]):
+                segments.setdefault(pair, []).append((a, b))
+
+    boundaries = []
+    for pair, pair_segments in segments.items():
+        neighbours = {}
+        for a, b in pair_segments:
+            neighbours.setdefault(a, []).append(b)
+            neighbours.setdefault(b, []).append(a)
+
+        visited = set()
+        # Start from open ends first so that open curves are not split
+        starts = [k for k, v in neighbours.items() if len(v) == 1] + list(neighbours)
+        for start in starts:
+            if start in visited:
+                continue
+            chain = [start]
+            visited.add(start)
+            current = start
+            while True:
+                nxt = [k for k in neighbours[current] if k not in visited]
+                if not nxt:
+                    break
+                current = nxt[0]
+                visited.add(current)
+                chain.append(current)
+            points = np.array([crossing[k] for k in chain])
+            boundaries.append({
+                'regimes': pair,
+                'names': (REGIME_NAMES[pair[0]], REGIME_NAMES[pair[1]]),
+                x_axis: points[:, 0],
+                y_axis: points[:, 1]
+            })
+
+    return {
+        'boundaries': boundaries,
+        'evaluations': evaluations,
+        'cell_size': (dx, dy)
+    }
+
+
+# Usage example
+if __name__ == "__main__":
+    # Theta / Theta_plus map at Mach 3
+    regime_map = trace_regime_boundaries("Theta", (0.5, 30.0), "Theta_plus", (0.5, 30.0), 3.0,
+                                         initial_grid=16, resolution=0.02, verbose=True)
+
+    n_fine = int(round(29.5 / regime_map['cell_size'][0])) + 1
+    print(f"Evaluations: {regime_map['evaluations']} (uniform grid at the same resolution: {n_fine ** 2})")
+    for boundary in regime_map['boundaries']:
+        print(f"{boundary['names'][0]} | {boundary['names'][1]}: {len(boundary['Theta'])} points, "
+              f"Theta {boundary['Theta'].min():.3f}-{boundary['Theta'].max():.3f}°, "
+              f"Theta_plus {boundary['Theta_plus'].min():.3f}-{boundary['Theta_plus'].max():.3f}°")
@@ -0,0 +1,276 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import numpy as np
+from Oblique_Shock_Solver import ObliqueShockAnalyzer
+from Expansion_Wave_Solver import PrandtlMeyerExpansion
+from Same_Family_Shock_Solver import (Intersection_of_Shock_Waves_Same_Family,
+                                      Intersection_of_Shock_Waves_Same_Family_Batch, BATCH_RESULT_FIELDS,
+                                      SAME_FAMILY_TUPLE_FIELDS, save_to_csv, results_record)
+
+DEFAULT_CACHE_PATH = os.path.join(".solver_cache", "results.sqlite")
+
+# Source files whose content defines the solver version (any edit invalidates the cached results)
+SOLVER_SOURCES = ("Same_Family_Shock_Solver.py", "Oblique_Shock_Solver.py", "Expansion_Wave_Solver.py")
+
+# Fields of a cached batch row (stored as one float64 blob)
+BATCH_CACHE_FIELDS = BATCH_RESULT_FIELDS + ("Case",)
+
+# Approximate per-row storage overhead added to the value size for eviction
+ROW_OVERHEAD = 64
+
+
+def solver_version():
+    """Short hash of the solver source files"""
+    digest = hashlib.sha256()
+    folder = os.path.dirname(os.path.abspath(__file__))
+    for name in SOLVER_SOURCES:
+        with open(os.path.join(folder, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+class SolverResultCache:
+    """
+    Persistent SQLite cache of same-family results, shared across sessions and processes.
+
+    Rows are keyed on the solver kind, the solver-version hash, gamma and the inputs quantized to
+    `decimals` decimal places; the cached value is the result at the quantized inputs, so every
+    process sees the same answer for a key. The database runs in WAL mode with a busy timeout, so
+    several processes can read and write it at the same time. When the stored values exceed
+    max_bytes, the least recently used rows are evicted.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=256 * 1024 ** 2, decimals=6, timeout=30.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.decimals = decimals
+        self.timeout = timeout
+        self.version = solver_version()
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+
+    # === Connection ===
+    @property
+    def connection(self):
+        """Connection of the current process (reopened after a fork)"""
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout)
+            self._pid = os.getpid()
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            # Rows removed by INSERT OR REPLACE must fire the delete trigger that keeps the totals
+            self._connection.execute("PRAGMA recursive_triggers=ON")
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "kind TEXT NOT NULL, version TEXT NOT NULL, gamma INTEGER NOT NULL, "
+                    "mach INTEGER NOT NULL, theta INTEGER NOT NULL, theta_plus INTEGER NOT NULL, "
+                    "value BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)")
+                self._connection.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS results_key "
+                    "ON results (kind, version, gamma, mach, theta, theta_plus)")
+                self._connection.execute("CREATE INDEX IF NOT EXISTS results_access ON results (last_access)")
+                # Running row count and stored bytes, updated in the same transaction as every write
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS stats (id INTEGER PRIMARY KEY CHECK (id = 0), "
+                    "rows INTEGER NOT NULL, bytes INTEGER NOT NULL)")
+                self._connection.execute(
+                    "INSERT OR IGNORE INTO stats SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM results")
+                self._connection.execute(
+                    "CREATE TRIGGER IF NOT EXISTS results_insert AFTER INSERT ON results BEGIN "
+                    "UPDATE stats SET rows = rows + 1, bytes = bytes + NEW.size WHERE id = 0; END")
+                self._connection.execute(
+                    "CREATE TRIGGER IF NOT EXISTS results_delete AFTER DELETE ON results BEGIN "
+                    "UPDATE stats SET rows = rows - 1, bytes = bytes - OLD.size WHERE id = 0; END")
+        return self._connection
+
+    def close(self):
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def __getstate__(self):
+        # Connections are not shared between processes
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        state['_pid'] = None
+        return state
+
+    # === Keys ===
+    def quantize(self, values):
+        """Integer key of float inputs"""
+        return np.rint(np.asarray(values, dtype=float) * 10 ** self.decimals).astype(np.int64)
+
+    def dequantize(self, keys):
+        """Inputs at which a key is solved"""
+        return np.asarray(keys, dtype=float) / 10 ** self.decimals
+
+    # === Storage ===
+    def get_many(self, kind, gamma, mach_keys, theta_keys, theta_plus_keys):
+        """Cached values (or None) for arrays of quantized inputs; gamma is a scalar or one value per case"""
+        connection = self.connection
+        gamma_keys = self.quantize(np.broadcast_to(gamma, np.shape(mach_keys)))
+        values = [None] * len(mach_keys)
+        with connection:
+            connection.execute("DROP TABLE IF EXISTS temp.query")
+            connection.execute("CREATE TEMP TABLE query "
+                               "(i INTEGER, gamma INTEGER, mach INTEGER, theta INTEGER, theta_plus INTEGER)")
+            connection.executemany("INSERT INTO query VALUES (?, ?, ?, ?, ?)",
+                                   zip(range(len(mach_keys)), map(int, gamma_keys), map(int, mach_keys),
+                                       map(int, theta_keys), map(int, theta_plus_keys)))
+            rows = connection.execute(
+                "SELECT q.i, r.rowid, r.value FROM query q CROSS JOIN results r "
+                "ON r.kind = ? AND r.version = ? AND r.gamma = q.gamma "
+                "AND r.mach = q.mach AND r.theta = q.theta AND r.theta_plus = q.theta_plus",
+                (kind, self.version)).fetchall()
+            if rows:
+                now = time.time()
+                connection.executemany("UPDATE results SET last_access = ? WHERE rowid = ?",
+                                       [(now, rowid) for _, rowid, _ in rows])
+        for i, _, value in rows:
+            values[i] = value
+        found = len(rows)
+        self.hits += found
+        self.misses += len(mach_keys) - found
+        return values
+
+    def put_many(self, kind, gamma, mach_keys, theta_keys, theta_plus_keys, values):
+        """Store values for arrays of quantized inputs, then evict if the size limit is exceeded"""
+        gamma_keys = self.quantize(np.broadcast_to(gamma, np.shape(mach_keys)))
+        now = time.time()
+        rows = [(kind, self.version, int(g), int(m), int(t), int(tp), value, len(value) + ROW_OVERHEAD, now)
+                for g, m, t, tp, value in zip(gamma_keys, mach_keys, theta_keys, theta_plus_keys, values)]
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        if self.max_bytes is not None:
+            self.evict(self.max_bytes)
+
+    def size(self):
+        """(rows, stored bytes), from the running totals"""
+        count, total = self.connection.execute("SELECT rows, bytes FROM stats WHERE id = 0").fetchone()
+        return count, total
+
+    def evict(self, max_bytes):
+        """Delete the least recently used rows until the stored size is at most 90% of max_bytes"""
+        removed = 0
+        with self.connection:
+            count, total = self.size()
+            while total > max_bytes * (0.9 if removed else 1.0) and count > 0:
+                # Rows to drop at the mean row size (rows are similar in size, so usually one pass)
+                n = max(1, int(np.ceil((total - 0.9 * max_bytes) * count / total)))
+                removed += self.connection.execute(
+                    "DELETE FROM results WHERE rowid IN "
+                    "(SELECT rowid FROM results ORDER BY last_access LIMIT ?)", (n,)).rowcount
+                count, total = self.size()
+        return removed
+
+    def clear(self):
+        """Remove every cached row"""
+        with self.connection:
+            self.connection.execute("DELETE FROM results")
+
+    def purge_stale(self):
+        """Remove rows written by other solver versions"""
+        with self.connection:
+            return self.connection.execute("DELETE FROM results WHERE version != ?", (self.version,)).rowcount
+
+
+def cached_same_family(cache, Mach_inlet, Theta, Theta_plus, ITER_NUM=1000, save_results=False, verbose=False,
+                       gamma=1.4):
+    """
+    Intersection_of_Shock_Waves_Same_Family through the cache (same return tuple).
+    Misses are solved at the quantized inputs; errors raised by the solver are not cached.
+    Hits write results.csv (save_results) and print the results (verbose) like a solve would.
+    """
+    start_time = time.time()
+    keys = [cache.quantize([value]) for value in (Mach_inlet, Theta, Theta_plus)]
+    kind = f"scalar:{ITER_NUM}"
+    value = cache.get_many(kind, gamma, *keys)[0]
+    if value is not None:
+        result = tuple(json.loads(value))
+        if save_results or verbose:
+            values = {field: result[position] for field, position in SAME_FAMILY_TUPLE_FIELDS.items()}
+            values.update({"Inlet Mach": result[0], "First Ramp Angle": result[1], "Ramp Increase Angle": result[2],
+                           "Iteration Count": result[-1]})
+            record = results_record(result[27], values, time.time() - start_time)
+            if verbose:
+                for key, field_value in record.items():
+                    print(f"{key}: {field_value}")
+            if save_results:
+                save_to_csv(record)
+        return result
+
+    inputs = [float(cache.dequantize(key[0])) for key in keys]
+    result = Intersection_of_Shock_Waves_Same_Family(*inputs, ITER_NUM=ITER_NUM, save_results=save_results,
+                                                     verbose=verbose, gamma=gamma)
+    result = tuple(v.item() if isinstance(v, np.generic) else v for v in result)
+    cache.put_many(kind, gamma, *keys, [json.dumps(result).encode()])
+    return result
+
+
+def cached_same_family_batch(cache, Mach_inlet, Theta, Theta_plus, analyzer_obs=None, analyzer_pm=None,
+                             gamma=None):
+    """
+    Intersection_of_Shock_Waves_Same_Family_Batch through the cache (same result dict).
+    Only the cases missing from the cache are solved, in one batch call. gamma (None for the
+    analyzer gamma) broadcasts with the inputs and is part of every key.
+    """
+    analyzer_obs = ObliqueShockAnalyzer() if analyzer_obs is None else analyzer_obs
+    analyzer_pm = PrandtlMeyerExpansion() if analyzer_pm is None else analyzer_pm
+    gamma = analyzer_obs.gamma if gamma is None else gamma
+    Mach_inlet, Theta, Theta_plus, gamma = np.broadcast_arrays(np.asarray(Mach_inlet, dtype=float),
+                                                               np.asarray(Theta, dtype=float),
+                                                               np.asarray(Theta_plus, dtype=float),
+                                                               np.asarray(gamma, dtype=float))
+    shape = Mach_inlet.shape
+    keys = [cache.quantize(a.ravel()) for a in (Mach_inlet, Theta, Theta_plus)]
+    gamma_keys = cache.quantize(gamma.ravel())
+
+    values = cache.get_many("batch", cache.dequantize(gamma_keys), *keys)
+    table = np.full((len(values), len(BATCH_CACHE_FIELDS)), np.nan)
+    missing = np.array([value is None for value in values], dtype=bool)
+    for i, value in enumerate(values):
+        if value is not None:
+            table[i] = np.frombuffer(value, dtype=np.float64)
+
+    if missing.any():
+        inputs = [cache.dequantize(key[missing]) for key in keys]
+        gamma_missing = cache.dequantize(gamma_keys[missing])
+        solved = Intersection_of_Shock_Waves_Same_Family_Batch(*inputs, analyzer_obs=analyzer_obs,
+                                                               analyzer_pm=analyzer_pm, gamma=gamma_missing)
+        rows = np.column_stack([np.ravel(solved[field]).astype(float) for field in BATCH_CACHE_FIELDS])
+        table[missing] = rows
+        cache.put_many("batch", gamma_missing, *(key[missing] for key in keys), [row.tobytes() for row in rows])
+
+    results = {field: table[:, f].reshape(shape) for f, field in enumerate(BATCH_CACHE_FIELDS)}
+    results["Case"] = results["Case"].astype(int)
+    return results
+
+
+# Usage example
+if __name__ == "__main__":
+    result_cache = SolverResultCache()
+
+    start = time.perf_counter()
+    first = cached_same_family(result_cache, 3.0, 10.0, 8.0)
+    middle = time.perf_counter()
+    second = cached_same_family(result_cache, 3.0, 10.0, 8.0)
+    end = time.perf_counter()
+    print(f"Scalar solve: {middle - start:.3f} s, cached lookup: {(end - middle) * 1000:.2f} ms, "
+          f"Theta = {second[28]:.5f}°")
+
+    M_grid, T1_grid, T2_grid = np.meshgrid(np.linspace(2.0, 5.0, 20), np.linspace(2.0, 15.0, 20),
+                                           np.linspace(2.0, 15.0, 20), indexing='ij')
+    for attempt in ("cold", "warm"):
+        start = time.perf_counter()
+        batch = cached_same_family_batch(result_cache, M_grid, T1_grid, T2_grid)
+        print(f"{attempt} batch of {M_grid.size} cases: {time.perf_counter() - start:.3f} s")
+    rows, stored = result_cache.size()
+    print(f"✅ Cache: {rows} rows, {stored / 1024:.0f} kB, {result_cache.hits} hits, {result_cache.misses} misses")
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from Same_Family_Shock_Solver import (Intersection_of_Shock_Waves_Same_Family_Batch, BATCH_RESULT_FIELDS,
+                                      CASE_NO_SOLUTION)
+
+METADATA_FILE = "store.json"
+
+
+def _input_fingerprint(Mach_inlet, Theta, Theta_plus):
+    """Hash of the flattened sweep inputs (identifies the sweep a store was created for)"""
+    digest = hashlib.sha256()
+    for values in (Mach_inlet, Theta, Theta_plus):
+        digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def _column_file(field):
+    """File name of a column ("P2/P1" -> "P2_over_P1.npy")"""
+    return field.replace("/", "_over_").replace(" ", "_").replace("(", "").replace(")", "") + ".npy"
+
+
+class SweepResultStore:
+    """
+    Column store for large same-family sweeps.
+
+    Every field is a preallocated, memory-mapped .npy file in one directory, so several processes
+    can write disjoint row slices of the same store and post-processing can open single columns
+    lazily without loading the rest. Float fields use the selected precision (float64 or float32);
+    "Case" is stored as int8 (CASE_NO_SOLUTION until written) and "Done" marks rows that have been written.
+    """
+
+    def __init__(self, path, mode='r'):
+        """
+        Open an existing store ('r' read-only, 'r+' read/write)
+        """
+        self.path = path
+        self.mode = mode
+        with open(os.path.join(path, METADATA_FILE), encoding='utf-8') as f:
+            self.metadata = json.load(f)
+        self._columns = {}
+
+    @classmethod
+    def create(cls, path, n_cases, dtype='float64', fields=BATCH_RESULT_FIELDS, fingerprint=None):
+        """
+        Create a store for n_cases rows and return it opened in 'r+' mode.
+        fingerprint (the hash of the sweep inputs) is kept in the metadata to check resumed sweeps.
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be float32 or float64.")
+
+        os.makedirs(path, exist_ok=True)
+        columns = {field: {'file': _column_file(field), 'dtype': dtype.name} for field in fields}
+        columns["Case"] = {'file': "Case.npy", 'dtype': 'int8'}
+        columns["Done"] = {'file': "Done.npy", 'dtype': 'uint8'}
+
+        for field, column in columns.items():
+            array = np.lib.format.open_memmap(os.path.join(path, column['file']), mode='w+',
+                                              dtype=column['dtype'], shape=(n_cases,))
+            array[:] = {"Case": CASE_NO_SOLUTION, "Done": 0}.get(field, np.nan)
+            array.flush()
+            del array
+
+        with open(os.path.join(path, METADATA_FILE), "w", encoding='utf-8') as f:
+            json.dump({'n_cases': n_cases, 'dtype': dtype.name, 'fingerprint': fingerprint, 'columns': columns}, f,
+                      indent=2)
+        return cls(path, mode='r+')
+
+    def __len__(self):
+        return self.metadata['n_cases']
+
+    @property
+    def fields(self):
+        return list(self.metadata['columns'])
+
+    def __getitem__(self, field):
+        """Memory-mapped column (opened on first access)"""
+        if field not in self._columns:
+            column = self.metadata['columns'][field]
+            self._columns[field] = np.load(os.path.join(self.path, column['file']), mmap_mode=self.mode)
+        return self._columns[field]
+
+    def write(self, start, results):
+        """Write a batch result dict into rows [start, start + n) and mark them as done"""
+        n = len(np.ravel(results["Case"]))
+        for field in self.fields:
+            if field in results:
+                self[field][start:start + n] = np.ravel(results[field])
+        self["Done"][start:start + n] = 1
+
+    def flush(self):
+        """Flush the opened columns to disk"""
+        for column in self._columns.values():
+            if isinstance(column, np.memmap):
+                column.flush()
+
+    def pending_slices(self, chunk_size):
+        """(start, stop) row ranges of chunk_size that are not completely written yet"""
+        done = self["Done"]
+        return [(start, min(start + chunk_size, len(self))) for start in range(0, len(self), chunk_size)
+                if not done[start:start + chunk_size].all()]
+
+    def to_dict(self, fields=None, rows=slice(None)):
+        """Load the selected fields and rows into memory"""
+        fields = self.fields if fields is None else fields
+        return {field: np.array(self[field][rows]) for field in fields}
+
+
+def _solve_into_store(path, start, Mach_inlet, Theta, Theta_plus):
+    """Process-pool worker: solve one slice and write it straight into the store"""
+    store = SweepResultStore(path, mode='r+')
+    store.write(start, Intersection_of_Shock_Waves_Same_Family_Batch(Mach_inlet, Theta, Theta_plus))
+    store.flush()
+    return start, len(Mach_inlet)
+
+
+def run_sweep_to_store(path, Mach_inlet, Theta, Theta_plus, dtype='float64', chunk_size=50000, workers=1,
+                       verbose=False):
+    """
+    Solve a sweep into a (new or partially written) SweepResultStore.
+    Inputs are broadcast and flattened; with workers > 1 each process writes its own row slices.
+    Slices already marked as done are skipped, so an interrupted sweep can be run again. An existing
+    store is only resumed if it was created for the same inputs and dtype; otherwise a ValueError
+    is raised (delete the store directory to start over).
+    """
+    Mach_inlet, Theta, Theta_plus = (a.ravel() for a in np.broadcast_arrays(np.asarray(Mach_inlet, dtype=float),
+                                                                           np.asarray(Theta, dtype=float),
+                                                                           np.asarray(Theta_plus, dtype=float)))
+    fingerprint = _input_fingerprint(Mach_inlet, Theta, Theta_plus)
+    if os.path.exists(os.path.join(path, METADATA_FILE)):
+        store = SweepResultStore(path, mode='r+')
+        if len(store) != len(Mach_inlet):
+            raise ValueError(f"Existing store has {len(store)} rows, the sweep has {len(Mach_inlet)} cases.")
+        if store.metadata['dtype'] != np.dtype(dtype).name:
+            raise ValueError(f"Existing store uses {store.metadata['dtype']}, "
+                             f"the sweep asks for {np.dtype(dtype).name}.")
+        if store.metadata.get('fingerprint') != fingerprint:
+            raise ValueError(f"Existing store '{path}' was created for different sweep inputs.")
+    else:
+        store = SweepResultStore.create(path, len(Mach_inlet), dtype=dtype, fingerprint=fingerprint)
+
+    slices = store.pending_slices(chunk_size)
+    if workers <= 1:
+        for start, stop in slices:
+            store.write(start, Intersection_of_Shock_Waves_Same_Family_Batch(Mach_inlet[start:stop],
+                                                                             Theta[start:stop],
+                                                                             Theta_plus[start:stop]))
+            if verbose:
+                print(f"🔄 Rows {start}-{stop} written.")
+        store.flush()
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_solve_into_store, path, start, Mach_inlet[start:stop], Theta[start:stop],
+                                       Theta_plus[start:stop]) for start, stop in slices]
+            for future in futures:
+                start, n = future.result()
+                if verbose:
+                    print(f"🔄 Rows {start}-{start + n} written.")
+
+    return SweepResultStore(path, mode='r')
+
+
+# Usage example
+if __name__ == "__main__":
+    # 1,000,000-case sweep stored in float32 columns by 4 processes
+    M_grid, T1_grid, T2_grid = np.meshgrid(np.linspace(2.0, 5.0, 100), np.linspace(2.0, 15.0, 100),
+                                           np.linspace(2.0, 15.0, 100), indexing='ij')
+    sweep_store = run_sweep_to_store("sweep_store", M_grid, T1_grid, T2_grid, dtype='float32', workers=4,
+                                     verbose=True)
+
+    # Lazy post-processing: only the needed columns are read from disk
+    pt4 = sweep_store["Pt4/Pt1"]
+    best = int(np.nanargmax(pt4))
+    print(f"Rows: {len(sweep_store)}, solved: {int(np.count_nonzero(sweep_store['Case'] >= 0))}")
+    print(f"Best Pt4/Pt1 = {pt4[best]:.4f} at M = {sweep_store['Inlet Mach'][best]:.3f}, "
+          f"Theta1 = {sweep_store['First Ramp Angle'][best]:.3f}°, "
+          f"Theta2 = {sweep_store['Ramp Increase Angle'][best]:.3f}°")
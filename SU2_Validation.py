@@ -0,0 +1,159 @@
+import argparse
+import sys
+import numpy as np
+from Same_Family_Shock_Solver import Intersection_of_Shock_Waves_Same_Family_Batch
+from Flow_Regions import REGION_NAMES, region_states, wave_geometry, assign_regions, wave_distance
+
+# Accepted SU2 CSV column names (volume/surface output with TABULAR_FORMAT = CSV)
+SU2_COLUMN_ALIASES = {
+    "x": ("x", "X", "Points:0", "Points_x"),
+    "y": ("y", "Y", "Points:1", "Points_y"),
+    "Pressure": ("Pressure",),
+    "Temperature": ("Temperature",),
+    "Density": ("Density", "Conservative_1"),
+    "Mach": ("Mach", "Mach_Number")
+}
+
+# Flow variable -> solver region state field
+COMPARED_FIELDS = {"Pressure": "P/P1", "Temperature": "T/T1", "Density": "rho/rho1", "Mach": "Mach"}
+
+
+def _su2_columns(path):
+    """SU2 column name of each variable found in the header (x and y are required)"""
+    with open(path, encoding="utf-8") as f:
+        header = [name.strip().strip('"').strip() for name in f.readline().split(",")]
+    columns = {}
+    for variable, aliases in SU2_COLUMN_ALIASES.items():
+        name = next((alias for alias in aliases if alias in header), None)
+        if name is not None:
+            columns[variable] = name
+    if "x" not in columns or "y" not in columns:
+        raise ValueError(f"Point coordinates (x, y) not found in the header of '{path}'.")
+    if not any(variable in columns for variable in COMPARED_FIELDS):
+        raise ValueError(f"None of {', '.join(COMPARED_FIELDS)} found in the header of '{path}'.")
+    return columns
+
+
+def validate_su2_csv(path, result, ramp_length=1.0, corner=(0.0, 0.0), freestream=None, exclusion_band=0.0,
+                     chunk_size=500000):
+    """
+    Compare an SU2 CSV solution with one same-family result (batch result dict), streaming the file.
+
+    The file is read chunk_size rows at a time (only the coordinate and flow columns), each point
+    is assigned to a region with the half-plane tests of Flow_Regions (ramp geometry from
+    ramp_length and corner, in the CFD mesh units), and per-region counts, sums and sums of squares
+    are accumulated, so memory does not depend on the file size. Points closer than
+    exclusion_band to a wave line (where CFD smears the discontinuities) and expansion-fan points
+    are left out of the means.
+
+    Ratios are taken relative to freestream ({"Pressure": p1, "Temperature": T1, "Density": rho1})
+    or, without it, to the region 1 means of the file. Returns a dict with the point counts and,
+    per region 1-5, the CFD mean/std ratios, the solver values and the relative errors.
+    """
+    import pandas as pd
+
+    geometry = wave_geometry(result, ramp_length=ramp_length, corner=corner)
+    solver = region_states(result)
+    columns = _su2_columns(path)
+    variables = [variable for variable in COMPARED_FIELDS if variable in columns]
+    names = {name: variable for variable, name in columns.items()}
+
+    n_labels = max(REGION_NAMES) + 1
+    counts = np.zeros(n_labels, dtype=np.int64)
+    sums = {variable: np.zeros(n_labels) for variable in variables}
+    squares = {variable: np.zeros(n_labels) for variable in variables}
+    total = excluded = 0
+
+    reader = pd.read_csv(path, chunksize=chunk_size, skipinitialspace=True, usecols=list(names),
+                         dtype={name: np.float64 for name in names})
+    for chunk in reader:
+        chunk = chunk.rename(columns=names)
+        x = chunk["x"].to_numpy()
+        y = chunk["y"].to_numpy()
+        region = assign_regions(x, y, geometry)
+        total += len(region)
+        if exclusion_band > 0:
+            near = wave_distance(x, y, geometry) < exclusion_band
+            excluded += int(np.count_nonzero(near))
+            region = np.where(near, -1, region)
+        keep = region >= 0
+        labels = region[keep]
+        counts += np.bincount(labels, minlength=n_labels)
+        for variable in variables:
+            values = chunk[variable].to_numpy()[keep]
+            sums[variable] += np.bincount(labels, weights=values, minlength=n_labels)
+            squares[variable] += np.bincount(labels, weights=values * values, minlength=n_labels)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = {variable: sums[variable] / counts for variable in variables}
+        stds = {variable: np.sqrt(np.maximum(squares[variable] / counts - means[variable] ** 2, 0.0))
+                for variable in variables}
+
+    # Reference (region 1) state; Mach is compared directly
+    reference = {variable: 1.0 if variable == "Mach" else
+                 float((freestream or {}).get(variable, means[variable][1])) for variable in variables}
+
+    regions = {}
+    for region in range(1, 6):
+        cfd = {COMPARED_FIELDS[v]: means[v][region] / reference[v] for v in variables}
+        cfd_std = {COMPARED_FIELDS[v]: stds[v][region] / reference[v] for v in variables}
+        expected = {COMPARED_FIELDS[v]: solver[region][COMPARED_FIELDS[v]] for v in variables}
+        regions[region] = {
+            'name': REGION_NAMES[region],
+            'count': int(counts[region]),
+            'cfd': cfd,
+            'cfd_std': cfd_std,
+            'solver': expected,
+            'relative_error': {field: (cfd[field] - expected[field]) / expected[field] for field in cfd}
+        }
+
+    return {
+        'points': total,
+        'excluded': excluded,
+        'fan_points': int(counts[max(REGION_NAMES)]),
+        'solid_points': int(counts[0]),
+        'reference': reference,
+        'regions': regions
+    }
+
+
+def format_validation(report):
+    """Markdown table of a validate_su2_csv report"""
+    fields = list(next(iter(report['regions'].values()))['cfd'])
+    lines = [f"Points: {report['points']} (excluded near waves: {report['excluded']}, "
+             f"expansion fan: {report['fan_points']}, solid: {report['solid_points']})", "",
+             "| Region | Points | " + " | ".join(f"{f} CFD | {f} solver | {f} error %" for f in fields) + " |",
+             "|---|---|" + "---|---|---|" * len(fields)]
+    for region, entry in report['regions'].items():
+        cells = [f"{entry['cfd'][f]:.4f} | {entry['solver'][f]:.4f} | {100 * entry['relative_error'][f]:+.2f}"
+                 for f in fields]
+        lines.append(f"| {region} | {entry['count']} | " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate an SU2 CSV solution against the same-family solver.")
+    parser.add_argument("input", help="SU2 volume or surface output in CSV format")
+    parser.add_argument("--mach", type=float, required=True, help="inlet Mach number")
+    parser.add_argument("--theta", type=float, required=True, help="first ramp angle (degrees)")
+    parser.add_argument("--theta-plus", type=float, required=True, help="ramp increase angle (degrees)")
+    parser.add_argument("--ramp-length", type=float, default=1.0, help="length of the first ramp (mesh units)")
+    parser.add_argument("--corner", type=float, nargs=2, default=(0.0, 0.0), help="first ramp corner (x y)")
+    parser.add_argument("--band", type=float, default=0.0, help="exclude points this close to a wave line")
+    parser.add_argument("--chunk-size", type=int, default=500000, help="rows read at a time")
+    args = parser.parse_args(argv)
+
+    result = Intersection_of_Shock_Waves_Same_Family_Batch(args.mach, args.theta, args.theta_plus)
+    try:
+        report = validate_su2_csv(args.input, result, ramp_length=args.ramp_length, corner=args.corner,
+                                  exclusion_band=args.band, chunk_size=args.chunk_size)
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    print(format_validation(report))
+    return 0
+
+
+# Usage: python SU2_Validation.py flow.csv --mach 3 --theta 10 --theta-plus 8 --ramp-length 1.0 --band 0.01
+if __name__ == "__main__":
+    sys.exit(main())
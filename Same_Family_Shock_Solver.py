@@ -1,11 +1,44 @@
 from Oblique_Shock_Solver import ObliqueShockAnalyzer
 from Expansion_Wave_Solver import PrandtlMeyerExpansion
 import time
-import pandas as pd
+import numpy as np
+
+# Wave type codes of the batch solver ("Case" field); they match the Status/Case values used by the GUI
+CASE_NO_SOLUTION = -1
+CASE_SHOCK = 0
+CASE_EXPANSION = 1
+
+# Flow regime labels (wave type codes above plus the reasons a case has no solution)
+REGIME_SUBSONIC_INLET = 2
+REGIME_REGION2_DETACHED = 3
+REGIME_REGION3_DETACHED = 4
+REGIME_NO_INTERSECTION = 5
+REGIME_NAMES = {
+    CASE_SHOCK: "Reflected Shock",
+    CASE_EXPANSION: "Expansion Wave",
+    REGIME_SUBSONIC_INLET: "Subsonic Inlet",
+    REGIME_REGION2_DETACHED: "Region 2 Detached",
+    REGIME_REGION3_DETACHED: "Region 3 Detached",
+    REGIME_NO_INTERSECTION: "No Intersection Solution"
+}
+
+# Float fields returned by Intersection_of_Shock_Waves_Same_Family_Batch
+BATCH_RESULT_FIELDS = (
+    "Inlet Mach", "First Ramp Angle", "Ramp Increase Angle",
+    "Mach 2", "Mach 3", "Mach 4", "Mach 5",
+    "Beta1", "Beta2", "Beta3", "Beta4",
+    "P2/P1", "P3/P1", "P4/P1", "P5/P1",
+    "T2/T1", "T3/T1", "T4/T1", "T5/T1",
+    "rho2/rho1", "rho3/rho1", "rho4/rho1", "rho5/rho1",
+    "Pt2/Pt1", "Pt3/Pt1", "Pt4/Pt1", "Pt5/Pt1",
+    "Theta", "Slip Line Angle", "Iteration Count"
+)
 
 def save_to_csv(results, filename="results.csv"):
-    """Save results to a CSV file"""
+    """Save results to a CSV file (pandas is imported on first use)"""
     try:
+        import pandas as pd
+
         df = pd.DataFrame([results])
         df.to_csv(filename, index=False, encoding='utf-8')
         print(f"✅ Results saved to '{filename}'.")
@@ -17,10 +50,38 @@ def save_to_csv(results, filename="results.csv"):
         print(f"❌ Failed to save CSV file: {e}")
         return False
 
-def Intersection_of_Shock_Waves_Same_Family(Mach_inlet, Theta, Theta_plus, ITER_NUM=1000):
+# Angle fields (degrees); errors in them are compared absolutely, everything else relatively
+ANGLE_FIELDS = {"beta_angle", "nu1", "nu2", "Beta1", "Beta2", "Beta3", "Beta4", "Theta", "Slip Line Angle"}
+
+# Positions of the same-family fields in the tuple returned by Intersection_of_Shock_Waves_Same_Family
+SAME_FAMILY_TUPLE_FIELDS = {
+    "Beta1": 3, "Mach 2": 4, "T2/T1": 5, "P2/P1": 6, "rho2/rho1": 7, "Pt2/Pt1": 8,
+    "Beta2": 9, "Mach 3": 10, "T3/T1": 11, "P3/P1": 12, "rho3/rho1": 13, "Pt3/Pt1": 14,
+    "Beta3": 15, "Mach 4": 16, "T4/T1": 17, "P4/P1": 18, "rho4/rho1": 19, "Pt4/Pt1": 20,
+    "Beta4": 21, "Mach 5": 22, "T5/T1": 23, "P5/P1": 24, "rho5/rho1": 25, "Pt5/Pt1": 26,
+    "Theta": 28, "Slip Line Angle": 29
+}
+
+# Columns of results.csv after "Case", in the order the scalar solver writes them
+RESULTS_CSV_FIELDS = (
+    "Inlet Mach", "First Ramp Angle", "Ramp Increase Angle", "Mach 2", "Mach 3",
+    "Beta1", "Beta2", "Beta3", "Beta4", "P2/P1", "P3/P1", "P4/P1", "P5/P1", "Theta",
+    "Mach 4", "Mach 5", "T4/T1", "T5/T1", "rho4/rho1", "rho5/rho1", "Pt4/Pt1", "Pt5/Pt1", "Iteration Count"
+)
+
+def results_record(case, values, elapsed_time):
+    """results.csv row (the scalar solver's layout) of one solved case from its wave type code and field values"""
+    record = {"Case": "Expansion Wave" if case == CASE_EXPANSION else "Shock Wave"}
+    record.update({field: values[field] for field in RESULTS_CSV_FIELDS})
+    record["Iteration Count"] = int(record["Iteration Count"])
+    record["Execution Time (s)"] = elapsed_time
+    return record
+
+def Intersection_of_Shock_Waves_Same_Family(Mach_inlet, Theta, Theta_plus, ITER_NUM=1000, save_results=True,
+                                            verbose=True, gamma=1.4):
     start_time = time.time()
-    analyzer_obs = ObliqueShockAnalyzer()
-    analyzer_pm = PrandtlMeyerExpansion()
+    analyzer_obs = ObliqueShockAnalyzer(gamma)
+    analyzer_pm = PrandtlMeyerExpansion(gamma)
 
     # First shock flow properties
     Beta1 = analyzer_obs.solve_beta_angle(Mach_inlet, Theta)
@@ -51,7 +112,8 @@ def Intersection_of_Shock_Waves_Same_Family(Mach_inlet, Theta, Theta_plus, ITER_
     A = 0
     iteration_count = 0
 
-    print("🔄 Expansion wave analysis started...")
+    if verbose:
+        print("🔄 Expansion wave analysis started...")
 
     try:
         while abs(P4_over_P1 - P5_over_P1) > TOLERANCE and iteration_count < MAX_ITERATIONS:
@@ -62,15 +124,16 @@ def Intersection_of_Shock_Waves_Same_Family(Mach_inlet, Theta, Theta_plus, ITER_
 
         if iteration_count < MAX_ITERATIONS:
             M_4 = analyzer_pm.mach_from_expansion(M_3, teta_iter)
-            M_5 = analyzer_obs.mach_after_shock(Mach_inlet, Theta_total - teta_iter)
+            # Region 5 lies behind the merged shock, which turns the flow by Theta_total + teta_iter
+            M_5 = analyzer_obs.mach_after_shock(Mach_inlet, Theta_total + teta_iter)
             T4_over_T1 = analyzer_pm.temperature_ratio_pm(M_3, teta_iter) * T2_over_T1_2 * T3_over_T2
-            T5_over_T1 = analyzer_obs.temperature_ratio(Mach_inlet, Theta_total - teta_iter)
+            T5_over_T1 = analyzer_obs.temperature_ratio(Mach_inlet, Theta_total + teta_iter)
             rho4_over_rho1 = analyzer_pm.density_ratio_pm(M_3, teta_iter) * density_ratio_3 * density_ratio_2
-            rho5_over_rho1 = analyzer_obs.density_ratio(Mach_inlet, Theta_total - teta_iter)
+            rho5_over_rho1 = analyzer_obs.density_ratio(Mach_inlet, Theta_total + teta_iter)
             total_pres_ratio_4 = 1 * total_pres_ratio_3 * total_pres_ratio_2
-            total_pres_ratio_5 = analyzer_obs.total_pressure_ratio(Mach_inlet, Theta_total - teta_iter)
+            total_pres_ratio_5 = analyzer_obs.total_pressure_ratio(Mach_inlet, Theta_total + teta_iter)
             Beta4 = analyzer_obs.solve_beta_angle(M_3, teta_iter)
-            Beta3 = analyzer_obs.solve_beta_angle(Mach_inlet, Theta_total - teta_iter)
+            Beta3 = analyzer_obs.solve_beta_angle(Mach_inlet, Theta_total + teta_iter)
 
             A = 1
             end_time = time.time()
@@ -102,18 +165,22 @@ def Intersection_of_Shock_Waves_Same_Family(Mach_inlet, Theta, Theta_plus, ITER_
                 "Iteration Count": iteration_count,
                 "Execution Time (s)": elapsed_time
             }
-            save_to_csv(results)
-            for key, value in results.items():
-                print(f"{key}: {value}")
-        else:
+            if save_results:
+                save_to_csv(results)
+            if verbose:
+                for key, value in results.items():
+                    print(f"{key}: {value}")
+        elif verbose:
             print(f"⚠️ No solution found for expansion wave. ({MAX_ITERATIONS} iterations)")
 
     except Exception as e:
-        print(f"❌ Error in expansion wave calculation: {e}")
+        if verbose:
+            print(f"❌ Error in expansion wave calculation: {e}")
 
     if A == 0:
         # Shock wave case
-        print("🔄 Shock wave analysis started...")
+        if verbose:
+            print("🔄 Shock wave analysis started...")
         P4_over_P1 = 10
         P5_over_P1 = 1
         teta_iter = 0.001
@@ -169,13 +236,380 @@ def Intersection_of_Shock_Waves_Same_Family(Mach_inlet, Theta, Theta_plus, ITER_
                     "Iteration Count": iteration_count,
                     "Execution Time (s)": elapsed_time
                 }
-                for key, value in results.items():
-                    print(f"{key}: {value}")
-                save_to_csv(results)
-            else:
+                if verbose:
+                    for key, value in results.items():
+                        print(f"{key}: {value}")
+                if save_results:
+                    save_to_csv(results)
+            elif verbose:
                 print(f"⚠️ No solution found for shock wave. ({MAX_ITERATIONS} iterations)")
 
         except Exception as e:
-            print(f"❌ Error in shock wave calculation: {e}")
+            if verbose:
+                print(f"❌ Error in shock wave calculation: {e}")
 
     return Mach_inlet, Theta, Theta_plus, Beta1, M_2, T2_over_T1_2, P2_over_P1, density_ratio_2, total_pres_ratio_2, Beta2, M_3, T3_over_T2*T2_over_T1_2, P3_over_P2*P2_over_P1, density_ratio_3*density_ratio_2, total_pres_ratio_3*total_pres_ratio_2, Beta3, M_4, T4_over_T1, P4_over_P1, rho4_over_rho1, total_pres_ratio_4, Beta4, M_5, T5_over_T1, P5_over_P1, rho5_over_rho1, total_pres_ratio_5, A, teta_iter, teta_iter+Theta+Theta_plus, iteration_count
+
+
+def _pressure_mismatch(delta, expansion, M1, M3, P3_over_P1, Theta_total, analyzer_obs, analyzer_pm, gamma=None):
+    """P4/P1 - P5/P1 for a transmitted wave of strength delta (degrees, >= 0)"""
+    mismatch = np.empty_like(delta)
+
+    e = expansion
+    if e.any():
+        g = None if gamma is None else gamma[e]
+        M_4 = analyzer_pm.mach_from_expansion_array(M3[e], delta[e], gamma=g)
+        P4 = analyzer_pm.expansion_relations_array(M3[e], M_4, gamma=g)['pressure_ratio'] * P3_over_P1[e]
+        P5 = analyzer_obs.pressure_ratio_array(M1[e], Theta_total[e] + delta[e], gamma=g)
+        mismatch[e] = P4 - P5
+
+    s = ~expansion
+    if s.any():
+        g = None if gamma is None else gamma[s]
+        P4 = analyzer_obs.pressure_ratio_array(M3[s], delta[s], gamma=g) * P3_over_P1[s]
+        P5 = analyzer_obs.pressure_ratio_array(M1[s], Theta_total[s] - delta[s], gamma=g)
+        mismatch[s] = P4 - P5
+
+    return mismatch
+
+
+def _illinois_root(func, lo, hi, f_lo, f_hi, tolerance, max_iterations):
+    """
+    Vectorized Illinois (modified regula falsi) root search on brackets [lo, hi].
+    func(x, idx) evaluates the residual for the cases idx only.
+    """
+    lo, hi, f_lo, f_hi = lo.copy(), hi.copy(), f_lo.copy(), f_hi.copy()
+    root = 0.5 * (lo + hi)
+    iterations = np.zeros(lo.shape, dtype=int)
+    side = np.zeros(lo.shape, dtype=int)
+    active = np.abs(hi - lo) > tolerance
+
+    for _ in range(max_iterations):
+        idx = np.nonzero(active)[0]
+        if idx.size == 0:
+            break
+
+        a, b, fa, fb = lo[idx], hi[idx], f_lo[idx], f_hi[idx]
+        c = (a * fb - b * fa) / (fb - fa)
+        c = np.where(np.isfinite(c) & (c > np.minimum(a, b)) & (c < np.maximum(a, b)), c, 0.5 * (a + b))
+        fc = func(c, idx)
+
+        keep_hi = np.sign(fc) == np.sign(fa)
+        lo[idx] = np.where(keep_hi, c, a)
+        f_lo[idx] = np.where(keep_hi, fc, np.where(side[idx] == 1, fa / 2, fa))
+        hi[idx] = np.where(keep_hi, b, c)
+        f_hi[idx] = np.where(keep_hi, np.where(side[idx] == -1, fb / 2, fb), fc)
+        side[idx] = np.where(keep_hi, -1, 1)
+
+        root[idx] = c
+        iterations[idx] += 1
+        active[idx] = (np.abs(hi[idx] - lo[idx]) > tolerance) & (fc != 0)
+
+    return root, iterations
+
+
+def _prepare_same_family(Mach_inlet, Theta, Theta_plus, analyzer_obs, analyzer_pm, region2=None, region3=None,
+                         gamma=None):
+    """
+    Closed-form part of the batch solver: region 2/3 states, flow regime and the root bracket of the
+    pressure match for every case (inputs are broadcast and flattened). Precomputed region 2/3
+    states (complete_analysis_array dicts of the flattened cases) are used when given. gamma
+    (None for the analyzer gamma) is broadcast with the inputs as a batch dimension.
+    """
+    if gamma is None:
+        Mach_inlet, Theta, Theta_plus = np.broadcast_arrays(np.asarray(Mach_inlet, dtype=float),
+                                                            np.asarray(Theta, dtype=float),
+                                                            np.asarray(Theta_plus, dtype=float))
+    else:
+        Mach_inlet, Theta, Theta_plus, gamma = np.broadcast_arrays(np.asarray(Mach_inlet, dtype=float),
+                                                                   np.asarray(Theta, dtype=float),
+                                                                   np.asarray(Theta_plus, dtype=float),
+                                                                   np.asarray(gamma, dtype=float))
+        gamma = gamma.ravel()
+    M1 = Mach_inlet.ravel()
+    Theta_1 = Theta.ravel()
+    Theta_2 = Theta_plus.ravel()
+    Theta_total = Theta_1 + Theta_2
+
+    # First and second shock flow properties
+    if region2 is None:
+        region2 = analyzer_obs.complete_analysis_array(M1, Theta_1, gamma)
+    M_2 = region2['output_mach']
+    if region3 is None:
+        region3 = analyzer_obs.complete_analysis_array(np.where(np.isnan(M_2), 2.0, M_2), Theta_2, gamma)
+        region3 = {key: np.where(np.isnan(M_2), np.nan, value) for key, value in region3.items()}
+    M_3 = region3['output_mach']
+    P3_over_P1 = region3['pressure_ratio'] * region2['pressure_ratio']
+
+    # Wave type from the mismatch at zero transmitted wave strength. If the merged shock cannot
+    # turn the flow by Theta_total at all, only a reflected shock can match the pressures.
+    valid = np.isfinite(M_3)
+    theta_max1, _ = analyzer_obs.max_theta_array(M1, gamma)
+    P5_direct = analyzer_obs.pressure_ratio_array(M1, Theta_total, gamma)
+    expansion = valid & (P3_over_P1 >= P5_direct)
+
+    # Bracket: transmitted wave strength is limited by detachment (and the Prandtl-Meyer limit)
+    M1_c = np.where(valid, M1, 2.0)
+    M3_c = np.where(valid, M_3, 2.0)
+    P3_c = np.where(valid, P3_over_P1, 1.0)
+    theta_max3, _ = analyzer_obs.max_theta_array(M3_c, gamma)
+    nu_3 = analyzer_pm.prandtl_meyer_angle_array(M3_c, gamma)
+    upper_exp = np.minimum(theta_max1 - Theta_total, analyzer_pm.max_prandtl_meyer_angle(gamma) - nu_3)
+    upper_shock = np.minimum(theta_max3, Theta_total)
+    lower_shock = np.maximum(Theta_total - theta_max1, 0.0)
+
+    def residual(delta, idx):
+        return _pressure_mismatch(delta, expansion[idx], M1_c[idx], M3_c[idx], P3_c[idx], Theta_total[idx],
+                                  analyzer_obs, analyzer_pm, None if gamma is None else gamma[idx])
+
+    all_idx = np.arange(M1.size)
+    lo = np.where(valid & ~expansion & (lower_shock > 0), lower_shock * (1 + 1e-12) + 1e-12, 0.0)
+    hi = np.where(valid, np.maximum(np.where(expansion, upper_exp, upper_shock) * (1 - 1e-12), lo), 0.0)
+    f_lo = np.where(lo > 0, residual(lo, all_idx), P3_over_P1 - P5_direct)
+    f_hi = residual(hi, all_idx)
+    f_lo = np.where(valid, f_lo, 0.0)
+    valid &= np.isfinite(f_lo) & ((np.isfinite(f_hi) & (np.sign(f_hi) != np.sign(f_lo))) | (f_lo == 0))
+    hi = np.where(valid & (f_lo != 0), hi, lo)
+    f_hi = np.where(valid, f_hi, 0.0)
+
+    regime = np.where(valid, np.where(expansion, CASE_EXPANSION, CASE_SHOCK), REGIME_NO_INTERSECTION)
+    regime = np.where(np.isnan(M_3), REGIME_REGION3_DETACHED, regime)
+    regime = np.where(np.isnan(M_2), REGIME_REGION2_DETACHED, regime)
+    regime = np.where(~(M1 > 1), REGIME_SUBSONIC_INLET, regime)
+
+    return {
+        'shape': Mach_inlet.shape, 'M1': M1, 'Theta_1': Theta_1, 'Theta_2': Theta_2,
+        'Theta_total': Theta_total, 'region2': region2, 'region3': region3, 'M_2': M_2, 'M_3': M_3,
+        'M3_c': M3_c, 'P3_over_P1': P3_over_P1, 'valid': valid, 'expansion': expansion & valid,
+        'regime': regime, 'residual': residual, 'lo': lo, 'hi': hi, 'f_lo': f_lo, 'f_hi': f_hi, 'gamma': gamma
+    }
+
+
+def classify_same_family(Mach_inlet, Theta, Theta_plus, analyzer_obs=None, analyzer_pm=None, gamma=None):
+    """
+    Fast feasibility pre-check for arrays of (Mach_inlet, Theta, Theta_plus), before any root solving.
+
+    Each case is labelled (REGIME_NAMES keys) as subsonic inlet, region 2 detached, region 3
+    detached, no intersection solution (the merged shock detaches before the pressures match),
+    expansion wave or reflected shock, from closed-form shock limits and the sign of the pressure
+    mismatch at the ends of the admissible slip-line range. gamma broadcasts like in the batch solver.
+    """
+    if analyzer_obs is None:
+        analyzer_obs = ObliqueShockAnalyzer()
+    if analyzer_pm is None:
+        analyzer_pm = PrandtlMeyerExpansion()
+
+    state = _prepare_same_family(Mach_inlet, Theta, Theta_plus, analyzer_obs, analyzer_pm, gamma=gamma)
+    return np.reshape(state['regime'], state['shape'])
+
+
+def Intersection_of_Shock_Waves_Same_Family_Batch(Mach_inlet, Theta, Theta_plus, tolerance=1e-10,
+                                                  max_iterations=100, analyzer_obs=None, analyzer_pm=None,
+                                                  Theta_guess=None, guess_window=0.05, gamma=None):
+    """
+    Vectorized same-family intersection for arrays of (Mach_inlet, Theta, Theta_plus).
+
+    Inputs are broadcast together. The transmitted wave type is decided from the sign of
+    P3/P1 - P5/P1 at zero slip-line offset, and the pressure match is solved for all cases at
+    once with a bracketed root search instead of the fixed-step march. Cases that the
+    classify_same_family pre-check rules out are not iterated. Nothing is printed or saved.
+    Returns a dict of arrays keyed by BATCH_RESULT_FIELDS plus an integer "Case" array
+    (CASE_EXPANSION, CASE_SHOCK or CASE_NO_SOLUTION, whose fields are NaN).
+
+    Theta_guess (signed like the "Theta" output, e.g. from a neighbouring solution) warm-starts
+    the search: the bracket is tightened to guess_window (relative, plus 1e-3°) around it when
+    the guess has the right wave type and the pressure mismatch changes sign there.
+
+    gamma (scalar or array) is broadcast with the other inputs, so one call can cover a range of
+    specific-heat ratios; without it the analyzers' gamma is used.
+    """
+    if analyzer_obs is None:
+        analyzer_obs = ObliqueShockAnalyzer()
+    if analyzer_pm is None:
+        analyzer_pm = PrandtlMeyerExpansion()
+
+    state = _prepare_same_family(Mach_inlet, Theta, Theta_plus, analyzer_obs, analyzer_pm, gamma=gamma)
+    return _solve_prepared_same_family(state, tolerance, max_iterations, analyzer_obs, analyzer_pm, Theta_guess,
+                                       guess_window)
+
+
+def _solve_prepared_same_family(state, tolerance, max_iterations, analyzer_obs, analyzer_pm, Theta_guess=None,
+                                guess_window=0.05):
+    """Pressure match and region 4/5 states of a _prepare_same_family state (batch result dict)"""
+    shape, M1, Theta_1, Theta_2 = state['shape'], state['M1'], state['Theta_1'], state['Theta_2']
+    Theta_total, M_2, M_3, M3_c = state['Theta_total'], state['M_2'], state['M_3'], state['M3_c']
+    region2, region3, P3_over_P1 = state['region2'], state['region3'], state['P3_over_P1']
+    valid, expansion, residual, gamma = state['valid'], state['expansion'], state['residual'], state['gamma']
+    lo, hi, f_lo, f_hi = state['lo'], state['hi'], state['f_lo'], state['f_hi']
+
+    T3_over_T1 = region3['temperature_ratio'] * region2['temperature_ratio']
+    rho3_over_rho1 = region3['density_ratio'] * region2['density_ratio']
+    Pt3_over_Pt1 = region3['total_pressure_ratio'] * region2['total_pressure_ratio']
+
+    if Theta_guess is not None:
+        # Warm start: tighten the bracket around the guess where it is consistent
+        guess = np.broadcast_to(np.asarray(Theta_guess, dtype=float), shape).ravel()
+        guess = np.where(expansion, guess, -guess)
+        usable = valid & (hi > lo) & np.isfinite(guess) & (guess >= 0)
+        if usable.any():
+            idx = np.nonzero(usable)[0]
+            width = guess_window * guess[idx] + 1e-3
+            lo_g = np.clip(guess[idx] - width, lo[idx], hi[idx])
+            hi_g = np.clip(guess[idx] + width, lo[idx], hi[idx])
+            f_lo_g = residual(lo_g, idx)
+            f_hi_g = residual(hi_g, idx)
+            move_lo = np.sign(f_lo_g) == np.sign(f_lo[idx])
+            move_hi = np.sign(f_hi_g) == np.sign(f_hi[idx])
+            lo[idx] = np.where(move_lo, lo_g, lo[idx])
+            f_lo[idx] = np.where(move_lo, f_lo_g, f_lo[idx])
+            hi[idx] = np.where(move_hi, hi_g, hi[idx])
+            f_hi[idx] = np.where(move_hi, f_hi_g, f_hi[idx])
+
+    delta, iteration_count = _illinois_root(residual, lo, hi, f_lo, f_hi, tolerance, max_iterations)
+    delta = np.where(valid, delta, np.nan)
+
+    # Region 4 (behind the transmitted wave) and region 5 (behind the merged shock)
+    Theta_slip = np.where(expansion, Theta_total + delta, Theta_total - delta)
+    region5 = analyzer_obs.complete_analysis_array(np.where(valid, M1, 2.0), np.where(valid, Theta_slip, 0.0), gamma)
+    region4_shock = analyzer_obs.complete_analysis_array(M3_c, np.where(valid, delta, 0.0), gamma)
+    M_4_exp = analyzer_pm.mach_from_expansion_array(M3_c, np.where(expansion, delta, 0.0), gamma)
+    region4_exp = analyzer_pm.expansion_relations_array(M3_c, M_4_exp, gamma)
+
+    def pick(exp_value, shock_value):
+        return np.where(valid, np.where(expansion, exp_value, shock_value), np.nan)
+
+    def masked(value):
+        return np.where(valid, value, np.nan)
+
+    P4_over_P3 = pick(region4_exp['pressure_ratio'], region4_shock['pressure_ratio'])
+    results = {
+        "Case": np.where(valid, np.where(expansion, CASE_EXPANSION, CASE_SHOCK), CASE_NO_SOLUTION),
+        "Inlet Mach": M1,
+        "First Ramp Angle": Theta_1,
+        "Ramp Increase Angle": Theta_2,
+        "Mach 2": M_2,
+        "Mach 3": M_3,
+        "Mach 4": pick(M_4_exp, region4_shock['output_mach']),
+        "Mach 5": masked(region5['output_mach']),
+        "Beta1": region2['beta_angle'],
+        "Beta2": region3['beta_angle'],
+        "Beta3": masked(region5['beta_angle']),
+        "Beta4": masked(region4_shock['beta_angle']),
+        "P2/P1": region2['pressure_ratio'],
+        "P3/P1": P3_over_P1,
+        "P4/P1": P4_over_P3 * P3_over_P1,
+        "P5/P1": masked(region5['pressure_ratio']),
+        "T2/T1": region2['temperature_ratio'],
+        "T3/T1": T3_over_T1,
+        "T4/T1": pick(region4_exp['temperature_ratio'], region4_shock['temperature_ratio']) * T3_over_T1,
+        "T5/T1": masked(region5['temperature_ratio']),
+        "rho2/rho1": region2['density_ratio'],
+        "rho3/rho1": rho3_over_rho1,
+        "rho4/rho1": pick(region4_exp['density_ratio'], region4_shock['density_ratio']) * rho3_over_rho1,
+        "rho5/rho1": masked(region5['density_ratio']),
+        "Pt2/Pt1": region2['total_pressure_ratio'],
+        "Pt3/Pt1": Pt3_over_Pt1,
+        "Pt4/Pt1": pick(1.0, region4_shock['total_pressure_ratio']) * Pt3_over_Pt1,
+        "Pt5/Pt1": masked(region5['total_pressure_ratio']),
+        "Theta": np.where(expansion, delta, -delta),
+        "Slip Line Angle": masked(Theta_slip),
+        "Iteration Count": iteration_count.astype(float)
+    }
+    return {key: np.reshape(value, shape) for key, value in results.items()}
+
+
+def regime_from_results(results):
+    """Flow regime label (REGIME_NAMES keys) of every case of a batch result"""
+    regime = np.asarray(results["Case"]).copy()
+    failed = regime == CASE_NO_SOLUTION
+    regime[failed] = REGIME_NO_INTERSECTION
+    regime[failed & np.isnan(results["Mach 3"])] = REGIME_REGION3_DETACHED
+    regime[failed & np.isnan(results["Mach 2"])] = REGIME_REGION2_DETACHED
+    regime[failed & ~(results["Inlet Mach"] > 1)] = REGIME_SUBSONIC_INLET
+    return regime
+
+
+# Per-ramp fields of the oblique-shock cascade returned by Intersection_of_Shock_Waves_Multi_Ramp
+CASCADE_FIELDS = ("Cascade Mach", "Cascade Beta", "Cascade P/P1", "Cascade T/T1", "Cascade rho/rho1",
+                  "Cascade Pt/Pt1")
+
+
+def Intersection_of_Shock_Waves_Multi_Ramp(Mach_inlet, Ramp_angles, tolerance=1e-10, max_iterations=100,
+                                           analyzer_obs=None, analyzer_pm=None, gamma=None):
+    """
+    Same-family compression chain of N >= 2 ramps for arrays of configurations.
+
+    Ramp_angles has the ramp deflections (Theta, Theta_plus, ...) on its last axis; the other axes
+    broadcast with Mach_inlet. The oblique-shock cascade along the wall (regions 1 to N + 1) is
+    computed ramp by ramp for all configurations at once. The shocks then coalesce in sequence:
+    intersection j is the shock of ramps 1..j (one equivalent first ramp of Theta = sum of their
+    angles) meeting the shock of ramp j + 1, with cascade regions j + 1 and j + 2 as regions 2 and 3
+    of the two-ramp problem. Each later shock is assumed to reach the merged shock through the
+    undisturbed cascade state. All intersections of all configurations are solved in one batch
+    pressure match; for N = 2 the result equals Intersection_of_Shock_Waves_Same_Family_Batch.
+
+    Returns a dict with the CASCADE_FIELDS (last axis: regions 1..N + 1, "Cascade Beta": ramps
+    1..N) and the batch result fields plus "Case" with one entry per intersection on the last axis
+    (N - 1); the final pattern downstream of the chain is [..., -1]. gamma (None for the analyzer
+    gamma) broadcasts with Mach_inlet.
+    """
+    if analyzer_obs is None:
+        analyzer_obs = ObliqueShockAnalyzer()
+    if analyzer_pm is None:
+        analyzer_pm = PrandtlMeyerExpansion()
+
+    Ramp_angles = np.asarray(Ramp_angles, dtype=float)
+    if Ramp_angles.ndim == 0 or Ramp_angles.shape[-1] < 2:
+        raise ValueError("Ramp_angles must have at least 2 ramp angles on its last axis.")
+    n_ramps = Ramp_angles.shape[-1]
+    shape = np.broadcast_shapes(np.shape(Mach_inlet), Ramp_angles.shape[:-1], np.shape(gamma))
+    M1 = np.broadcast_to(np.asarray(Mach_inlet, dtype=float), shape).ravel()
+    if gamma is not None:
+        gamma = np.broadcast_to(np.asarray(gamma, dtype=float), shape).ravel()
+    angles = np.broadcast_to(Ramp_angles, shape + (n_ramps,)).reshape(-1, n_ramps)
+    n = M1.size
+
+    # === Oblique-shock cascade along the wall (one vectorized step per ramp) ===
+    shocks = []
+    mach = [M1]
+    for ramp in range(n_ramps):
+        upstream = mach[-1]
+        state = analyzer_obs.complete_analysis_array(np.where(np.isnan(upstream), 2.0, upstream), angles[:, ramp],
+                                                     gamma)
+        state = {key: np.where(np.isnan(upstream), np.nan, value) for key, value in state.items()}
+        shocks.append(state)
+        mach.append(state['output_mach'])
+
+    ones = np.ones(n)
+    cumulative = {}
+    for key in ('pressure_ratio', 'temperature_ratio', 'density_ratio', 'total_pressure_ratio'):
+        cumulative[key] = np.column_stack([ones] + [shock[key] for shock in shocks]).cumprod(axis=1)
+
+    # === Successive intersections, stacked as (configuration, intersection) cases ===
+    # Intersection j: cascade region j + 1 (cumulative ratios) behind an equivalent first ramp of
+    # sum(angles[:j + 1]), and the shock of ramp j + 1 into cascade region j + 2
+    mach = np.column_stack(mach)
+    betas = np.column_stack([shock['beta_angle'] for shock in shocks])
+    upstream_angle = np.cumsum(angles, axis=1)[:, :-1].ravel()
+    M1_stage = np.repeat(M1, n_ramps - 1)
+    region2 = {key: values[:, 1:-1].ravel() for key, values in cumulative.items()}
+    region2.update({'input_mach': M1_stage, 'theta_angle': upstream_angle, 'output_mach': mach[:, 1:-1].ravel(),
+                    'beta_angle': betas[:, :-1].ravel()})
+    region3 = {key: np.column_stack([shock[key] for shock in shocks[1:]]).ravel() for key in shocks[0]}
+
+    state = _prepare_same_family(M1_stage, upstream_angle, angles[:, 1:].ravel(), analyzer_obs, analyzer_pm,
+                                 region2=region2, region3=region3,
+                                 gamma=None if gamma is None else np.repeat(gamma, n_ramps - 1))
+    stages = _solve_prepared_same_family(state, tolerance, max_iterations, analyzer_obs, analyzer_pm)
+
+    results = {key: np.reshape(value, shape + (n_ramps - 1,)) for key, value in stages.items()}
+    cascade = {
+        "Cascade Mach": mach,
+        "Cascade Beta": betas,
+        "Cascade P/P1": cumulative['pressure_ratio'],
+        "Cascade T/T1": cumulative['temperature_ratio'],
+        "Cascade rho/rho1": cumulative['density_ratio'],
+        "Cascade Pt/Pt1": cumulative['total_pressure_ratio']
+    }
+    results.update({key: value.reshape(shape + value.shape[1:]) for key, value in cascade.items()})
+    return results
@@ -0,0 +1,320 @@
+import argparse
+import json
+import queue
+import threading
+import time
+import urllib.request
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+from Oblique_Shock_Solver import ObliqueShockAnalyzer
+from Expansion_Wave_Solver import PrandtlMeyerExpansion
+from Same_Family_Shock_Solver import Intersection_of_Shock_Waves_Same_Family_Batch, BATCH_RESULT_FIELDS
+
+# The service only listens on the loopback interface
+HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+SAME_FAMILY_FIELDS = BATCH_RESULT_FIELDS + ("Case",)
+
+
+def _to_json(value):
+    """Arrays/NumPy scalars to JSON values (non-finite numbers become null)"""
+    array = np.asarray(value)
+    if array.dtype.kind in "iub":
+        return array.tolist()
+    if array.ndim == 0:
+        return float(array) if np.isfinite(array) else None
+    return [_to_json(v) for v in array]
+
+
+class ServiceMetrics:
+    """Thread-safe request counters and latency percentiles (over the last `window` requests)"""
+
+    def __init__(self, window=10000):
+        self.lock = threading.Lock()
+        self.window = window
+        self.started = time.time()
+        self.endpoints = {}
+        self.batches = 0
+        self.batch_cases = 0
+        self.cache_hits = 0
+
+    def record(self, endpoint, cases, latency, error=False):
+        with self.lock:
+            entry = self.endpoints.setdefault(endpoint, {'requests': 0, 'cases': 0, 'errors': 0,
+                                                         'latencies': deque(maxlen=self.window)})
+            entry['requests'] += 1
+            entry['cases'] += cases
+            entry['errors'] += int(error)
+            entry['latencies'].append(latency)
+
+    def record_batch(self, cases, cache_hits):
+        with self.lock:
+            self.batches += 1
+            self.batch_cases += cases
+            self.cache_hits += cache_hits
+
+    def snapshot(self):
+        with self.lock:
+            uptime = time.time() - self.started
+            endpoints = {}
+            for name, entry in self.endpoints.items():
+                latencies = np.array(entry['latencies']) * 1000
+                endpoints[name] = {
+                    'requests': entry['requests'],
+                    'cases': entry['cases'],
+                    'errors': entry['errors'],
+                    'cases_per_s': entry['cases'] / uptime if uptime > 0 else 0.0,
+                    'latency_ms': {f"p{q}": float(np.percentile(latencies, q)) for q in (50, 95, 99)}
+                }
+            return {
+                'uptime_s': uptime,
+                'endpoints': endpoints,
+                'same_family_batches': self.batches,
+                'mean_batch_size': self.batch_cases / self.batches if self.batches else 0.0,
+                'same_family_cache_hits': self.cache_hits
+            }
+
+
+class SameFamilyCoalescer:
+    """
+    Collects same-family requests from concurrent handler threads and solves them together.
+
+    A worker thread waits up to max_wait seconds (or until max_batch cases are queued) after the first
+    request, solves all pending cases in one batch call and resolves each request's Future. Results are
+    kept in an in-memory LRU cache keyed on the inputs rounded to `decimals` places.
+    """
+
+    def __init__(self, metrics, analyzer_obs, analyzer_pm, max_wait=0.002, max_batch=50000, cache_size=100000,
+                 decimals=9):
+        self.metrics = metrics
+        self.max_wait = max_wait
+        self.max_batch = max_batch
+        self.cache_size = cache_size
+        self.decimals = decimals
+        self.analyzer_obs = analyzer_obs
+        self.analyzer_pm = analyzer_pm
+        self.cache = OrderedDict()
+        self.pending = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, Mach_inlet, Theta, Theta_plus):
+        """Queue flat input arrays; the Future resolves to a dict of result arrays"""
+        future = Future()
+        self.pending.put((Mach_inlet, Theta, Theta_plus, future))
+        return future
+
+    def _run(self):
+        while True:
+            requests = [self.pending.get()]
+            n_cases = len(requests[0][0])
+            deadline = time.perf_counter() + self.max_wait
+            while n_cases < self.max_batch:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self.pending.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                requests.append(request)
+                n_cases += len(request[0])
+            try:
+                self._solve(requests)
+            except Exception as e:
+                for *_, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _solve(self, requests):
+        inputs = [np.concatenate([r[i] for r in requests]) for i in range(3)]
+        keys = list(zip(*(np.round(a, self.decimals).tolist() for a in inputs)))
+        table = np.full((len(keys), len(SAME_FAMILY_FIELDS)), np.nan)
+
+        missing = []
+        for i, key in enumerate(keys):
+            row = self.cache.get(key)
+            if row is None:
+                missing.append(i)
+            else:
+                self.cache.move_to_end(key)
+                table[i] = row
+
+        if missing:
+            missing = np.array(missing)
+            solved = Intersection_of_Shock_Waves_Same_Family_Batch(*(a[missing] for a in inputs),
+                                                                   analyzer_obs=self.analyzer_obs,
+                                                                   analyzer_pm=self.analyzer_pm)
+            rows = np.column_stack([np.ravel(solved[field]).astype(float) for field in SAME_FAMILY_FIELDS])
+            table[missing] = rows
+            for i, row in zip(missing, rows):
+                self.cache[keys[i]] = row
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        self.metrics.record_batch(len(keys), len(keys) - len(missing))
+
+        start = 0
+        for Mach_inlet, _, _, future in requests:
+            stop = start + len(Mach_inlet)
+            part = table[start:stop]
+            result = {field: part[:, f] for f, field in enumerate(SAME_FAMILY_FIELDS)}
+            result["Case"] = result["Case"].astype(int)
+            future.set_result(result)
+            start = stop
+
+
+class SolverService:
+    """Warm analyzers, the same-family coalescer and the metrics shared by all request handlers"""
+
+    def __init__(self, gamma=1.4, max_wait=0.002, max_batch=50000, cache_size=100000):
+        self.metrics = ServiceMetrics()
+        self.analyzer_obs = ObliqueShockAnalyzer(gamma)
+        self.analyzer_pm = PrandtlMeyerExpansion(gamma)
+        self.coalescer = SameFamilyCoalescer(self.metrics, self.analyzer_obs, self.analyzer_pm, max_wait, max_batch,
+                                             cache_size)
+
+    @staticmethod
+    def _inputs(payload, names):
+        """Broadcast the named inputs of a request (scalars or lists)"""
+        missing = [name for name in names if name not in payload]
+        if missing:
+            raise ValueError(f"Missing input(s): {', '.join(missing)}.")
+        arrays = np.broadcast_arrays(*(np.asarray(payload[name], dtype=float) for name in names))
+        return arrays[0].shape, [a.ravel() for a in arrays]
+
+    def oblique(self, payload):
+        shape, (M1, theta) = self._inputs(payload, ("M1", "theta"))
+        result = self.analyzer_obs.complete_analysis_array(M1, theta)
+        return shape, len(M1), result
+
+    def expansion(self, payload):
+        shape, (M1, theta) = self._inputs(payload, ("M1", "theta"))
+        result = self.analyzer_pm.calculate_all_ratios_array(M1, theta)
+        return shape, len(M1), result
+
+    def same_family(self, payload):
+        shape, inputs = self._inputs(payload, ("Mach_inlet", "Theta", "Theta_plus"))
+        result = self.coalescer.submit(*inputs).result()
+        return shape, len(inputs[0]), result
+
+    def handle(self, endpoint, payload):
+        """Solve one request; returns the JSON response body and the number of (broadcast) cases"""
+        shape, cases, result = getattr(self, endpoint)(payload)
+        return {key: _to_json(np.reshape(value, shape)) for key, value in result.items()}, cases
+
+
+class _LocalServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Room for many concurrent clients waiting to be accepted
+    request_queue_size = 256
+
+
+def _make_handler(service):
+    routes = {"/oblique": "oblique", "/expansion": "expansion", "/same_family": "same_family"}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/metrics":
+                self._reply(200, service.metrics.snapshot())
+            elif self.path == "/health":
+                self._reply(200, {'status': 'ok'})
+            else:
+                self._reply(404, {'error': f"Unknown path '{self.path}'."})
+
+        def do_POST(self):
+            endpoint = routes.get(self.path)
+            if endpoint is None:
+                self._reply(404, {'error': f"Unknown path '{self.path}'."})
+                return
+            start = time.perf_counter()
+            try:
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                body, cases = service.handle(endpoint, payload)
+            except (ValueError, TypeError) as e:
+                service.metrics.record(endpoint, 0, time.perf_counter() - start, error=True)
+                self._reply(400, {'error': str(e)})
+                return
+            except Exception as e:
+                service.metrics.record(endpoint, 0, time.perf_counter() - start, error=True)
+                self._reply(500, {'error': f"{type(e).__name__}: {e}"})
+                return
+            service.metrics.record(endpoint, max(cases, 1), time.perf_counter() - start)
+            self._reply(200, body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def start_service(port=DEFAULT_PORT, **options):
+    """Start the service in a background thread and return the server (call server.shutdown() to stop)"""
+    server = _LocalServer((HOST, port), _make_handler(SolverService(**options)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def query_service(endpoint, payload=None, port=DEFAULT_PORT, timeout=60.0):
+    """Client helper: POST a JSON payload (GET when payload is None) and return the decoded reply"""
+    url = f"http://{HOST}:{port}/{endpoint.lstrip('/')}"
+    data = None if payload is None else json.dumps(payload).encode()
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON service for the shock solvers (127.0.0.1 only).")
+    parser.add_argument("-p", "--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--gamma", type=float, default=1.4)
+    parser.add_argument("--max-wait", type=float, default=0.002, help="coalescing window in seconds")
+    parser.add_argument("--max-batch", type=int, default=50000, help="most same-family cases solved per batch")
+    parser.add_argument("--cache-size", type=int, default=100000, help="in-memory same-family cache entries")
+    args = parser.parse_args(argv)
+    server = _LocalServer((HOST, args.port), _make_handler(
+        SolverService(gamma=args.gamma, max_wait=args.max_wait, max_batch=args.max_batch,
+                      cache_size=args.cache_size)))
+    print(f"✅ Solver service listening on http://{HOST}:{args.port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+# Usage example
+if __name__ == "__main__":
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    if len(sys.argv) > 1:
+        main()
+    else:
+        solver_server = start_service(port=DEFAULT_PORT)
+        print(query_service("oblique", {"M1": 3.0, "theta": 10.0}))
+
+        # 200 concurrent single-case clients are coalesced into a few batch solves
+        rng = np.random.default_rng(0)
+        cases = [{"Mach_inlet": float(m), "Theta": float(a), "Theta_plus": float(b)}
+                 for m, a, b in zip(rng.uniform(2, 5, 200), rng.uniform(2, 15, 200), rng.uniform(2, 15, 200))]
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            replies = list(pool.map(lambda case: query_service("same_family", case), cases))
+        print(f"Theta of the first case: {replies[0]['Theta']}")
+
+        metrics = query_service("metrics")
+        print(f"Same-family batches: {metrics['same_family_batches']}, "
+              f"mean batch size: {metrics['mean_batch_size']:.1f}, "
+              f"p50 latency: {metrics['endpoints']['same_family']['latency_ms']['p50']:.2f} ms")
+        solver_server.shutdown()
@@ -0,0 +1,329 @@
+import json
+import numpy as np
+from Same_Family_Shock_Solver import (Intersection_of_Shock_Waves_Same_Family_Batch, CASE_NO_SOLUTION,
+                                      CASE_SHOCK, CASE_EXPANSION, ANGLE_FIELDS)
+
+# Region 4/5 outputs modelled by default
+SURROGATE_FIELDS = ("Mach 4", "Mach 5", "P4/P1", "P5/P1", "T4/T1", "T5/T1", "rho4/rho1", "rho5/rho1",
+                    "Pt4/Pt1", "Pt5/Pt1", "Beta3", "Beta4", "Theta", "Slip Line Angle")
+
+# Tile status codes
+TILE_FITTED = 0
+TILE_EXACT = 1
+TILE_INFEASIBLE = 2
+
+
+def _chebyshev_nodes(n):
+    """Chebyshev points of the first kind on [-1, 1]"""
+    return np.cos(np.pi * (np.arange(n) + 0.5) / n)[::-1]
+
+
+def _chebyshev_basis(x, n):
+    """T_0..T_{n-1} evaluated at x (shape: len(x) x n)"""
+    basis = np.empty((len(x), n))
+    basis[:, 0] = 1.0
+    if n > 1:
+        basis[:, 1] = x
+    for k in range(2, n):
+        basis[:, k] = 2 * x * basis[:, k - 1] - basis[:, k - 2]
+    return basis
+
+
+def _field_errors(approx, exact, field):
+    """Absolute error (degrees) for angle fields, relative error otherwise"""
+    error = np.abs(approx - exact)
+    if field not in ANGLE_FIELDS:
+        error = error / np.maximum(np.abs(exact), 1e-12)
+    return error
+
+
+class SameFamilySurrogate:
+    """
+    Piecewise tensor-product Chebyshev surrogate of the same-family intersection map.
+
+    The (Mach, Theta1, Theta2) box is split into tiles. A tile keeps its interpolant only if all its
+    nodes and validation points are solvable, lie in one regime (expansion or reflected shock, relaxed
+    at max_depth) and the validation error is below the tolerance; otherwise it is refined (octree)
+    up to max_depth.
+    Tiles that are still unresolved at max_depth are answered by the exact batch solver, tiles with
+    no solvable point return NaN. The regime of a query follows the sign of the interpolated Theta.
+    """
+
+    def __init__(self, bounds, base_tiles, max_depth, degree, fields, tile_bounds, tile_status, coefficients,
+                 lookup, errors, gamma=1.4):
+        """
+        Use SameFamilySurrogate.build or SameFamilySurrogate.load to create an instance
+        """
+        self.gamma = float(gamma)
+        self.bounds = np.asarray(bounds, dtype=float)
+        self.base_tiles = tuple(base_tiles)
+        self.max_depth = max_depth
+        self.degree = degree
+        self.fields = tuple(fields)
+        self.tile_bounds = tile_bounds
+        self.tile_status = tile_status
+        self.coefficients = coefficients
+        self.lookup = lookup
+        self.errors = errors
+        # Row of each fitted tile in the coefficient array
+        self.coefficient_row = np.cumsum(tile_status == TILE_FITTED) - 1
+
+    # === Building ===
+    @classmethod
+    def build(cls, Mach_range=(2.0, 5.0), Theta_range=(2.0, 15.0), Theta_plus_range=(2.0, 15.0), degree=4,
+              base_tiles=(4, 4, 4), max_depth=3, tolerance=1e-4, validation_points=16, fields=SURROGATE_FIELDS,
+              dtype='float32', seed=0, verbose=False, gamma=1.4):
+        """
+        Fit the surrogate for one gamma. Every refinement level is solved in one batch call; tolerance applies
+        to relative errors (absolute degrees for angle fields) at validation_points random points per tile.
+        """
+        rng = np.random.default_rng(seed)
+        bounds = np.array([Mach_range, Theta_range, Theta_plus_range], dtype=float)
+        base = np.array(base_tiles)
+        n = degree + 1
+        nodes = _chebyshev_nodes(n)
+        transform = 2.0 / n * _chebyshev_basis(nodes, n).T
+        transform[0] /= 2
+
+        # Unit node grid of one tile (n^3 x 3) in [-1, 1]
+        unit_nodes = np.stack(np.meshgrid(nodes, nodes, nodes, indexing='ij'), axis=-1).reshape(-1, 3)
+
+        size = (bounds[:, 1] - bounds[:, 0]) / base
+        tiles = [np.array([bounds[:, 0] + size * (i, j, k), bounds[:, 0] + size * (i + 1, j + 1, k + 1)]).T
+                 for i in range(base[0]) for j in range(base[1]) for k in range(base[2])]
+
+        leaves, statuses, fitted = [], [], []
+        error_samples = {field: [] for field in fields}
+        evaluations = 0
+
+        for depth in range(max_depth + 1):
+            if not tiles:
+                break
+            tile_array = np.array(tiles)                                  # (T, 3, 2)
+            lower, width = tile_array[:, :, 0], tile_array[:, :, 1] - tile_array[:, :, 0]
+            node_points = lower[:, None, :] + (unit_nodes[None, :, :] + 1) / 2 * width[:, None, :]
+            unit_check = rng.uniform(-1, 1, (len(tiles), validation_points, 3))
+            check_points = lower[:, None, :] + (unit_check + 1) / 2 * width[:, None, :]
+
+            points = np.concatenate((node_points.reshape(-1, 3), check_points.reshape(-1, 3)))
+            exact = Intersection_of_Shock_Waves_Same_Family_Batch(points[:, 0], points[:, 1], points[:, 2],
+                                                                  gamma=gamma)
+            evaluations += len(points)
+            n_nodes = node_points.shape[0] * node_points.shape[1]
+            case_nodes = exact["Case"][:n_nodes].reshape(len(tiles), -1)
+            case_check = exact["Case"][n_nodes:].reshape(len(tiles), -1)
+
+            # Chebyshev coefficients of every tile and field: (T, F, n, n, n)
+            values = np.stack([exact[field][:n_nodes].reshape(len(tiles), n, n, n) for field in fields], axis=1)
+            coefficients = np.einsum('ai,bj,ck,tfijk->tfabc', transform, transform, transform,
+                                     np.nan_to_num(values))
+            approx = cls._evaluate_tiles(coefficients, unit_check)       # (T, F, V)
+
+            refine = []
+            for t in range(len(tiles)):
+                all_cases = np.concatenate((case_nodes[t], case_check[t]))
+                if np.all(all_cases == CASE_NO_SOLUTION):
+                    leaves.append(tiles[t])
+                    statuses.append(TILE_INFEASIBLE)
+                    continue
+
+                # Tiles are split by regime while they can be refined; at max_depth a tile spanning the
+                # expansion/reflected shock switch is kept if its error allows (the state is continuous there)
+                feasible = np.all(all_cases != CASE_NO_SOLUTION)
+                ok = feasible and (depth == max_depth or np.all(all_cases == all_cases[0]))
+                tile_errors = {}
+                if ok:
+                    for f, field in enumerate(fields):
+                        exact_check = exact[field][n_nodes:].reshape(len(tiles), -1)[t]
+                        tile_errors[field] = _field_errors(approx[t, f], exact_check, field)
+                    ok = max(e.max() for e in tile_errors.values()) <= tolerance
+
+                if ok:
+                    leaves.append(tiles[t])
+                    statuses.append(TILE_FITTED)
+                    fitted.append(coefficients[t])
+                    for field, e in tile_errors.items():
+                        error_samples[field].append(e)
+                elif depth < max_depth:
+                    refine.append(tiles[t])
+                else:
+                    leaves.append(tiles[t])
+                    statuses.append(TILE_EXACT)
+
+            if verbose:
+                print(f"🔄 Depth {depth}: {len(tiles)} tiles, {len(refine)} refined, {evaluations} evaluations")
+
+            # Octree split of the rejected tiles
+            tiles = []
+            for tile in refine:
+                middle = tile.mean(axis=1)
+                for corner in np.ndindex(2, 2, 2):
+                    corner = np.array(corner)
+                    low = np.where(corner == 0, tile[:, 0], middle)
+                    high = np.where(corner == 0, middle, tile[:, 1])
+                    tiles.append(np.array([low, high]).T)
+
+        # Lookup grid at the finest tile size: cell -> leaf index
+        cells = base * 2 ** max_depth
+        cell_size = (bounds[:, 1] - bounds[:, 0]) / cells
+        lookup = np.full(tuple(cells), -1, dtype=np.int32)
+        for index, tile in enumerate(leaves):
+            start = np.rint((tile[:, 0] - bounds[:, 0]) / cell_size).astype(int)
+            stop = np.rint((tile[:, 1] - bounds[:, 0]) / cell_size).astype(int)
+            lookup[start[0]:stop[0], start[1]:stop[1], start[2]:stop[2]] = index
+
+        errors = {}
+        for field, samples in error_samples.items():
+            e = np.concatenate(samples) if samples else np.array([np.nan])
+            errors[field] = {'unit': 'deg' if field in ANGLE_FIELDS else 'rel',
+                             'max': float(np.max(e)), 'p95': float(np.percentile(e, 95))}
+        errors['build_evaluations'] = evaluations
+
+        statuses = np.array(statuses, dtype=np.int8)
+        coefficients = np.array(fitted, dtype=dtype) if fitted else np.zeros((0, len(fields), n, n, n), dtype)
+        if verbose:
+            print(f"✅ {len(leaves)} tiles: {np.sum(statuses == TILE_FITTED)} fitted, "
+                  f"{np.sum(statuses == TILE_EXACT)} exact, {np.sum(statuses == TILE_INFEASIBLE)} infeasible.")
+        return cls(bounds, base, max_depth, degree, fields, np.array(leaves), statuses, coefficients, lookup,
+                   errors, gamma)
+
+    @staticmethod
+    def _evaluate_tiles(coefficients, unit_points):
+        """Evaluate per-tile coefficients (T, F, n, n, n) at per-tile unit points (T, V, 3) -> (T, F, V)"""
+        n = coefficients.shape[-1]
+        tx = _chebyshev_basis(unit_points[..., 0].ravel(), n).reshape(*unit_points.shape[:2], n)
+        ty = _chebyshev_basis(unit_points[..., 1].ravel(), n).reshape(*unit_points.shape[:2], n)
+        tz = _chebyshev_basis(unit_points[..., 2].ravel(), n).reshape(*unit_points.shape[:2], n)
+        partial = np.einsum('tfijk,tvk->tfijv', coefficients, tz)
+        partial = np.einsum('tfijv,tvj->tfiv', partial, ty)
+        return np.einsum('tfiv,tvi->tfv', partial, tx)
+
+    # === Evaluation ===
+    def _check_gamma(self, gamma):
+        if gamma is not None and not np.allclose(gamma, self.gamma):
+            raise ValueError(f"The surrogate was built for gamma = {self.gamma}; build one per gamma.")
+
+    def evaluate(self, Mach_inlet, Theta, Theta_plus, gamma=None):
+        """
+        Vectorized lookup for arrays of (Mach_inlet, Theta, Theta_plus).
+        Returns a dict with the modelled fields, "Case" and "Exact" (True where the exact solver
+        answered). Queries outside the surrogate bounds are NaN with CASE_NO_SOLUTION.
+        gamma (None for the build gamma) must match the gamma the surrogate was built for.
+        """
+        self._check_gamma(gamma)
+        Mach_inlet, Theta, Theta_plus = np.broadcast_arrays(np.asarray(Mach_inlet, dtype=float),
+                                                            np.asarray(Theta, dtype=float),
+                                                            np.asarray(Theta_plus, dtype=float))
+        shape = Mach_inlet.shape
+        points = np.column_stack((Mach_inlet.ravel(), Theta.ravel(), Theta_plus.ravel()))
+        n_points = len(points)
+
+        results = {field: np.full(n_points, np.nan) for field in self.fields}
+        exact_flag = np.zeros(n_points, dtype=bool)
+
+        inside = np.all((points >= self.bounds[:, 0]) & (points <= self.bounds[:, 1]), axis=1)
+        cells = np.array(self.lookup.shape)
+        cell_index = ((points - self.bounds[:, 0]) / (self.bounds[:, 1] - self.bounds[:, 0]) * cells).astype(int)
+        cell_index = np.clip(cell_index, 0, cells - 1)
+        tile = np.where(inside, self.lookup[cell_index[:, 0], cell_index[:, 1], cell_index[:, 2]], -1)
+        status = np.where(tile >= 0, self.tile_status[np.maximum(tile, 0)], TILE_INFEASIBLE)
+
+        # Fitted tiles: group queries by tile
+        fitted = np.nonzero(status == TILE_FITTED)[0]
+        if fitted.size:
+            order = fitted[np.argsort(tile[fitted], kind='stable')]
+            tiles, starts = np.unique(tile[order], return_index=True)
+            n = self.degree + 1
+            flat = self.coefficients.reshape(len(self.coefficients), len(self.fields), -1)
+            for t, start, stop in zip(tiles, starts, np.append(starts[1:], len(order))):
+                idx = order[start:stop]
+                low, high = self.tile_bounds[t, :, 0], self.tile_bounds[t, :, 1]
+                unit = 2 * (points[idx] - low) / (high - low) - 1
+                # Tensor basis (V, n^3) times the flattened coefficients (n^3, F) in one matrix product
+                basis = (_chebyshev_basis(unit[:, 0], n)[:, :, None, None] *
+                         _chebyshev_basis(unit[:, 1], n)[:, None, :, None] *
+                         _chebyshev_basis(unit[:, 2], n)[:, None, None, :]).reshape(len(idx), -1)
+                values = (basis @ flat[self.coefficient_row[t]].T).T
+                for f, field in enumerate(self.fields):
+                    results[field][idx] = values[f]
+
+        case = np.full(n_points, CASE_NO_SOLUTION)
+        if "Theta" in results:
+            case = np.where(np.isfinite(results["Theta"]),
+                            np.where(results["Theta"] >= 0, CASE_EXPANSION, CASE_SHOCK), CASE_NO_SOLUTION)
+
+        # Unresolved tiles: exact batch solver
+        exact_idx = np.nonzero(status == TILE_EXACT)[0]
+        if exact_idx.size:
+            exact = Intersection_of_Shock_Waves_Same_Family_Batch(points[exact_idx, 0], points[exact_idx, 1],
+                                                                  points[exact_idx, 2], gamma=self.gamma)
+            for field in self.fields:
+                results[field][exact_idx] = exact[field]
+            case[exact_idx] = exact["Case"]
+            exact_flag[exact_idx] = True
+
+        results = {field: value.reshape(shape) for field, value in results.items()}
+        results["Case"] = case.reshape(shape)
+        results["Exact"] = exact_flag.reshape(shape)
+        return results
+
+    def validate(self, n_samples=100000, seed=1):
+        """Error statistics of the surrogate against the exact solver at random points in the bounds"""
+        rng = np.random.default_rng(seed)
+        points = rng.uniform(self.bounds[:, 0], self.bounds[:, 1], (n_samples, 3))
+        approx = self.evaluate(points[:, 0], points[:, 1], points[:, 2])
+        exact = Intersection_of_Shock_Waves_Same_Family_Batch(points[:, 0], points[:, 1], points[:, 2],
+                                                              gamma=self.gamma)
+
+        report = {'samples': n_samples,
+                  'exact_fallback_fraction': float(np.mean(approx["Exact"])),
+                  'case_mismatches': int(np.sum(approx["Case"] != exact["Case"]))}
+        both = np.isfinite(approx["Theta"]) & np.isfinite(exact["Theta"]) & ~approx["Exact"]
+        for field in self.fields:
+            e = _field_errors(approx[field][both], exact[field][both], field)
+            report[field] = {'unit': 'deg' if field in ANGLE_FIELDS else 'rel',
+                             'max': float(e.max()) if e.size else None,
+                             'p95': float(np.percentile(e, 95)) if e.size else None}
+        return report
+
+    # === Serialization ===
+    def save(self, filename="surrogate.npz"):
+        """Write the surrogate to a compressed .npz file"""
+        metadata = {'base_tiles': [int(b) for b in self.base_tiles], 'max_depth': int(self.max_depth),
+                    'degree': int(self.degree), 'gamma': self.gamma,
+                    'fields': list(self.fields), 'errors': self.errors}
+        np.savez_compressed(filename, bounds=self.bounds, tile_bounds=self.tile_bounds,
+                            tile_status=self.tile_status, coefficients=self.coefficients, lookup=self.lookup,
+                            metadata=np.array(json.dumps(metadata)))
+        print(f"✅ Surrogate saved to '{filename}'.")
+
+    @classmethod
+    def load(cls, filename="surrogate.npz"):
+        """Read a surrogate written by save"""
+        with np.load(filename) as data:
+            metadata = json.loads(str(data['metadata']))
+            return cls(data['bounds'], metadata['base_tiles'], metadata['max_depth'], metadata['degree'],
+                       metadata['fields'], data['tile_bounds'], data['tile_status'], data['coefficients'],
+                       data['lookup'], metadata['errors'], metadata.get('gamma', 1.4))
+
+
+# Usage example
+if __name__ == "__main__":
+    import time
+
+    surrogate = SameFamilySurrogate.build(verbose=True)
+    surrogate.save("surrogate.npz")
+    surrogate = SameFamilySurrogate.load("surrogate.npz")
+
+    validation = surrogate.validate(100000)
+    print(f"Exact fallback fraction: {validation['exact_fallback_fraction']:.3f}, "
+          f"case mismatches: {validation['case_mismatches']}")
+    for name in ["Mach 4", "P4/P1", "T5/T1", "Pt4/Pt1", "Pt5/Pt1", "Theta"]:
+        print(f"{name}: max error {validation[name]['max']:.2e} ({validation[name]['unit']})")
+
+    rng_query = np.random.default_rng(2)
+    query = rng_query.uniform(surrogate.bounds[:, 0], surrogate.bounds[:, 1], (1000000, 3))
+    start_time = time.perf_counter()
+    surrogate.evaluate(query[:, 0], query[:, 1], query[:, 2])
+    elapsed = time.perf_counter() - start_time
+    print(f"1,000,000 queries in {elapsed:.2f} s ({elapsed:.2f} µs per query)")
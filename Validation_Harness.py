@@ -0,0 +1,252 @@
+import json
+import os
+import subprocess
+import sys
+import time
+import numpy as np
+from Oblique_Shock_Solver import ObliqueShockAnalyzer
+from Expansion_Wave_Solver import PrandtlMeyerExpansion
+from Same_Family_Shock_Solver import (Intersection_of_Shock_Waves_Same_Family,
+                                      Intersection_of_Shock_Waves_Same_Family_Batch, ANGLE_FIELDS,
+                                      SAME_FAMILY_TUPLE_FIELDS)
+
+# Case matrix sizes
+DENSITIES = {
+    'quick': {'oblique_mach': 6, 'oblique_theta': 6, 'pm_mach': 5, 'pm_theta': 5, 'sf_mach': 2, 'sf_theta': 2},
+    'normal': {'oblique_mach': 12, 'oblique_theta': 10, 'pm_mach': 10, 'pm_theta': 8, 'sf_mach': 3, 'sf_theta': 3},
+    'dense': {'oblique_mach': 24, 'oblique_theta': 16, 'pm_mach': 20, 'pm_theta': 16, 'sf_mach': 4, 'sf_theta': 4}
+}
+
+# Modules whose cold import time is tracked, and the heavy dependencies that should only load on first use
+IMPORT_TIMED_MODULES = ("Oblique_Shock_Solver", "Expansion_Wave_Solver", "Same_Family_Shock_Solver", "Graphics",
+                        "Monte_Carlo_Analysis", "Result_Store")
+HEAVY_MODULES = ("scipy", "pandas", "matplotlib", "tkinter", "PIL")
+
+_IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def _error_statistics(fast, reference, field):
+    """Max and percentile errors over the cases solved by both paths"""
+    fast = np.asarray(fast, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    both = np.isfinite(fast) & np.isfinite(reference)
+    absolute = field in ANGLE_FIELDS
+    if not both.any():
+        return {'unit': 'deg' if absolute else 'rel', 'count': 0, 'max': None, 'p50': None, 'p95': None,
+                'p99': None}
+
+    error = np.abs(fast[both] - reference[both])
+    if not absolute:
+        error = error / np.maximum(np.abs(reference[both]), 1e-12)
+    return {
+        'unit': 'deg' if absolute else 'rel',
+        'count': int(both.sum()),
+        'max': float(error.max()),
+        'p50': float(np.percentile(error, 50)),
+        'p95': float(np.percentile(error, 95)),
+        'p99': float(np.percentile(error, 99))
+    }
+
+
+def _best_time(func, repeats=3):
+    """Shortest wall time of several runs of func (returns the time and the last result)"""
+    best, result = np.inf, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _summary(name, n_cases, reference_time, fast_time, reference_ok, fast_ok, fields):
+    return {
+        'solver': name,
+        'cases': n_cases,
+        'reference_solved': int(np.sum(reference_ok)),
+        'fast_solved': int(np.sum(fast_ok)),
+        'solved_by_one_path_only': int(np.sum(np.asarray(reference_ok) != np.asarray(fast_ok))),
+        'reference_cases_per_s': n_cases / reference_time,
+        'fast_cases_per_s': n_cases / fast_time,
+        'speedup': reference_time / fast_time,
+        'fields': fields
+    }
+
+
+def measure_import_times(modules=IMPORT_TIMED_MODULES, repeats=3):
+    """
+    Cold import time of each module, measured in fresh interpreters (best of repeats), and the heavy
+    dependencies that the import pulled in
+    """
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    for module in modules:
+        best, heavy = np.inf, ""
+        for _ in range(repeats):
+            output = subprocess.run([sys.executable, "-c", _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                                    cwd=cwd, capture_output=True, text=True, check=True).stdout.split()
+            best = min(best, float(output[0]))
+            heavy = output[1] if len(output) > 1 else ""
+        results.append({'module': module, 'import_s': best, 'heavy_modules': heavy.split(",") if heavy else []})
+    return results
+
+
+def validate_oblique_shock(n_mach=12, n_theta=10, repeats=3):
+    """ObliqueShockAnalyzer.complete_analysis (fsolve) versus complete_analysis_array"""
+    analyzer = ObliqueShockAnalyzer()
+    mach_values = np.concatenate(([1.001, 1.01, 1.05], np.linspace(1.2, 8.0, max(n_mach - 3, 1))))
+    # Theta as a fraction of max theta, clustered towards detachment
+    fractions = np.concatenate(([0.0, 0.001], 1 - np.geomspace(0.9, 1e-3, max(n_theta - 2, 1))))
+    M_grid, fraction_grid = np.meshgrid(mach_values, fractions, indexing='ij')
+    M = M_grid.ravel()
+    theta = fraction_grid.ravel() * analyzer.max_theta_array(M)[0]
+
+    fields = ['beta_angle', 'output_mach', 'pressure_ratio', 'temperature_ratio', 'density_ratio',
+              'total_pressure_ratio']
+    reference_time, reference = _best_time(lambda: [analyzer.complete_analysis(m, t) for m, t in zip(M, theta)],
+                                           repeats)
+    fast_time, fast = _best_time(lambda: analyzer.complete_analysis_array(M, theta), repeats)
+
+    reference_ok = np.array(['error' not in r for r in reference])
+    field_stats = {}
+    for field in fields:
+        ref_values = [r[field] if ok else np.nan for r, ok in zip(reference, reference_ok)]
+        field_stats[field] = _error_statistics(fast[field], ref_values, field)
+    return _summary("ObliqueShockAnalyzer", len(M), reference_time, fast_time, reference_ok,
+                    np.isfinite(fast['beta_angle']), field_stats)
+
+
+def validate_prandtl_meyer(n_mach=10, n_theta=8, repeats=3):
+    """PrandtlMeyerExpansion.calculate_all_ratios (fsolve) versus calculate_all_ratios_array"""
+    analyzer = PrandtlMeyerExpansion()
+    mach_values = np.concatenate(([1.001, 1.01, 1.05], np.linspace(1.2, 8.0, max(n_mach - 3, 1))))
+    theta_values = np.concatenate(([0.001, 0.1], np.linspace(1.0, 60.0, max(n_theta - 2, 1))))
+    M_grid, theta_grid = np.meshgrid(mach_values, theta_values, indexing='ij')
+    M = M_grid.ravel()
+    theta = theta_grid.ravel()
+
+    fields = ['M2', 'pressure_ratio', 'temperature_ratio', 'density_ratio', 'nu1', 'nu2']
+    def solve_reference():
+        reference = []
+        for m, t in zip(M, theta):
+            try:
+                reference.append(analyzer.calculate_all_ratios(m, t))
+            except ValueError:
+                reference.append(None)
+        return reference
+
+    reference_time, reference = _best_time(solve_reference, repeats)
+    fast_time, fast = _best_time(lambda: analyzer.calculate_all_ratios_array(M, theta), repeats)
+
+    reference_ok = np.array([r is not None for r in reference])
+    field_stats = {}
+    for field in fields:
+        ref_values = [r[field] if r is not None else np.nan for r in reference]
+        field_stats[field] = _error_statistics(fast[field], ref_values, field)
+    return _summary("PrandtlMeyerExpansion", len(M), reference_time, fast_time, reference_ok,
+                    np.isfinite(fast['M2']), field_stats)
+
+
+def validate_same_family(n_mach=3, n_theta=3, ITER_NUM=1000, repeats=3):
+    """Intersection_of_Shock_Waves_Same_Family (fixed-step march) versus the batch solver"""
+    analyzer = ObliqueShockAnalyzer()
+    mach_values = np.concatenate(([1.3], np.linspace(2.0, 5.0, max(n_mach, 1))))
+    cases = []
+    for m in mach_values:
+        theta_max1 = float(analyzer.max_theta_array(m)[0])
+        for theta1 in np.linspace(0.1, 0.6, max(n_theta, 1)) * theta_max1:
+            M_2 = float(analyzer.complete_analysis_array(m, theta1)['output_mach'])
+            theta_max2 = float(analyzer.max_theta_array(M_2)[0])
+            # Second ramp up to near detachment of region 3
+            for fraction in np.concatenate((np.linspace(0.1, 0.6, max(n_theta, 1)), [0.98])):
+                cases.append((m, theta1, fraction * theta_max2))
+    M, theta1, theta2 = map(np.array, zip(*cases))
+
+    def solve_reference():
+        reference = []
+        for case in cases:
+            try:
+                reference.append(Intersection_of_Shock_Waves_Same_Family(*case, ITER_NUM=ITER_NUM,
+                                                                         save_results=False, verbose=False))
+            except (ValueError, UnboundLocalError):
+                reference.append(None)
+        return reference
+
+    # Both paths are timed the same way (best of repeats)
+    reference_time, reference = _best_time(solve_reference, repeats)
+    fast_time, fast = _best_time(lambda: Intersection_of_Shock_Waves_Same_Family_Batch(M, theta1, theta2), repeats)
+
+    reference_ok = np.array([r is not None for r in reference])
+    field_stats = {}
+    for field, position in SAME_FAMILY_TUPLE_FIELDS.items():
+        ref_values = [r[position] if r is not None else np.nan for r in reference]
+        field_stats[field] = _error_statistics(fast[field], ref_values, field)
+    return _summary("Same-family intersection", len(cases), reference_time, fast_time, reference_ok,
+                    np.isfinite(fast['Theta']), field_stats)
+
+
+def run_validation(density='normal', verbose=True, repeats=3):
+    """Run all comparisons (each path timed as the best of repeats runs) and return the report dictionary"""
+    size = DENSITIES[density]
+    report = {'density': density, 'solvers': []}
+    for name, func, args in [
+        ("oblique shock", validate_oblique_shock, (size['oblique_mach'], size['oblique_theta'])),
+        ("Prandtl-Meyer expansion", validate_prandtl_meyer, (size['pm_mach'], size['pm_theta'])),
+        ("same-family intersection", validate_same_family, (size['sf_mach'], size['sf_theta']))
+    ]:
+        if verbose:
+            print(f"🔄 Validating {name}...")
+        report['solvers'].append(func(*args, repeats=repeats))
+    if verbose:
+        print("🔄 Measuring import times...")
+    report['imports'] = measure_import_times()
+    return report
+
+
+def _format(value):
+    return "-" if value is None else f"{value:.2e}"
+
+
+def report_to_markdown(report):
+    """Speed/accuracy tables of a validation report"""
+    lines = [f"# Fast solver validation ({report['density']} case matrix)", ""]
+    lines += ["| Solver | Cases | Solved (ref / fast) | Disagreeing coverage | Ref cases/s | Fast cases/s | Speedup |",
+              "|---|---|---|---|---|---|---|"]
+    for s in report['solvers']:
+        lines.append(f"| {s['solver']} | {s['cases']} | {s['reference_solved']} / {s['fast_solved']} | "
+                     f"{s['solved_by_one_path_only']} | {s['reference_cases_per_s']:.1f} | "
+                     f"{s['fast_cases_per_s']:.0f} | {s['speedup']:.0f}x |")
+    for s in report['solvers']:
+        lines += ["", f"## {s['solver']}", "",
+                  "| Field | Error | Cases | Max | p50 | p95 | p99 |",
+                  "|---|---|---|---|---|---|---|"]
+        for field, stats in s['fields'].items():
+            lines.append(f"| {field} | {stats['unit']} | {stats['count']} | {_format(stats['max'])} | "
+                         f"{_format(stats['p50'])} | {_format(stats['p95'])} | {_format(stats['p99'])} |")
+    if 'imports' in report:
+        lines += ["", "## Import times", "", "| Module | Cold import (ms) | Heavy modules loaded |", "|---|---|---|"]
+        for entry in report['imports']:
+            lines.append(f"| {entry['module']} | {entry['import_s'] * 1000:.1f} | "
+                         f"{', '.join(entry['heavy_modules']) or '-'} |")
+    return "\n".join(lines) + "\n"
+
+
+def write_report(report, json_path="validation_report.json", markdown_path="validation_report.md"):
+    """Write the report as JSON and Markdown"""
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    with open(markdown_path, "w", encoding="utf-8") as f:
+        f.write(report_to_markdown(report))
+    print(f"✅ Report saved to '{json_path}' and '{markdown_path}'.")
+
+
+# Usage example
+if __name__ == "__main__":
+    validation_report = run_validation(sys.argv[1] if len(sys.argv) > 1 else 'normal')
+    write_report(validation_report)
+    print(report_to_markdown(validation_report))